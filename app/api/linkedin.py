@@ -1,4 +1,4 @@
-from flask import request
+from flask import request, current_app as flask_app
 from celery import chain
 
 from app.tasks import scrape_and_store_user, search_and_store_results, scrape_search_result_profiles
@@ -50,7 +50,7 @@ def signup_with_linkedin():
                 scrape_and_store_user.s(user_url),
                 search_and_store_results.s(),
                 scrape_search_result_profiles.s()
-            ).apply_async(countdown=20)  # ToDo: save to a particular queue
+            ).apply_async(countdown=20, priority=flask_app.config["SIGNUP_TASK_PRIORITY"])
         else:
             """
             User is not signed up but exists in database
@@ -63,7 +63,7 @@ def signup_with_linkedin():
             task = chain(
                 search_and_store_results.s(user.public_id),
                 scrape_search_result_profiles.s()
-            ).apply_async(countdown=20)  # ToDo: save to a particular queue
+            ).apply_async(countdown=20, priority=flask_app.config["SIGNUP_TASK_PRIORITY"])
 
         return success_response(201,
                                 message='Registration Task {0} {1} for {2}'.format(task.id, task.state, user_url))
@@ -78,7 +78,8 @@ def search():
         current_user = token_auth.current_user()
 
         task = search_and_store_results.apply_async(
-            args=[current_user.public_id], countdown=20)  # ToDo: save to a particular queue
+            args=[current_user.public_id], countdown=20,
+            priority=flask_app.config["BACKGROUND_TASK_PRIORITY"])
 
         return success_response(201,
                                 message='Matching Task {0} {1} for {2}'.format(task.id, task.state, current_user.url))
@@ -93,7 +94,8 @@ def scrape_user_search_results():
         current_user = token_auth.current_user()
 
         task = scrape_search_result_profiles.apply_async(
-            args=[current_user.public_id], countdown=20)
+            args=[current_user.public_id], countdown=20,
+            priority=flask_app.config["BACKGROUND_TASK_PRIORITY"])
 
         return success_response(201,
                                 message='Retrieving Task {0} {1} for {2}'.format(task.id, task.state, current_user.url))
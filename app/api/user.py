@@ -1,6 +1,6 @@
 from cloudinary.uploader import upload
 from sqlalchemy.exc import SQLAlchemyError
-from flask import request
+from flask import request, current_app as flask_app
 from celery import chain
 
 
@@ -46,7 +46,7 @@ def user_signup():
         task = chain(
             search_and_store_results.s(user_public_id),
             scrape_search_result_profiles.s()
-        ).apply_async(countdown=5)  # ToDo: save to a particular queue
+        ).apply_async(countdown=5, priority=flask_app.config["SIGNUP_TASK_PRIORITY"])
 
         auth_token = encode_auth_token(
             current_user.public_id.hex)  # uuid to string
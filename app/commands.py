@@ -0,0 +1,177 @@
+from collections import deque
+from pathlib import Path
+import json
+import click
+from flask.cli import AppGroup
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.service.user_service import save_user, get_current_user_by_url
+from app.main import Profile, Search, Pages, SearchPage, Scraper, ProfileScraper
+from app.utils.parser_util import available_parsers, compare_parsers, DEFAULT_PARSER
+from app.utils.prune_util import prune_html, format_savings
+from app.utils.archive_util import HtmlArchive
+from app.utils.flight_util import ScrapeFlights
+from app.utils.parse_util import ParsePool
+from app.extensions import db
+
+"""
+Flask CLI commands, registered in `app.factory`
+"""
+
+FIXTURES_PATH = (Path(__file__).parent / '../fixtures').resolve()
+
+# fixture sub directory -> ResultsObject classes parsed from those pages
+FIXTURE_RESULTS_CLASSES = {
+    'profiles': [Profile],
+    'search': [Search, Pages, SearchPage],
+}
+
+parser_cli = AppGroup('parser', help='HTML parser backend tools.')
+archive_cli = AppGroup('archive', help='Raw html archive tools.')
+scrape_cli = AppGroup('scrape', help='Scraping tools.')
+
+
+@parser_cli.command('check')
+@click.option('--fixtures', default=str(FIXTURES_PATH), help='Directory of recorded pages.')
+def check_parsers(fixtures):
+    """Check every installed parser backend gives the same output on recorded pages"""
+    parsers = available_parsers()
+    click.echo('Parsers: {0}'.format(', '.join(parsers)))
+
+    failed = False
+    for folder, results_classes in FIXTURE_RESULTS_CLASSES.items():
+        for page in sorted(Path(fixtures).glob('{0}/*.html'.format(folder))):
+            body = page.read_text(encoding='utf-8')
+            # page as transferred with `PRUNE_HTML`
+            pruned = prune_html(body)
+            click.echo('{0} pruned: {1}'.format(page.name, format_savings(
+                len(body.encode('utf-8')), len(pruned.encode('utf-8')))))
+            for results_class in results_classes:
+                mismatches = compare_parsers(results_class, body, parsers)
+                expected = results_class(
+                    body, parser=DEFAULT_PARSER, restricted=False).to_dict()
+                actual = results_class(
+                    pruned, parser=DEFAULT_PARSER, restricted=False).to_dict()
+                mismatches['pruned'] = [key for key in expected
+                                        if expected[key] != actual.get(key)]
+                for name, keys in mismatches.items():
+                    status = 'MISMATCH {0}'.format(keys) if keys else 'OK'
+                    failed = failed or bool(keys)
+                    click.echo('{0} {1} [{2}]: {3}'.format(
+                        page.name, results_class.__name__, name, status))
+
+    if failed:
+        raise click.ClickException('Parser output differs on recorded pages')
+
+
+@parser_cli.command('check-script')
+@click.option('--fixtures', default=str(FIXTURES_PATH), help='Directory of recorded pages.')
+def check_profile_script(fixtures):
+    """Check the in-browser profile extraction(profile.js) matches Profile on recorded pages"""
+    driver = Scraper.create_driver()
+    failed = False
+    try:
+        for page in sorted(Path(fixtures).glob('profiles/*.html')):
+            body = page.read_text(encoding='utf-8')
+            # written into a blank page, so remote browsers don't need the file
+            driver.get('about:blank')
+            driver.execute_script(
+                'document.open(); document.write(arguments[0]); document.close();', body)
+            actual = json.loads(driver.execute_script(
+                ProfileScraper.PROFILE_SCRIPT))
+            expected = Profile(
+                body, parser='html.parser', restricted=False).to_dict()
+
+            keys = [key for key in expected if expected[key] != actual.get(key)]
+            if 'error' in actual:
+                keys.append('error: {0}'.format(actual['error']))
+            failed = failed or bool(keys)
+            status = 'MISMATCH {0}'.format(keys) if keys else 'OK'
+            click.echo('{0} [script]: {1}'.format(page.name, status))
+    finally:
+        driver.quit()
+
+    if failed:
+        raise click.ClickException('Profile script output differs on recorded pages')
+
+
+@archive_cli.command('reparse')
+@click.option('--workers', default=4, help='Parse worker processes(0 parses inline).')
+@click.option('--dry-run', is_flag=True, help='Parse without saving.')
+@click.option('--new-only', is_flag=True, help='Skip the profiles already saved.')
+def reparse_archive(workers, dry_run, new_only):
+    """
+    Re-parse the latest archived page of every profile and save the users
+    Profiles already saved are updated, unless `--new-only`
+    """
+    archive = HtmlArchive()
+    entries = list(archive.latest('profile').values())
+    click.echo('Re-parsing {0} archived profiles'.format(len(entries)))
+
+    counts = dict.fromkeys(
+        ['saved', 'updated', 'parsed', 'existing', 'invalid', 'failed'], 0)
+
+    def save(entry, parsed):
+        try:
+            scraped = parsed.get()
+        except Exception as e:
+            click.echo('{0}: {1}'.format(entry['url'], e))
+            counts['failed'] += 1
+            return
+
+        if not scraped or "url" not in scraped.get("personal_info", {}):
+            counts['invalid'] += 1
+            return
+
+        personal_info = scraped["personal_info"]
+        # read from the contact info, unless skipped(`CONTACT_INFO`)
+        if not personal_info["url"]:
+            personal_info["url"] = entry['url']
+
+        try:
+            user = get_current_user_by_url(personal_info["url"])
+            if user and new_only:
+                counts['existing'] += 1
+            elif dry_run:
+                counts['parsed'] += 1
+            else:
+                save_user(scraped, user=user)
+                counts['updated' if user else 'saved'] += 1
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            click.echo('{0}: {1}'.format(entry['url'], e))
+            counts['failed'] += 1
+
+    with ParsePool(workers) as parse_pool:
+        # bound pages held in memory while the workers are busy
+        pending = deque()
+        for entry in entries:
+            pending.append(
+                (entry, parse_pool.submit(archive.get(entry['sha256']))))
+            if len(pending) > max(workers, 1) * 4:
+                save(*pending.popleft())
+        while pending:
+            save(*pending.popleft())
+
+    click.echo(', '.join('{0} {1}'.format(count, key)
+                         for key, count in counts.items()))
+
+
+@scrape_cli.command('flights')
+@click.option('--reset', is_flag=True, help='Reset the counters.')
+def scrape_flight_stats(reset):
+    """Profile page loads saved(hits) & done(misses) by the scrape deduplication"""
+    flights = ScrapeFlights()
+    stats = flights.stats()
+    total = stats['hits'] + stats['misses']
+    click.echo('{0} hits, {1} misses({2:.1f}% page loads saved)'.format(
+        stats['hits'], stats['misses'], stats['hits'] * 100 / total if total else 0))
+    if reset:
+        flights.reset_stats()
+
+
+def register_commands(flask_app):
+    """Register Flask CLI commands."""
+    flask_app.cli.add_command(parser_cli)
+    flask_app.cli.add_command(archive_cli)
+    flask_app.cli.add_command(scrape_cli)
@@ -2,6 +2,7 @@ from flask import Flask
 
 from app.utils.celery_util import init_celery
 from app.extensions import db, migrate
+from app.commands import register_commands
 from app import models, api, celery
 from config import ProdConfig
 
@@ -15,6 +16,7 @@ def create_app(config_object=ProdConfig):
     register_extensions(flask_app)
     register_blueprints(flask_app)
     register_shellcontext(flask_app)
+    register_commands(flask_app)
 
     return flask_app
 
@@ -0,0 +1,110 @@
+from flask import current_app as flask_app
+
+from .HttpScraper import HttpScraper
+from .JsonProfile import JsonProfile
+from .ProfileScraper import ProfileScraper
+from ..utils.scrape_util import normalize_url
+
+
+class HttpProfileScraper(HttpScraper):
+    """
+    Browserless `ProfileScraper`, see `HttpScraper`
+    Profiles are read from the api calls of the profile page
+    (`ProfileScraper.PROFILE_API_ENDPOINTS`) into `JsonProfile`s, fetched in
+    `HTTP_WORKERS` threads instead of browser tabs
+    """
+    PROFILE_API_URL = ProfileScraper.PROFILE_API_URL
+    PROFILE_API_ENDPOINTS = ProfileScraper.PROFILE_API_ENDPOINTS
+    # built from the api responses, nothing left to parse
+    extraction = 'network'
+
+    def __init__(self, cookies=None):
+        super().__init__(cookies)
+        # (vanity url, api payloads) of the current profile, see `iter_loaded_profiles`
+        self.current = None
+
+    def scrape(self, url='', user=None):
+        self.load_profile_page(url, user)
+
+        return self.get_profile()
+
+    def load_profile_page(self, url='', user=None):
+        """
+        Fetch a profile
+        Params:
+            - url {str}: profile url(`.com/in/NAME`), vanity url(`/in/NAME`)
+            or vanity name(`NAME`)
+        """
+        if user:
+            url = user
+        if not url:
+            print("Url must look like... .com/in/NAME")
+            self.current = (url, None)
+            return
+        self.current = (url, self.fetch_profile(url))
+
+    def iter_loaded_profiles(self, users, tabs=None):
+        """
+        Fetch the profiles of `users`(vanity urls) in `HTTP_WORKERS` threads
+        Yields each user once fetched, in completion order, as the current
+        profile(see `get_profile`)
+        """
+        for user, payloads in self.iter_fetched(users, self.fetch_profile):
+            if not payloads:
+                print('Profile Unavailable: {0}'.format(user))
+                continue
+            self.current = (user, payloads)
+            yield user
+
+    @property
+    def with_contact_info(self):
+        """False if the contact info is skipped or deferred(`CONTACT_INFO`)"""
+        return flask_app.config["CONTACT_INFO"] == 'always'
+
+    @staticmethod
+    def profile_id(user):
+        """Vanity name of a profile url, vanity url or vanity name"""
+        if '/in/' in user:
+            return normalize_url(user)[len('/in/'):]
+
+        return user.strip('/')
+
+    def fetch_api(self, user, name):
+        """Payload of the profile api endpoint `name` for `user`"""
+        return self.fetch(self.PROFILE_API_URL.format(
+            self.profile_id(user), self.PROFILE_API_ENDPOINTS[name]))
+
+    def fetch_profile(self, user):
+        """
+        Api payloads of `user`'s profile(contact info, see `CONTACT_INFO`)
+        Returns dict of endpoint name -> payload, None if unavailable
+        """
+        payloads = {}
+        for name in self.PROFILE_API_ENDPOINTS:
+            if name == 'contact_info' and not self.with_contact_info:
+                continue
+            payload = self.fetch_api(user, name)
+            if payload is None and name == 'profile_view':
+                return None
+            if payload is not None:
+                payloads[name] = payload
+
+        return payloads
+
+    def scrape_contact_info(self, user):
+        """
+        Fetch only the contact info of `user`(vanity url)
+        Returns personal info dict(email, phone, websites...), None on failure
+        """
+        payload = self.fetch_api(user, 'contact_info')
+        if payload is None:
+            return None
+
+        return JsonProfile({'contact_info': payload}).personal_info
+
+    def get_profile(self):
+        """Returns JsonProfile of the current profile, None on failure"""
+        if not self.current or not self.current[1]:
+            return None
+
+        return JsonProfile(self.current[1])
@@ -0,0 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from flask import current_app as flask_app
+from requests.adapters import HTTPAdapter
+import requests
+
+from ..utils.session_util import load_session
+
+
+class HttpScraper(object):
+    """
+    Browserless scraper: calls the voyager api the linkedin pages load their
+    data from, with a pooled keep-alive http session authenticated by the
+    saved session cookies(`SESSION_STORE`, saved by the browser scrapers on
+    login), see `HttpProfileScraper` / `HttpSearchScraper`
+    Same api & results as the selenium scrapers, built from the json
+    responses(`JsonProfile` / `JsonSearchPage`) instead of the rendered pages
+    """
+    USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/84.0.4147.105 Safari/537.36')
+
+    def __init__(self, cookies=None):
+        self.timeout = 30  # adjust accordingly
+        # `LINKEDIN_URL` points to the fake server when testing offline
+        self.base_url = flask_app.config["LINKEDIN_URL"].rstrip('/')
+        self.workers = flask_app.config["HTTP_WORKERS"]
+
+        self.session = requests.Session()
+        # keep-alive connections shared by the fetching threads
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': self.USER_AGENT,
+            # same format as the api calls of the pages, see `JsonProfile`
+            'Accept': 'application/vnd.linkedin.normalized+json+2.1',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'x-restli-protocol-version': '2.0.0',
+        })
+
+        if cookies is None:
+            cookies = load_session(flask_app.config["LINKEDIN_EMAIL"])
+        if not cookies:
+            print('No saved linkedin session, run a browser scraper once to log in')
+        for cookie in cookies or []:
+            # no domain, so they're sent to `LINKEDIN_URL` whatever it is
+            self.session.cookies.set(
+                cookie['name'], cookie['value'], path=cookie.get('path', '/'))
+            if cookie['name'] == 'JSESSIONID':
+                self.session.headers['csrf-token'] = cookie['value'].strip('"')
+
+        # futures of the pages being fetched, see `iter_fetched`
+        self.loading_tabs = {}
+
+    def fetch(self, path, params=None):
+        """
+        Returns the decoded json of the api call `path`, None on failure or
+        if the session is rejected
+        """
+        try:
+            response = self.session.get(
+                self.base_url + path, params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(e)
+            return None
+
+        if response.status_code in (401, 403) or '/login' in response.url or \
+                '/authwall' in response.url:
+            print('Linkedin session rejected, log in with a browser scraper')
+            return None
+        if response.status_code != 200:
+            print('Could not fetch {0}({1})'.format(path, response.status_code))
+            return None
+
+        try:
+            return response.json()
+        except ValueError as e:
+            print(e)
+            return None
+
+    def iter_fetched(self, items, fetch, workers=None):
+        """
+        Run `fetch(item)` for `items` in up to `workers` threads at once
+        Yields (item, result) in completion order
+        """
+        items = iter(items)
+        with ThreadPoolExecutor(max_workers=workers or self.workers) as executor:
+            def submit_next():
+                item = next(items, None)
+                if item is not None:
+                    self.loading_tabs[executor.submit(fetch, item)] = item
+
+            try:
+                for _ in range(workers or self.workers):
+                    submit_next()
+
+                while self.loading_tabs:
+                    done, _ = wait(self.loading_tabs, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item = self.loading_tabs.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            print(e)
+                            result = None
+                        yield item, result
+                        submit_next()
+            finally:
+                # stopped early, drop what's not started
+                for future in self.loading_tabs:
+                    future.cancel()
+                self.loading_tabs = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.quit()
+
+    def quit(self):
+        self.session.close()
@@ -0,0 +1,86 @@
+from itertools import takewhile
+
+from .HttpScraper import HttpScraper
+from .JsonSearchPage import JsonSearchPage
+from .SearchScraper import SearchScraper
+
+
+class HttpSearchScraper(HttpScraper):
+    """
+    Browserless `SearchScraper`, see `HttpScraper`
+    Result pages are read from the search api(`SEARCH_API_URL`) the search
+    page loads them from, fetched in `HTTP_WORKERS` threads
+    """
+    PAGES_LIMIT_PERCENT = SearchScraper.PAGES_LIMIT_PERCENT
+    MAX_PROFILES_COUNT = SearchScraper.MAX_PROFILES_COUNT
+    SEARCH_API_URL = '/voyager/api/search/blended'
+    RESULTS_PER_PAGE = 10
+
+    def search(self, skills=[]):
+        max_accessible_pages = 1
+        keywords = " ".join(skills)
+
+        # stats & first page results come from the same call
+        snapshot = self.get_snapshot(keywords, 1)
+        stats = snapshot.pages if snapshot else {}
+        if "max_accessible_pages" in stats:
+            max_accessible_pages = stats["max_accessible_pages"]
+        user_urls = self.get_urls(keywords, max_accessible_pages, snapshot)
+
+        return {
+            'urls': {
+                'vanity_urls': user_urls,
+                'total': len(user_urls)
+            },
+            'stats': stats
+        }
+
+    def get_urls(self, keywords, total_pages, first_page=None):
+        """
+        Same pages as `SearchScraper.get_urls`, urls are deduplicated as
+        the pages come in
+        Past the search limit the api returns no results: the pages after
+        the first empty one are not fetched, the earlier ones being fetched
+        are kept
+        """
+        pagination_limit = round(
+            (total_pages * self.PAGES_LIMIT_PERCENT / 100) - 1)
+
+        urls = dict.fromkeys(first_page.vanity_urls if first_page else [])
+        limit_page = None
+        pages = takewhile(lambda page: limit_page is None or page < limit_page,
+                          range(2, pagination_limit + 2))
+
+        for page, search_page in self.iter_fetched(
+                pages, lambda page: self.get_snapshot(keywords, page)):
+            if not search_page or (limit_page and page > limit_page):
+                continue
+            if not search_page.vanity_urls:
+                limit_page = page
+                continue
+
+            urls.update(dict.fromkeys(search_page.vanity_urls))
+
+            # break on reaching max profile count
+            if len(urls) >= self.MAX_PROFILES_COUNT:
+                break
+
+        if limit_page:
+            print('Search limit on LinkedIn reached at page {0}'.format(limit_page))
+
+        return list(urls)
+
+    def get_snapshot(self, keywords, page):
+        """Returns JsonSearchPage of results page `page`(1 based), None on failure"""
+        payload = self.fetch(self.SEARCH_API_URL, params={
+            'keywords': keywords,
+            'origin': 'GLOBAL_SEARCH_HEADER',
+            'q': 'all',
+            'filters': 'List(resultType->PEOPLE)',
+            'start': (page - 1) * self.RESULTS_PER_PAGE,
+            'count': self.RESULTS_PER_PAGE,
+        })
+        if payload is None:
+            return None
+
+        return JsonSearchPage(payload)
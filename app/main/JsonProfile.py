@@ -0,0 +1,261 @@
+from datetime import datetime
+from functools import cached_property
+
+from .Profile import Profile
+from ..utils.scrape_util import normalize_string
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def format_date(date):
+    """`{month: 1, year: 2019}` -> 'Jan 2019', as displayed on profiles"""
+    if not date:
+        return None
+    if date.get('month'):
+        return '{0} {1}'.format(MONTHS[date['month'] - 1], date['year'])
+    return str(date.get('year'))
+
+
+def format_time_period(period, present='Present'):
+    """`timePeriod` -> 'Jan 2019 – Present'"""
+    if not period or not period.get('startDate'):
+        return None
+    start = format_date(period['startDate'])
+    end = format_date(period.get('endDate')) or present
+    if not end:
+        return start
+    return '{0} – {1}'.format(start, end)
+
+
+def start_date_key(entity):
+    """Sort key, current entries first then most recent start"""
+    period = entity.get('timePeriod') or {}
+    start = period.get('startDate') or {}
+    return (not period.get('endDate'), start.get('year') or 0, start.get('month') or 0)
+
+
+def index_entities(payloads):
+    """
+    Typed entities(`$type`) of voyager api payloads, normalized(`included`)
+    or nested, as a dict of type name(last part of `$type`) -> entities in
+    payload order
+    """
+    entities = {}
+    seen = set()
+    stack = [payloads]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if '$type' in value:
+                key = value.get('entityUrn') or id(value)
+                if key not in seen:
+                    seen.add(key)
+                    entities.setdefault(value['$type'].rsplit(
+                        '.', 1)[-1], []).append(value)
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+    return entities
+
+
+class JsonProfile(object):
+    """
+    Profile built from the voyager api payloads the profile page fetches
+    (see `ProfileScraper.get_network_profile`, `HttpProfileScraper`) instead
+    of its DOM
+    Same attributes & `to_dict()` as `Profile`
+
+    Payloads are read as a flat list of typed entities(`$type`), so both the
+    normalized(`included`) and nested response formats work
+    Interests are not part of these payloads and are left empty
+    """
+    attributes = Profile.attributes
+
+    def __init__(self, payloads):
+        # payload name(`ProfileScraper.PROFILE_API_ENDPOINTS`) -> decoded json
+        self.payloads = payloads
+
+    @cached_property
+    def entities(self):
+        """
+        Returns:
+            dict of type name(last part of `$type`) -> entities, in payload order
+        """
+        return index_entities(self.payloads)
+
+    @cached_property
+    def by_urn(self):
+        return {entity['entityUrn']: entity
+                for group in self.entities.values()
+                for entity in group if 'entityUrn' in entity}
+
+    def of_type(self, name, sort=False):
+        entities = self.entities.get(name, [])
+        if sort:
+            entities = sorted(entities, key=start_date_key, reverse=True)
+        return entities
+
+    def resolve(self, entity, field):
+        """Nested value of `field`, or the entity its `*field` reference points to"""
+        if entity.get(field) is not None:
+            return entity[field]
+        return self.by_urn.get(entity.get('*' + field))
+
+    @cached_property
+    def personal_info(self):
+        profile = next(iter(self.of_type('Profile')), {})
+        contact_info = next(iter(self.of_type('ContactInfo')), {})
+        network_info = next(iter(self.of_type('NetworkInfo')), {})
+        jobs = self.experiences['jobs']
+        education = self.experiences['education']
+
+        name = ' '.join(filter(None, [profile.get('firstName'),
+                                      profile.get('lastName')]))
+        public_identifier = profile.get('publicIdentifier') or \
+            (self.resolve(profile, 'miniProfile') or {}).get('publicIdentifier')
+
+        phones = contact_info.get('phoneNumbers') or []
+        connected_at = contact_info.get('connectedAt')
+
+        personal_info = {
+            'name': name or None,
+            'headline': profile.get('headline'),
+            'company': jobs[0]['company'] if jobs else None,
+            'school': education[0]['name'] if education else None,
+            'location': profile.get('geoLocationName') or profile.get('locationName'),
+            'summary': profile.get('summary') or '',
+            'image': self.image_url(profile),
+            # profiles display 500+ past 500
+            'connections': min(network_info.get('connectionsCount') or 0, 500),
+            'email': contact_info.get('emailAddress'),
+            'phone': phones[0].get('number') if phones else None,
+            'connected': None,
+            'url': '/in/' + public_identifier if public_identifier else None,
+            'websites': [website['url'] for website in contact_info.get('websites') or []
+                         if website.get('url')],
+            'current_company_link': '',
+        }
+        if connected_at:
+            date = datetime.utcfromtimestamp(connected_at / 1000)
+            personal_info['connected'] = '{0:%B} {1}, {2}'.format(
+                date, date.day, date.year)
+        if jobs and jobs[0]['date_range'] and 'present' in jobs[0]['date_range'].lower():
+            personal_info['current_company_link'] = jobs[0]['li_company_url']
+
+        return personal_info
+
+    def image_url(self, profile):
+        """Largest artifact of the profile picture"""
+        mini_profile = self.resolve(profile, 'miniProfile') or {}
+        picture = mini_profile.get('picture') or profile.get('picture') or {}
+        image = picture.get('com.linkedin.common.VectorImage') or picture
+        artifacts = image.get('artifacts') or []
+        if not image.get('rootUrl') or not artifacts:
+            return ''
+        largest = max(artifacts, key=lambda artifact: artifact.get('width') or 0)
+        return image['rootUrl'] + largest.get('fileIdentifyingUrlPathSegment', '')
+
+    @cached_property
+    def experiences(self):
+        jobs = []
+        for position in self.of_type('Position', sort=True):
+            company_id = (position.get('companyUrn') or '').rsplit(':', 1)[-1]
+            jobs.append({
+                'title': position.get('title'),
+                'company': position.get('companyName'),
+                'date_range': format_time_period(position.get('timePeriod')),
+                'location': position.get('locationName'),
+                'description': position.get('description'),
+                'li_company_url': 'https://www.linkedin.com/company/{0}/'.format(
+                    company_id) if company_id else '',
+            })
+
+        education = [{
+            'name': school.get('schoolName'),
+            'degree': school.get('degreeName'),
+            'grades': school.get('grade'),
+            'field_of_study': school.get('fieldOfStudy'),
+            # schools only display years
+            'date_range': format_time_period({
+                key: {'year': date.get('year')}
+                for key, date in (school.get('timePeriod') or {}).items()
+            }, present=None),
+            'activities': school.get('activities'),
+        } for school in self.of_type('Education', sort=True)]
+
+        volunteering = [{
+            'title': volunteer.get('role'),
+            'company': volunteer.get('companyName'),
+            'date_range': format_time_period(volunteer.get('timePeriod')),
+            'location': volunteer.get('locationName'),
+            'cause': (volunteer.get('cause') or '').replace('_', ' ').title() or None,
+            'description': volunteer.get('description'),
+        } for volunteer in self.of_type('VolunteerExperience', sort=True)]
+
+        certifications = []
+        # most recently issued first, the end date is an expiry(not a current one)
+        for certification in sorted(self.of_type('Certification'), reverse=True,
+                                    key=lambda entity: start_date_key(entity)[1:]):
+            period = certification.get('timePeriod') or {}
+            date_range = None
+            if period.get('startDate'):
+                date_range = 'Issued {0} - {1}'.format(
+                    format_date(period['startDate']),
+                    'Expires ' + format_date(period['endDate'])
+                    if period.get('endDate') else 'No Expiration Date')
+            certifications.append({
+                'authority': certification.get('authority') or 'Unknown',
+                'title': certification.get('name'),
+                'date_range': date_range,
+            })
+
+        return {
+            'jobs': jobs,
+            'education': education,
+            'volunteering': volunteering,
+            'certifications': certifications,
+        }
+
+    @cached_property
+    def skills(self):
+        """Same as `Profile.skills`, in decreasing order of endorsements"""
+        endorsements = {}
+        for endorsed in self.of_type('EndorsedSkill'):
+            skill = self.resolve(endorsed, 'skill') or {}
+            endorsements[skill.get('name')] = endorsed.get('endorsementCount') or 0
+
+        skills = [{'name': normalize_string(skill['name']),
+                   'endorsements': endorsements.get(skill['name'], 0)}
+                  for skill in self.of_type('Skill') if skill.get('name')]
+
+        # the top ones are searched for, see `get_top_skills_keyword_text`
+        return sorted(skills, key=lambda x: x['endorsements'], reverse=True)
+
+    @cached_property
+    def accomplishments(self):
+        # accomplishment -> (entity type, field displayed)
+        types = {
+            'publications': ('Publication', 'name'),
+            'patents': ('Patent', 'title'),
+            'courses': ('Course', 'name'),
+            'projects': ('Project', 'title'),
+            'honors': ('Honor', 'title'),
+            'languages': ('Language', 'name'),
+            'organizations': ('Organization', 'name'),
+        }
+        accomplishments = {key: [entity.get(field) for entity in self.of_type(name)]
+                           for key, (name, field) in types.items()}
+        accomplishments['text_scores'] = [
+            {'name': score.get('name'), 'score': score.get('score')}
+            for score in self.of_type('TestScore')]
+
+        return accomplishments
+
+    @cached_property
+    def interests(self):
+        return []
+
+    def to_dict(self):
+        return {attr: getattr(self, attr) for attr in self.attributes}
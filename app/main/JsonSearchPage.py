@@ -0,0 +1,40 @@
+from functools import cached_property
+
+from .JsonProfile import index_entities
+from .SearchPage import SearchPage
+
+
+class JsonSearchPage(object):
+    """
+    Search results page built from the voyager search api response
+    (see `HttpSearchScraper`) instead of its DOM
+    Same attributes as `SearchPage`, results are the people(`MiniProfile`)
+    of the response
+    """
+    attributes = SearchPage.attributes
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    @cached_property
+    def pages(self):
+        data = self.payload.get('data') or self.payload
+        total_results = (data.get('paging') or {}).get('total') or 0
+        total_pages = round(total_results / 10)
+
+        return {
+            'total_pages': total_pages,
+            'total_results': total_results,
+            'max_accessible_pages': min(100, total_pages),
+        }
+
+    @cached_property
+    def vanity_urls(self):
+        """Same format as `Search.vanity_urls`(`/in/NAME/`)"""
+        names = [profile.get('publicIdentifier')
+                 for profile in index_entities(self.payload).get('MiniProfile', [])]
+
+        return ['/in/{0}/'.format(name) for name in dict.fromkeys(names) if name]
+
+    def to_dict(self):
+        return {attr: getattr(self, attr) for attr in self.attributes}
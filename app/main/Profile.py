@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from .ResultsObject import ResultsObject
 
 from ..utils.scrape_util import *
@@ -6,12 +8,49 @@ from ..utils.scrape_util import *
 class Profile(ResultsObject):
     attributes = ['personal_info', 'experiences',
                   'skills', 'accomplishments', 'interests']
-
-    @property
+    # section name -> css class of the section container
+    SECTION_CLASSES = {
+        'top_card': 'pv-top-card',
+        'contact_info': 'pv-contact-info',
+        'about': 'pv-about-section',
+        'background': 'background-section',
+        'accomplishments': 'pv-accomplishments-section',
+        'interests': 'pv-interests-section',
+    }
+    SKILL_CLASS = 'pv-skill-category-entity__skill-wrapper'
+    # feeds, ads, "people also viewed"... are never built when restricted
+    parse_only_classes = list(SECTION_CLASSES.values()) + \
+        ['pv-skill-categories-section', SKILL_CLASS]
+
+    @cached_property
+    def sections(self):
+        """
+        Find every section container in a single pass over the tree
+        Returns:
+            dict of section name -> first matching container(None if missing)
+            and `skills` -> list of skill elements
+        """
+        sections = dict.fromkeys(self.SECTION_CLASSES)
+        sections['skills'] = []
+
+        class_names = list(self.SECTION_CLASSES.values()) + [self.SKILL_CLASS]
+        selector = ', '.join(map(lambda x: '.' + x, class_names))
+        # soupsieve walks the tree once for a selector list
+        for element in all_or_default(self.soup, selector):
+            classes = element.get('class') or []
+            if self.SKILL_CLASS in classes:
+                sections['skills'].append(element)
+            for name, class_name in self.SECTION_CLASSES.items():
+                if class_name in classes and sections[name] is None:
+                    sections[name] = element
+
+        return sections
+
+    @cached_property
     def personal_info(self):
         """Return dict of personal info about the user"""
-        top_card = first_or_default(self.soup, '.pv-top-card')
-        contact_info = first_or_default(self.soup, '.pv-contact-info')
+        top_card = self.sections['top_card']
+        contact_info = self.sections['contact_info']
 
         # Note that some of these selectors may have multiple selections, but
         # get_info takes the first match
@@ -24,7 +63,7 @@ class Profile(ResultsObject):
         })
 
         personal_info['summary'] = text_or_default(
-            self.soup, '.pv-about-section .pv-about__summary-text', '').replace('... see more', '').strip()
+            self.sections['about'], '.pv-about__summary-text', '').replace('... see more', '').strip()
 
         image_url = ''
         # self profile image
@@ -44,10 +83,10 @@ class Profile(ResultsObject):
         personal_info['image'] = image_url
 
         connections_text = text_or_default(
-            self.soup, 'a[data-control-name="topcard_view_all_connections"] span', '')
+            top_card, 'a[data-control-name="topcard_view_all_connections"] span', '')
         if connections_text == '':
             connections_text = text_or_default(
-                self.soup, '.pv-top-card--list-bullet:nth-child(3) > li:nth-child(2) > span:nth-child(1)', '0')  # default value as string
+                top_card, '.pv-top-card--list-bullet:nth-child(3) > li:nth-child(2) > span:nth-child(1)', '0')  # default value as string
         personal_info['connections'] = int(connections_text.replace(
             'connections', '').replace('+', '').strip())
 
@@ -71,7 +110,7 @@ class Profile(ResultsObject):
 
         return personal_info
 
-    @property
+    @cached_property
     def experiences(self):
         """
         Returns:
@@ -82,7 +121,7 @@ class Profile(ResultsObject):
                 - Certifications
         """
         experiences = {}
-        container = first_or_default(self.soup, '.background-section')
+        container = self.sections['background']
 
         jobs = all_or_default(
             container, '#experience-section ul .pv-position-entity')
@@ -129,15 +168,14 @@ class Profile(ResultsObject):
 
         return experiences
 
-    @property
+    @cached_property
     def skills(self):
         """
         Returns:
             list of skills {name: str, endorsements: int} in decreasing order of
             endorsement quantity.
         """
-        skills_element = self.soup.select(
-            '.pv-skill-category-entity__skill-wrapper')
+        skills_element = self.sections['skills']
 
         # this converts `endorsements` to integer value
         def parse_skills(skill):
@@ -150,7 +188,7 @@ class Profile(ResultsObject):
         # Sort skills based on endorsements
         return sorted(skills, key=lambda x: x['endorsements'], reverse=True)
 
-    @property
+    @cached_property
     def accomplishments(self):
         """
         Returns:
@@ -170,15 +208,24 @@ class Profile(ResultsObject):
             'courses', 'projects', 'honors',
             'languages', 'organizations'
         ])
-        container = first_or_default(self.soup, '.pv-accomplishments-section')
-
+        container = self.sections['accomplishments']
         for key in accomplishments:
-            accs = all_or_default(container, 'section.' + key + ' ul > li')
-            accs = map(lambda acc: acc.get_text() if acc else None, accs)
-            accomplishments[key] = list(accs)
-
-        test_scores_element = all_or_default(
-            container, 'section.test-scores ul > li')
+            accomplishments[key] = []
+        test_scores_element = []
+
+        # select all accomplishment blocks at once & group them by class
+        blocks = all_or_default(container, ', '.join(
+            map(lambda x: 'section.' + x, list(accomplishments) + ['test-scores'])))
+        for block in blocks:
+            classes = block.get('class') or []
+            items = all_or_default(block, 'ul > li')
+            if 'test-scores' in classes:
+                test_scores_element.extend(items)
+            for key in accomplishments:
+                if key in classes:
+                    accs = map(lambda acc: acc.get_text()
+                               if acc else None, items)
+                    accomplishments[key].extend(accs)
 
         def parse_test_scores(test_score):
             x = get_test_score_info(test_score)
@@ -190,13 +237,13 @@ class Profile(ResultsObject):
 
         return accomplishments
 
-    @property
+    @cached_property
     def interests(self):
         """
         Returns:
             list of person's interests
         """
-        container = first_or_default(self.soup, '.pv-interests-section')
+        container = self.sections['interests']
         interests = all_or_default(container, 'ul > li')
         interests = map(lambda i: text_or_default(
             i, '.pv-entity__summary-title'), interests)
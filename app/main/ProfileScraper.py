@@ -1,3 +1,9 @@
+from pathlib import Path
+import json
+import time
+import re
+
+from flask import current_app as flask_app
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
@@ -5,6 +11,8 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from .Scraper import Scraper
 from .Profile import Profile
+from .ScriptProfile import ScriptProfile
+from .JsonProfile import JsonProfile
 
 from ..utils.scrape_util import AnyEC
 
@@ -17,12 +25,102 @@ class ProfileScraper(Scraper):
     MAIN_SELECTOR = '.core-rail'
     PROFILE_SELECTOR = 'profile-content'
     ERROR_SELECTOR = '.profile-unavailable'
+    CONTACT_INFO_SELECTOR = '.pv-contact-info'
+    # the overlay has its own route, see `scrape_contact_info`
+    CONTACT_INFO_PATH = '{0}/detail/contact-info/'
+    # lazy loaded sections, in page order
+    SCROLL_ANCHORS = ['.pv-about-section', '.background-section',
+                      '.pv-skill-categories-section',
+                      '.pv-accomplishments-section', '.pv-interests-section']
+    # browser side port of `Profile.to_dict()`, see `get_profile_data`
+    PROFILE_SCRIPT = (Path(__file__).parent / 'scripts' /
+                      'profile.js').read_text(encoding='utf-8')
+    # voyager api calls of the profile page, see `get_network_profile`
+    PROFILE_API_URL = '/voyager/api/identity/profiles/{0}{1}'
+    PROFILE_API_PATTERN = re.compile(
+        r'/voyager/api/identity/profiles/([^/?]+)(/[A-Za-z]+)')
+    PROFILE_API_ENDPOINTS = {
+        'profile_view': '/profileView',
+        'contact_info': '/profileContactInfo',
+        'network_info': '/networkinfo',
+        'skills': '/featuredSkills',
+    }
+    # fetches the api calls the page did not make(yet), name -> body or null
+    PROFILE_API_SCRIPT = """
+        var urls = arguments[0], done = arguments[arguments.length - 1];
+        var csrf = (document.cookie.match(/JSESSIONID="?([^";]+)/) || [])[1];
+        Promise.all(Object.keys(urls).map(function (name) {
+            return fetch(urls[name], {
+                credentials: 'include',
+                headers: {
+                    'csrf-token': csrf,
+                    'accept': 'application/vnd.linkedin.normalized+json+2.1'
+                }
+            }).then(function (response) {
+                return response.ok ? response.text() : null;
+            }).catch(function () {
+                return null;
+            }).then(function (body) {
+                return [name, body];
+            });
+        })).then(function (entries) {
+            var bodies = {};
+            entries.forEach(function (entry) {
+                bodies[entry[0]] = entry[1];
+            });
+            done(bodies);
+        });
+    """
+
+    def __init__(self):
+        # (tab, profile id) -> endpoint name -> request id, see `read_network_log`
+        self.api_requests = {}
+        super().__init__()
 
     def scrape(self, url='', user=None):
         self.load_profile_page(url, user)
 
         return self.get_profile()
 
+    def scrape_html(self, url='', user=None):
+        """Same as scrape, except it returns the raw html without parsing it"""
+        self.load_profile_page(url, user)
+
+        return self.get_profile_html()
+
+    def iter_loaded_profiles(self, users, tabs=None):
+        """
+        Load the profiles of `users`(vanity urls) in up to `tabs` browser tabs
+        at once(`PROFILE_TABS`), see `iter_loaded_pages`
+        Yields each user once its profile is loaded & scrolled, with its tab as
+        the current window(see `get_profile_html` / `get_profile`)
+        Expired drivers are recycled between profiles and dead ones replaced,
+        see `Scraper.recycle_driver`
+        """
+        tabs = tabs or flask_app.config["PROFILE_TABS"]
+        if tabs <= 1:
+            for user in users:
+                if self.driver_expired():
+                    self.recycle_driver('expired')
+                try:
+                    self.load_profile_page(user=user)
+                except Exception as e:
+                    print(e)
+                    if not self.replace_dead_driver():
+                        continue
+                    # once more, in the new browser
+                    try:
+                        self.load_profile_page(user=user)
+                    except Exception as e:
+                        print(e)
+                        continue
+                yield user
+            return
+
+        urls = (self.base_url + user for user in users)
+        for url in self.iter_loaded_pages(urls, tabs, scroll=self.extraction != 'network'):
+            yield url[len(self.base_url):]
+
     def load_profile_page(self, url='', user=None):
         """Load profile page and all async content
         Params:
@@ -30,6 +128,7 @@ class ProfileScraper(Scraper):
         Raises:
             ValueError: If link doesn't match a typical profile url
         """
+        start = time.monotonic()
         if not user and url == '':
             me_button = self.driver.find_element_by_css_selector(
                 'img.nav-item__profile-member-photo')
@@ -54,12 +153,13 @@ class ProfileScraper(Scraper):
                         """)
                 # Scroll to the bottom of the page incrementally to load any lazy-loaded content
                 self.scroll_to_bottom()
+                self.record_page_load(start)
             except TimeoutException as e:
                 print("""View Profile Button Not Found""")
             return
         if user:
-            url = 'https://www.linkedin.com' + user
-        if 'com/in/' not in url:
+            url = self.base_url + user
+        if '/in/' not in url:
             print(
                 "Url must look like... .com/in/NAME")
         self.driver.get(url)
@@ -89,31 +189,184 @@ class ProfileScraper(Scraper):
             print(
                 'Profile Unavailable: Profile link does not match any current Linkedin Profiles')
         # Scroll to the bottom of the page incrementally to load any lazy-loaded content
-        self.scroll_to_bottom()
+        # (the api responses are there without scrolling)
+        if self.extraction != 'network':
+            self.scroll_to_bottom()
+        self.record_page_load(start)
+
+    @property
+    def extraction(self):
+        """`PROFILE_EXTRACTION` mode, html / script / network"""
+        return flask_app.config["PROFILE_EXTRACTION"]
+
+    @property
+    def with_contact_info(self):
+        """False if the contact info is skipped or deferred(`CONTACT_INFO`)"""
+        return flask_app.config["CONTACT_INFO"] == 'always'
 
     def get_profile(self):
+        if self.extraction == 'network':
+            profile = self.get_network_profile()
+            if profile:
+                return profile
+            # fall back to the html, lazy sections were not scrolled into view
+            self.scroll_to_bottom()
+
+        if self.extraction == 'script':
+            profile = self.get_profile_data()
+            if profile:
+                return profile
+            # fall back to transferring & parsing the html
+
+        profile = self.get_profile_html()
+        if not profile:
+            return None
+
+        return Profile(profile)
+
+    def get_profile_html(self):
+        """Returns outerHTML of the profile & contact info, None on failure"""
         try:
-            profile = self.driver.find_element_by_css_selector(
-                self.MAIN_SELECTOR).get_attribute("outerHTML")
-            contact_info = self.get_contact_info()
+            profile = self.get_outer_html(self.MAIN_SELECTOR)
+            contact_info = self.get_contact_info() if self.with_contact_info else ''
+            self.archive_page('profile', profile + contact_info)
 
-            return Profile(profile + contact_info)
+            return profile + contact_info
         except Exception as e:
             print(e)
             # print("Could not find profile wrapper html. This sometimes happens for exceptionally long profiles.  Try decreasing scroll-increment.")
         return None
 
+    def get_profile_data(self):
+        """
+        Extract the profile in the browser with `PROFILE_SCRIPT`,
+        only the resulting json is transferred(the page is not archived)
+        Returns `ScriptProfile`, None on failure
+        """
+        if self.with_contact_info:
+            try:
+                self.open_contact_info()
+            except Exception as e:
+                print(e)
+
+        try:
+            data = json.loads(self.driver.execute_script(self.PROFILE_SCRIPT))
+        except Exception as e:
+            print(e)
+            return None
+
+        if 'error' in data:
+            print('Profile script failed: {0}'.format(data['error']))
+            return None
+
+        return ScriptProfile(data)
+
+    def get_network_profile(self):
+        """
+        Build the profile from the voyager api responses the page received,
+        read from the performance log(`PROFILE_EXTRACTION=network`)
+        Endpoints the page did not call are fetched in the page
+        Returns `JsonProfile`, None on failure
+        """
+        match = re.search(r'/in/([^/?#]+)', self.driver.current_url)
+        if not match:
+            return None
+        key = (self.driver.current_window_handle.replace('CDwindow-', ''),
+               match.group(1))
+
+        try:
+            self.read_network_log()
+        except Exception as e:
+            print(e)
+        requests = self.api_requests.pop(key, {})
+        # forget the tabs closed since
+        handles = {handle.replace('CDwindow-', '')
+                   for handle in self.driver.window_handles}
+        self.api_requests = {other: value for other, value in self.api_requests.items()
+                             if other[0] in handles}
+
+        payloads = {}
+        # response bodies are only reachable through a local chromedriver
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            for name, request_id in requests.items():
+                try:
+                    payloads[name] = json.loads(self.driver.execute_cdp_cmd(
+                        'Network.getResponseBody', {'requestId': request_id})['body'])
+                except Exception:
+                    continue
+
+        missing = {name: self.PROFILE_API_URL.format(match.group(1), endpoint)
+                   for name, endpoint in self.PROFILE_API_ENDPOINTS.items()
+                   if name not in payloads and
+                   (name != 'contact_info' or self.with_contact_info)}
+        if missing:
+            try:
+                bodies = self.driver.execute_async_script(
+                    self.PROFILE_API_SCRIPT, missing)
+                payloads.update({name: json.loads(body)
+                                 for name, body in bodies.items() if body})
+            except Exception as e:
+                print(e)
+
+        if 'profile_view' not in payloads:
+            print('Profile api responses not found for {0}'.format(match.group(1)))
+            return None
+
+        return JsonProfile(payloads)
+
+    def read_network_log(self):
+        """
+        Drain the performance log into `api_requests`, keeping the
+        successful profile api responses of every tab
+        """
+        endpoints = {endpoint: name
+                     for name, endpoint in self.PROFILE_API_ENDPOINTS.items()}
+        for entry in self.driver.get_log('performance'):
+            message = json.loads(entry['message'])
+            event = message['message']
+            if event['method'] != 'Network.responseReceived':
+                continue
+            response = event['params']['response']
+            match = self.PROFILE_API_PATTERN.search(response['url'])
+            if not match or response['status'] != 200 or match.group(2) not in endpoints:
+                continue
+            key = (message.get('webview'), match.group(1))
+            self.api_requests.setdefault(key, {})[endpoints[match.group(2)]] = \
+                event['params']['requestId']
+
+    def open_contact_info(self):
+        """Open the contact info overlay, returns its element"""
+        # Scroll to top to put clickable button in view
+        self.driver.execute_script("window.scrollTo(0, 0);")
+        button = self.driver.find_element_by_css_selector(
+            'a[data-control-name="contact_see_more"]')
+        button.click()
+
+        return self.wait_for_el(self.CONTACT_INFO_SELECTOR)
+
     def get_contact_info(self):
         try:
-            # Scroll to top to put clickable button in view
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            button = self.driver.find_element_by_css_selector(
-                'a[data-control-name="contact_see_more"]')
-            button.click()
-            contact_info = self.wait_for_el('.pv-contact-info')
-
-            return contact_info.get_attribute('outerHTML')
+            self.open_contact_info()
+
+            return self.get_outer_html(self.CONTACT_INFO_SELECTOR)
         except Exception as e:
             print(e)
 
             return ""
+
+    def scrape_contact_info(self, user):
+        """
+        Load only the contact info overlay of `user`(vanity url) from its own
+        url, the profile behind it is neither scrolled nor transferred
+        Returns personal info dict(email, phone, websites...), None on failure
+        """
+        self.driver.get(self.base_url +
+                        self.CONTACT_INFO_PATH.format(user.rstrip('/')))
+        try:
+            self.wait_for_el(self.CONTACT_INFO_SELECTOR)
+            html = self.get_outer_html(self.CONTACT_INFO_SELECTOR)
+        except Exception as e:
+            print(e)
+            return None
+
+        return Profile(html).personal_info
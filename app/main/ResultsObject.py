@@ -1,11 +1,19 @@
-from bs4 import BeautifulSoup
+from ..utils.parser_util import parse_html
+from config import Config
 
 
 class ResultsObject(object):
     attributes = []
+    # css classes of the elements read by the attributes,
+    # only these are built when parsing is restricted(`RESTRICTED_PARSE`)
+    parse_only_classes = None
 
-    def __init__(self, body):
-        self.soup = BeautifulSoup(body, 'html.parser')
+    def __init__(self, body, parser=None, restricted=None):
+        # `parser` overrides the configured `HTML_PARSER` backend
+        if restricted is None:
+            restricted = Config.RESTRICTED_PARSE
+        parse_only = self.parse_only_classes if restricted else None
+        self.soup = parse_html(body, parser, parse_only)
 
     def to_dict(self):
         keys = self.attributes
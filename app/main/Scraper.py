@@ -1,3 +1,5 @@
+from collections import deque
+from pathlib import Path
 import time
 from selenium import webdriver
 from flask import current_app as flask_app
@@ -5,21 +7,129 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.support import expected_conditions as EC
 
+from ..utils.archive_util import archive_page
+from ..utils.driver_util import get_driver_pool, browser_cache_dir, is_alive, session_alive, quit_driver, \
+    pages_loaded, count_page_load, browser_memory_mb
+from ..utils.session_util import load_session, save_session, clear_session, get_session_store
+from ..utils.prune_util import PRUNE_SELECTOR, KEEP_ATTRIBUTES, format_savings
+
 
 class Scraper(object):
     """
     Wrapper for selenium Chrome driver with methods to scroll through a page and
     to scrape and parse info from a linkedin page
     """
+    # answers with the status of an authenticated api call, see `check_session`
+    SESSION_CHECK_SCRIPT = """
+        var done = arguments[arguments.length - 1];
+        fetch('/voyager/api/me', {
+            credentials: 'include',
+            redirect: 'manual',
+            headers: {'csrf-token': arguments[0]}
+        }).then(function (response) {
+            done(response.status);
+        }).catch(function () {
+            done(0);
+        });
+    """
+    # sections jumped to while scrolling, see `scroll_to_bottom`
+    SCROLL_ANCHORS = []
+    # expandable 'see more...' elements clicked on each scroll step
+    EXPANDABLE_SELECTORS = [
+        'button[aria-expanded="false"].pv-skills-section__additional-skills',
+        'button[aria-expanded="false"].pv-profile-section__see-more-inline',
+        'button[aria-expanded="false"].pv-top-card-section__summary-toggle-button',
+        'button[data-control-name="contact_see_more"]',
+        'button[aria-expanded="false"][aria-controls="test-scores-expandable-content"]',
+        # fix: For some users, thumbnail model opens somehow
+        'button[aria-label="Dismiss"].artdeco-modal__dismiss',
+        # invisible line clamped 'see more...'
+        '.lt-line-clamp__ellipsis:not(.lt-line-clamp__ellipsis--dummy) .lt-line-clamp__more',
+    ]
+    SCROLL_SCRIPT = (Path(__file__).parent / 'scripts' /
+                     'scroll.js').read_text(encoding='utf-8')
+    # page loaded / error page / loading(loader shown), see `wait_for_tab`
+    MAIN_SELECTOR = None
+    ERROR_SELECTOR = None
+    LOADER_SELECTOR = None
+    # page after which no more pages are loaded(e.g. search limit reached)
+    STOP_SELECTOR = None
+    TAB_STATE_SCRIPT = """
+        if (arguments[3] && document.querySelector(arguments[3])) return 'stop';
+        var loader = arguments[2] && document.querySelector(arguments[2]);
+        if (loader && loader.offsetParent !== null) return null;
+        if (document.querySelector(arguments[0])) return 'loaded';
+        if (arguments[1] && document.querySelector(arguments[1])) return 'error';
+        return null;
+    """
+    # bytes & requests since the previous call, see `record_page_load`
+    PAGE_LOAD_SCRIPT = """
+        var entries = performance.getEntriesByType('resource');
+        performance.clearResourceTimings();
+        performance.setResourceTimingBufferSize(5000);
+        // single page app, the document itself only counts once
+        if (!window.__scraperNavigationCounted) {
+            window.__scraperNavigationCounted = true;
+            entries = entries.concat(performance.getEntriesByType('navigation'));
+        }
+        var bytes = 0;
+        entries.forEach(function (entry) {
+            bytes += entry.transferSize || 0;
+        });
+        return {bytes: bytes, requests: entries.length};
+    """
+    # strips heavy markup before outerHTML transfer, see `get_outer_html`
+    PRUNE_SCRIPT = (Path(__file__).parent / 'scripts' /
+                    'prune.js').read_text(encoding='utf-8')
 
     def __init__(self):
         self.timeout = 30  # adjust accordingly
-        self.scroll_pause = 0.381
-        self.scroll_increment = 150
-        self.max_scroll_times = 85  # scroll limit to break the loop
+        # scroll limits to break the loop
+        self.max_scroll_times = flask_app.config["SCROLL_MAX_STEPS"]
+        self.scroll_timeout = flask_app.config["SCROLL_TIMEOUT"]
+        # a step is over once the page has been quiet this long(ms)...
+        self.scroll_quiet = flask_app.config["SCROLL_QUIET_MS"]
+        # ...or after this long(ms)
+        self.scroll_step_wait = flask_app.config["SCROLL_STEP_WAIT_MS"]
+        # outerHTML bytes before / after pruning(`PRUNE_HTML`)
+        self.transfer_stats = {
+            'pages': 0, 'original_bytes': 0, 'pruned_bytes': 0}
+        # WebDriver calls saved by the single call scroll steps
+        self.round_trips_saved = 0
+        # handle -> (url, load start) of the tabs loading, see `iter_loaded_pages`
+        self.loading_tabs = {}
+        # url of the page that stopped `iter_loaded_pages`(`STOP_SELECTOR`)
+        self.stopped_at = None
+        # pages loaded, with their network bytes, requests & seconds
+        self.load_stats = {
+            'pages': 0, 'bytes': 0, 'requests': 0, 'seconds': 0.0}
+        # drivers replaced(expired or dead), see `recycle_driver`
+        self.recycled = 0
+
+        # reuse a warm driver of the worker's pool(`DRIVER_POOL_SIZE`) if any
+        self.pool = get_driver_pool()
+        if self.pool:
+            self.driver = self.pool.checkout(self.create_driver)
+        else:
+            self.driver = self.create_driver()
+
+        # pooled drivers only log in once(while their session lasts)
+        try:
+            if not self.is_logged_in():
+                self.start_session(flask_app.config["LINKEDIN_EMAIL"],
+                                   flask_app.config["LINKEDIN_PASSWORD"])
+        except Exception:
+            # never used, neither kept nor leaked
+            quit_driver(self.driver)
+            self.driver = None
+            raise
 
+    @staticmethod
+    def create_driver():
+        """Returns a new(not logged in) local or remote Chrome driver"""
         driver_options = Options()
 
         # go headless only in production
@@ -29,21 +139,212 @@ class Scraper(object):
             driver_options.add_argument("--no-sandbox")
             driver_options.add_argument("--disable-gpu")
 
+        # pages load in background tabs, see `iter_loaded_pages`
+        if max(flask_app.config["PROFILE_TABS"], flask_app.config["SEARCH_TABS"]) > 1:
+            driver_options.add_argument('--disable-background-timer-throttling')
+            driver_options.add_argument('--disable-renderer-backgrounding')
+            driver_options.add_argument('--disable-backgrounding-occluded-windows')
+
+        if flask_app.config["BLOCK_RESOURCES"]:
+            Scraper.add_light_profile(driver_options)
+
+        # network responses read back from the performance log,
+        # see `ProfileScraper.get_network_profile`
+        log_network = flask_app.config["PROFILE_EXTRACTION"] == 'network'
+        if log_network:
+            driver_options.add_experimental_option('perfLoggingPrefs', {
+                'enableNetwork': True, 'enablePage': False})
+        capabilities = driver_options.to_capabilities()
+        if log_network:
+            capabilities['goog:loggingPrefs'] = {'performance': 'ALL'}
+
         if flask_app.config["SELENIUM_MODE"] == 'remote':
             URL = '{0}/wd/hub'.format(
                 flask_app.config["SELENIUM_REMOTE_URL"])
-            self.driver = webdriver.Remote(
+            driver = webdriver.Remote(
                 command_executor=URL,
-                desired_capabilities=driver_options.to_capabilities()
+                desired_capabilities=capabilities
             )
         else:
-            self.driver = webdriver.Chrome(options=driver_options)
+            driver = webdriver.Chrome(desired_capabilities=capabilities)
+
+        driver.set_window_size(1920, 1080)
+        # hung page loads raise instead of blocking the scraper
+        driver.set_page_load_timeout(flask_app.config["PAGE_LOAD_TIMEOUT"])
+
+        return driver
+
+    @staticmethod
+    def add_light_profile(driver_options):
+        """
+        Scraping profile(`BLOCK_RESOURCES`): no images(their `src` is kept),
+        media, web fonts, extensions or background networking, and a disk
+        cache kept across sessions(`BROWSER_CACHE_PATH`) for static assets
+        Stylesheets are kept, lazy loading & scrolling depend on the layout
+        """
+        driver_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        for argument in ['--blink-settings=imagesEnabled=false',
+                         '--disable-remote-fonts',
+                         '--autoplay-policy=user-gesture-required',
+                         '--mute-audio',
+                         '--disable-extensions',
+                         '--disable-background-networking',
+                         '--disable-component-update',
+                         '--disable-default-apps',
+                         '--disable-sync']:
+            driver_options.add_argument(argument)
+
+        # with remote drivers the path is on the selenium host
+        cache_dir = browser_cache_dir()
+        if cache_dir:
+            driver_options.add_argument('--disk-cache-dir={0}'.format(cache_dir))
+
+    @property
+    def base_url(self):
+        """`LINKEDIN_URL`, the fake server when testing offline"""
+        return flask_app.config["LINKEDIN_URL"].rstrip('/')
+
+    def record_page_load(self, start):
+        """
+        Add the bytes & requests of the current page since the last call
+        (resource timing, measured in the browser so local & remote drivers
+        report alike) and the time since `start` to `load_stats`
+        Cross origin resources not allowing timing count as 0 bytes
+        """
+        count_page_load(self.driver)
+        try:
+            loaded = self.driver.execute_script(self.PAGE_LOAD_SCRIPT)
+        except Exception as e:
+            print(e)
+            return
+
+        seconds = time.monotonic() - start
+        self.load_stats['pages'] += 1
+        self.load_stats['bytes'] += loaded['bytes']
+        self.load_stats['requests'] += loaded['requests']
+        self.load_stats['seconds'] += seconds
+        print('Loaded page: {0:.1f} KB in {1} requests, {2:.1f}s'.format(
+            loaded['bytes'] / 1024, loaded['requests'], seconds))
+
+    def driver_expired(self):
+        """
+        The driver loaded `DRIVER_MAX_PAGES` pages or its browser uses
+        `DRIVER_MAX_MEMORY_MB`(local drivers), and should be recycled
+        """
+        max_pages = flask_app.config["DRIVER_MAX_PAGES"]
+        if max_pages and pages_loaded(self.driver) >= max_pages:
+            return True
 
-        self.driver.get('https://www.linkedin.com/login')
-        self.driver.set_window_size(1920, 1080)
+        max_memory = flask_app.config["DRIVER_MAX_MEMORY_MB"]
+        if max_memory:
+            memory = browser_memory_mb(self.driver)
+            return memory is not None and memory >= max_memory
+
+        return False
+
+    def recycle_driver(self, reason):
+        """Quit the driver(even if pooled) and continue in a new logged in one"""
+        print('Starting a new browser({0}) after {1} pages'.format(
+            reason, pages_loaded(self.driver)))
+        quit_driver(self.driver)
+        self.driver = self.create_driver()
+        self.recycled += 1
+        if not self.is_logged_in():
+            self.start_session(flask_app.config["LINKEDIN_EMAIL"],
+                               flask_app.config["LINKEDIN_PASSWORD"])
+
+    def replace_dead_driver(self):
+        """
+        Start a new browser if the driver died(crashed, session lost)
+        Returns True if it was replaced
+        """
+        if is_alive(self.driver):
+            return False
+
+        self.recycle_driver('browser session lost')
+        return True
+
+    def is_logged_in(self):
+        """
+        The driver holds a linkedin session cookie and linkedin still accepts
+        it, the session of a pooled driver may have expired or been revoked
+        """
+        try:
+            if self.driver.get_cookie('li_at') is None:
+                return False
+            # the api is called from a page of the site
+            if not self.driver.current_url.startswith(self.base_url):
+                self.driver.get(self.base_url + '/robots.txt')
+            status = self.check_session()
+            if status == 200:
+                return True
+            print('Linkedin session expired({0}), logging in'.format(status))
+            self.driver.delete_all_cookies()
+        except Exception as e:
+            print(e)
+
+        return False
+
+    def check_session(self):
+        """Returns the status of an authenticated api call with the driver's cookies"""
+        csrf_token = self.driver.get_cookie('JSESSIONID')['value'].strip('"')
+        return self.driver.execute_async_script(
+            self.SESSION_CHECK_SCRIPT, csrf_token)
+
+    def start_session(self, email, password):
+        """
+        Restore the saved session(`SESSION_STORE`), log in through the
+        login form if there is none or it's rejected
+        """
+        if self.restore_session(email):
+            return
 
-        self.login(flask_app.config["LINKEDIN_EMAIL"],
-                   flask_app.config["LINKEDIN_PASSWORD"])
+        self.driver.get(self.base_url + '/login')
+        self.login(email, password)
+        self.save_session(email)
+
+    def restore_session(self, email):
+        """Inject the saved session cookies, returns True if linkedin accepts them"""
+        cookies = load_session(email)
+        if not cookies:
+            return False
+
+        try:
+            # cookies can only be set on the current domain,
+            # robots.txt is the lightest page there
+            self.driver.get(self.base_url + '/robots.txt')
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+
+            status = self.check_session()
+            if status == 200:
+                print('Restored linkedin session')
+                return True
+            print('Saved linkedin session rejected({0}), logging in'.format(status))
+        except Exception as e:
+            print(e)
+
+        self.driver.delete_all_cookies()
+        clear_session(email)
+
+        return False
+
+    def save_session(self, email):
+        """Save the session cookies once the login went through"""
+        if not get_session_store():
+            return
+
+        try:
+            self.wait(lambda driver: driver.get_cookie('li_at'))
+        except TimeoutException:
+            print('Login did not complete, session not saved')
+            return
+
+        if save_session(email, self.driver.get_cookies()):
+            print('Saved linkedin session')
 
     def login(self, email, password):
         email_input = self.driver.find_element_by_name('session_key')
@@ -53,49 +354,238 @@ class Scraper(object):
         password_input.send_keys(Keys.ENTER)
 
     def scroll_to_bottom(self):
-        """Scroll to the bottom of the page
-        Params:
-            - scroll_pause_time {float}: time to wait (s) between page scroll increments
-            - scroll_increment {int}: increment size of page scrolls (pixels)
-        """
-        expandable_button_selectors = [
-            'button[aria-expanded="false"].pv-skills-section__additional-skills',
-            'button[aria-expanded="false"].pv-profile-section__see-more-inline',
-            'button[aria-expanded="false"].pv-top-card-section__summary-toggle-button',
-            'button[data-control-name="contact_see_more"]',
-            'button[aria-controls="test-scores-expandable-content"]',
-            # fix: For some users, thumbnail model opens somehow
-            'button[aria-label="Dismiss"].artdeco-modal__dismiss'
-        ]
-
-        current_height = 0
-        scrolls_left = self.max_scroll_times
+        """
+        Scroll to the bottom of the page to load any lazy-loaded content
+        Each step clicks the expandable 'see more...' buttons(`EXPANDABLE_SELECTORS`),
+        jumps to the next section(`SCROLL_ANCHORS`) or a viewport down and waits
+        for the page to settle(no DOM mutation & request in flight) instead of
+        sleeping, in a single script call, see `scripts/scroll.js`
+        Stops at the bottom, after `max_scroll_times` steps or `scroll_timeout` seconds
+        """
+        start = time.monotonic()
+        steps = 0
+        while steps < self.max_scroll_times:
+            steps += 1
+            state = self.driver.execute_async_script(
+                self.SCROLL_SCRIPT, self.SCROLL_ANCHORS,
+                self.scroll_quiet, self.scroll_step_wait,
+                self.EXPANDABLE_SELECTORS)
+            if state['at_bottom'] or time.monotonic() - start > self.scroll_timeout:
+                break
+
+        # a lookup(+ click) per selector & a scroll + height call per step before
+        saved = steps * (len(self.EXPANDABLE_SELECTORS) + 1)
+        self.round_trips_saved += saved
+        print('Scrolled {0} steps in {1:.1f}s, {2} round trips saved'.format(
+            steps, time.monotonic() - start, saved))
+
+    def iter_loaded_pages(self, urls, tabs, scroll=True):
+        """
+        Load `urls` in up to `tabs` browser tabs at once, keeping every tab busy
+        Yields each url once its page is loaded(`MAIN_SELECTOR`) & scrolled(unless
+        `scroll` is False), in completion order, with its tab as the current
+        window, the tab is closed when the next one is requested
+        Error pages(`ERROR_SELECTOR`) and tabs timing out are skipped, a stop
+        page(`STOP_SELECTOR`) ends the loading(see `stopped_at`): the urls after
+        it are not loaded, the earlier ones still loading are
+
+        An expired driver(see `driver_expired`) is recycled once its tabs are
+        done, a dead one is replaced right away and its loading pages are
+        loaded again(once) in the new browser, a broken tab of a live driver
+        (e.g. closed by the page) is skipped
+        """
+        urls = iter(urls)
+        main_window = self.driver.current_window_handle
+        # urls lost with a dead browser, loaded again before the next ones
+        lost_urls = deque()
+        retried = set()
+        exhausted = False
+        self.stopped_at = None
+        # url -> its position in `urls`, the pages after a stop page are dropped
+        positions = {}
+
+        def before_stop(url):
+            return self.stopped_at is None or positions[url] < positions[self.stopped_at]
+
+        def open_next_tab():
+            nonlocal exhausted
+            url = None
+            if lost_urls:
+                url = lost_urls.popleft()
+            elif self.stopped_at is None:
+                url = next(urls, None)
+                if url is not None:
+                    positions.setdefault(url, len(positions))
+            if url is None:
+                exhausted = True
+                return
+            opened = set(self.driver.window_handles)
+            self.driver.execute_script(
+                'window.open(arguments[0], "_blank");', url)
+            handle = (set(self.driver.window_handles) - opened).pop()
+            self.loading_tabs[handle] = (url, time.monotonic())
+
+        handle = None
+        url = None
+        replace_tab = False
+        try:
+            while self.loading_tabs or not exhausted:
+                try:
+                    if replace_tab:
+                        replace_tab = False
+                        if not self.driver_expired():
+                            open_next_tab()
+                    if not self.loading_tabs:
+                        if self.driver_expired():
+                            self.recycle_driver('expired')
+                            main_window = self.driver.current_window_handle
+                        for _ in range(tabs):
+                            open_next_tab()
+                        continue
+
+                    handle, state = self.wait_for_tab()
+                    url, start = self.loading_tabs.pop(handle)
+                    self.driver.switch_to.window(handle)
+                    if state == 'stop':
+                        if before_stop(url):
+                            self.stopped_at = url
+                        self.close_tabs([tab for tab, (tab_url, _) in self.loading_tabs.items()
+                                         if not before_stop(tab_url)], handle)
+                        lost_urls = deque(lost_url for lost_url in lost_urls
+                                          if before_stop(lost_url))
+                    loaded = state == 'loaded'
+                    if loaded:
+                        try:
+                            if scroll:
+                                self.scroll_to_bottom()
+                            self.record_page_load(start)
+                        except Exception as e:
+                            if isinstance(e, WebDriverException) and not is_alive(self.driver):
+                                raise
+                            print(e)
+                            loaded = False
+                    if loaded:
+                        yield url
+                    elif state != 'stop':
+                        print('Page Unavailable: {0}'.format(url))
+                    url = None
+
+                    self.driver.close()
+                    handle = None
+                    self.driver.switch_to.window(main_window)
+                    # let the tabs drain before recycling the driver
+                    if not self.driver_expired():
+                        open_next_tab()
+                except WebDriverException as e:
+                    if session_alive(self.driver):
+                        # the browser is fine, only this tab broke(e.g. closed
+                        # by the page itself), skip it
+                        print(e)
+                        if url:
+                            print('Page Unavailable: {0}'.format(url))
+                        self.drop_tab(handle, main_window)
+                        handle = None
+                        url = None
+                        # its place is taken in the next round
+                        replace_tab = True
+                        continue
+                    self.recycle_driver('browser session lost')
+                    lost = [url] + [tab[0] for tab in self.loading_tabs.values()]
+                    lost = [lost_url for lost_url in lost
+                            if lost_url and lost_url not in retried and before_stop(lost_url)]
+                    retried.update(lost)
+                    lost_urls.extend(lost)
+                    exhausted = exhausted and not lost_urls
+                    handle = None
+                    url = None
+                    self.loading_tabs = {}
+                    main_window = self.driver.current_window_handle
+        finally:
+            # stopped early, close the current tab & the ones still loading
+            if handle:
+                self.loading_tabs[handle] = None
+            try:
+                for handle in self.loading_tabs:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                self.driver.switch_to.window(main_window)
+            except WebDriverException as e:
+                print(e)
+            self.loading_tabs = {}
+
+    def close_tabs(self, handles, current):
+        """Close the loading tabs `handles`, back to the tab `current`"""
+        for handle in handles:
+            self.loading_tabs.pop(handle)
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        if handles:
+            self.driver.switch_to.window(current)
+
+    def drop_tab(self, handle, main_window):
+        """Close the tab `handle` if it's still there, back to `main_window`"""
+        self.loading_tabs.pop(handle, None)
+        try:
+            if handle in self.driver.window_handles:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(main_window)
+        except WebDriverException as e:
+            print(e)
+
+    def wait_for_tab(self):
+        """
+        Poll the loading tabs until one is loaded, shows an error / stop page,
+        times out or breaks
+        Returns (handle, 'loaded' / 'error' / 'stop', None on timeout)
+        """
         while True:
-            scrolls_left -= 1
-            for name in expandable_button_selectors:
+            for handle, (url, start) in self.loading_tabs.items():
                 try:
-                    self.driver.find_element_by_css_selector(name).click()
-                except:
-                    pass
+                    self.driver.switch_to.window(handle)
+                    state = self.driver.execute_script(
+                        self.TAB_STATE_SCRIPT, self.MAIN_SELECTOR,
+                        self.ERROR_SELECTOR, self.LOADER_SELECTOR, self.STOP_SELECTOR)
+                except WebDriverException:
+                    if not session_alive(self.driver):
+                        raise
+                    # the tab is gone(closed by the page), given up
+                    return handle, None
+                if state:
+                    return handle, state
+                if time.monotonic() - start > self.timeout:
+                    return handle, None
+            time.sleep(0.1)
 
-            # Use JS to click on invisible expandable 'see more...' elements
-            self.driver.execute_script(
-                'document.querySelectorAll(".lt-line-clamp__ellipsis:not(.lt-line-clamp__ellipsis--dummy) .lt-line-clamp__more").forEach(el => el.click())')
-
-            # Scroll down to bottom
-            new_height = self.driver.execute_script(
-                "return Math.min({}, document.body.scrollHeight)".format(current_height + self.scroll_increment))
-            """
-            this ends in a loop for some profiles
-            break on reaching a particular scrolling threshold
-            """
-            if (new_height == current_height) or (scrolls_left <= 0):
-                break
-            self.driver.execute_script(
-                "window.scrollTo(0, Math.min({}, document.body.scrollHeight));".format(new_height))
-            current_height = new_height
-            # Wait to load page
-            time.sleep(self.scroll_pause)
+    def get_outer_html(self, selector):
+        """
+        outerHTML of the first element matching `selector`
+        With `PRUNE_HTML` svg, scripts, json blobs, hidden templates and
+        unused attributes are stripped in the page before the transfer
+        Raises:
+            NoSuchElementException: If no element matches `selector`
+        """
+        if not flask_app.config["PRUNE_HTML"]:
+            return self.driver.find_element_by_css_selector(
+                selector).get_attribute("outerHTML")
+
+        pruned = self.driver.execute_script(
+            self.PRUNE_SCRIPT, selector, PRUNE_SELECTOR, KEEP_ATTRIBUTES)
+        if pruned is None:
+            raise NoSuchElementException(
+                'Unable to locate element: {0}'.format(selector))
+
+        self.transfer_stats['pages'] += 1
+        self.transfer_stats['original_bytes'] += pruned['original_bytes']
+        self.transfer_stats['pruned_bytes'] += pruned['pruned_bytes']
+        print('Pruned {0}: {1}'.format(selector, format_savings(
+            pruned['original_bytes'], pruned['pruned_bytes'])))
+
+        return pruned['html']
+
+    def archive_page(self, kind, html):
+        """Store fetched html of the current page in the raw html archive"""
+        archive_page(kind, self.driver.current_url, html)
 
     def wait(self, condition):
         return WebDriverWait(self.driver, self.timeout).until(condition)
@@ -112,5 +602,24 @@ class Scraper(object):
         self.quit()
 
     def quit(self):
+        if self.recycled:
+            print('Recycled {0} drivers'.format(self.recycled))
+        if self.load_stats['pages']:
+            pages = self.load_stats['pages']
+            print('Loaded {0} pages{1}: {2:.1f} KB & {3:.0f} requests, {4:.1f}s per page'.format(
+                pages,
+                ' (resources blocked)' if flask_app.config["BLOCK_RESOURCES"] else '',
+                self.load_stats['bytes'] / 1024 / pages,
+                self.load_stats['requests'] / pages,
+                self.load_stats['seconds'] / pages))
+        if self.transfer_stats['pages']:
+            print('Pruned {0} pages: {1}'.format(
+                self.transfer_stats['pages'], format_savings(
+                    self.transfer_stats['original_bytes'],
+                    self.transfer_stats['pruned_bytes'])))
         if self.driver:
-            self.driver.quit()
+            if self.pool:
+                self.pool.checkin(self.driver)
+            else:
+                self.driver.quit()
+            self.driver = None
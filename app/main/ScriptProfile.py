@@ -0,0 +1,20 @@
+from .Profile import Profile
+
+
+class ScriptProfile(object):
+    """
+    Profile extracted in the browser(see `ProfileScraper.get_profile_data`)
+    Same attributes & `to_dict()` as `Profile`, nothing left to parse
+    """
+    attributes = Profile.attributes
+
+    def __init__(self, data):
+        self.data = data
+
+    def __getattr__(self, name):
+        if name in self.attributes:
+            return self.data.get(name)
+        raise AttributeError(name)
+
+    def to_dict(self):
+        return {attr: self.data.get(attr) for attr in self.attributes}
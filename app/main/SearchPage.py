@@ -0,0 +1,10 @@
+from .Pages import Pages
+from .Search import Search
+
+
+class SearchPage(Pages, Search):
+    """
+    Snapshot of one search results page, parsed once and serving
+    both `Pages`(pagination stats) and `Search`(vanity urls) data
+    """
+    attributes = Pages.attributes + Search.attributes
@@ -1,13 +1,13 @@
 import time
 from urllib.parse import urlencode
+from flask import current_app as flask_app
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 
-from .Pages import Pages
-from .Search import Search
 from .Scraper import Scraper
+from .SearchPage import SearchPage
 
 from ..utils.scrape_util import AnyEC, BothEC
 
@@ -22,14 +22,23 @@ class SearchScraper(Scraper):
     MAIN_SELECTOR = '.core-rail'
     ERROR_SELECTOR = '.search-no-results'
     SEARCH_LOADER = 'div.search-is-loading'
+    LOADER_SELECTOR = SEARCH_LOADER
     SEARCH_LIMIT_REACHED_SELECTOR = 'div.search-paywall'
+    # no results on that page, stops loading the next ones in tabs
+    STOP_SELECTOR = SEARCH_LIMIT_REACHED_SELECTOR
     PAGINATION_NEXT_SELECTOR = 'button[aria-label="Next"]'
-    DEFAULT_SEARCH_PREFIX_URL = 'https://www.linkedin.com/search/results/people/?facetGeoRegion=["fr%3A0"%2C"fr%3A5227"]&facetNetwork=["S"%2C"O"]&origin=FACETED_SEARCH&'
+    SCROLL_ANCHORS = ['.search-results__pagination']
+    # search results have nothing to expand
+    EXPANDABLE_SELECTORS = []
+    # url of the current search's first page, see `get_urls_from_tabs`
+    search_url = None
+    SEARCH_PREFIX_PATH = '/search/results/people/?facetGeoRegion=["fr%3A0"%2C"fr%3A5227"]&facetNetwork=["S"%2C"O"]&origin=FACETED_SEARCH&'
 
     def go_to_search_page(self, url):
         return self.driver.get(url)
 
     def load_search_page(self):
+        start = time.monotonic()
         # Wait for page to load dynamically via javascript
         try:
             # Wait until the loader `div.search-is-loading` is gone as `MAIN_SELECTOR` never unmounts
@@ -61,6 +70,7 @@ class SearchScraper(Scraper):
             print('No results found.')
         # Scroll to the bottom of the page incrementally to load any lazy-loaded content
         self.scroll_to_bottom()
+        self.record_page_load(start)
 
     def search(self, skills=[]):
         max_accessible_pages = 1
@@ -69,24 +79,27 @@ class SearchScraper(Scraper):
         encoded = urlencode(params)
 
         # pass encoded url
-        self.go_to_search_page(self.DEFAULT_SEARCH_PREFIX_URL + encoded)
+        self.search_url = self.base_url + self.SEARCH_PREFIX_PATH + encoded
+        self.go_to_search_page(self.search_url)
         self.load_search_page()
         print('Currently at Page 1')
 
-        stats = self.get_result_stats().to_dict()
-        if stats and "pages" in stats and "max_accessible_pages" in stats["pages"]:
-            max_accessible_pages = stats["pages"]["max_accessible_pages"]
-        user_urls = self.get_urls(max_accessible_pages)
+        # stats & first page results come from the same snapshot
+        snapshot = self.get_snapshot()
+        stats = snapshot.pages if snapshot else {}
+        if "max_accessible_pages" in stats:
+            max_accessible_pages = stats["max_accessible_pages"]
+        user_urls = self.get_urls(max_accessible_pages, snapshot)
 
         return {
             'urls': {
                 'vanity_urls': user_urls,
                 'total': len(user_urls)
             },
-            'stats': stats["pages"]
+            'stats': stats
         }
 
-    def get_urls(self, total_pages):
+    def get_urls(self, total_pages, first_page=None):
         urls = []
         """
         PAGES_LIMIT_PERCENT controls percent of pages to be visited
@@ -99,9 +112,14 @@ class SearchScraper(Scraper):
             (total_pages * self.PAGES_LIMIT_PERCENT / 100) - 1)
 
         # get first page results
-        results = self.get_results().to_dict()
-        if results and "vanity_urls" in results:
-            urls.extend(results["vanity_urls"])
+        if first_page is None:
+            first_page = self.get_snapshot()
+        if first_page:
+            urls.extend(first_page.vanity_urls)
+
+        tabs = flask_app.config["SEARCH_TABS"]
+        if tabs > 1 and self.search_url:
+            return self.get_urls_from_tabs(pagination_limit, urls, tabs)
 
         for page in range(pagination_limit):
             try:
@@ -129,10 +147,10 @@ class SearchScraper(Scraper):
 
             print('Currently at Page {}'.format(page + 2))
 
-            results = self.get_results().to_dict()
+            snapshot = self.get_snapshot()
             # append to list
-            if results and "vanity_urls" in results:
-                urls.extend(results["vanity_urls"])
+            if snapshot:
+                urls.extend(snapshot.vanity_urls)
 
             # break on reaching max profile count
             if len(urls) >= self.MAX_PROFILES_COUNT:
@@ -141,37 +159,42 @@ class SearchScraper(Scraper):
         # filter out duplicates(if any)
         return list(set(urls))
 
-    def get_result_stats(self):
-        try:
-            search = self.driver.find_element_by_css_selector(
-                self.MAIN_SELECTOR).get_attribute("outerHTML")
-            return Pages(search)
-        except:
-            print("Could not find search wrapper html.")
-        return None
+    def get_urls_from_tabs(self, pagination_limit, urls, tabs):
+        """
+        Load result pages 2 to `pagination_limit` + 1 directly(`&page=N`) in
+        up to `tabs` browser tabs at once instead of clicking through them,
+        deduplicating `urls` as the pages come in
+        """
+        urls = dict.fromkeys(urls)
+        page_urls = ('{0}&page={1}'.format(self.search_url, page)
+                     for page in range(2, pagination_limit + 2))
+
+        for page_url in self.iter_loaded_pages(page_urls, tabs):
+            print('Currently at {0}'.format(page_url))
+
+            snapshot = self.get_snapshot()
+            if snapshot:
+                urls.update(dict.fromkeys(snapshot.vanity_urls))
 
-    def get_results(self):
+            # break on reaching max profile count
+            if len(urls) >= self.MAX_PROFILES_COUNT:
+                break
+
+        # 'you are a power searcher.' page, never loaded(no results)
+        if self.stopped_at:
+            print('Search limit on LinkedIn reached at {0}'.format(self.stopped_at))
+
+        return list(urls)
+
+    def get_snapshot(self):
+        """
+        Fetch the results page DOM once and parse it once
+        Returns SearchPage serving both stats & results, None on failure
+        """
         try:
-            search = self.driver.find_element_by_css_selector(
-                self.MAIN_SELECTOR).get_attribute("outerHTML")
-            return Search(search)
+            search = self.get_outer_html(self.MAIN_SELECTOR)
+            self.archive_page('search', search)
+            return SearchPage(search)
         except:
             print("Could not find search wrapper html.")
         return None
-
-    def scroll_to_bottom(self):
-        """
-        Scroll to the bottom of the page
-        """
-        current_height = 0
-        while True:
-            # Scroll down to bottom
-            new_height = self.driver.execute_script(
-                "return Math.min({}, document.body.scrollHeight)".format(current_height + self.scroll_increment))
-            if (new_height == current_height):
-                break
-            self.driver.execute_script(
-                "window.scrollTo(0, Math.min({}, document.body.scrollHeight));".format(new_height))
-            current_height = new_height
-            # Wait to load page
-            time.sleep(self.scroll_pause)
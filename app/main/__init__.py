@@ -2,6 +2,12 @@ from .Pages import Pages
 from .Search import Search
 from .Scraper import Scraper
 from .Profile import Profile
+from .SearchPage import SearchPage
+from .ScriptProfile import ScriptProfile
+from .JsonProfile import JsonProfile
+from .JsonSearchPage import JsonSearchPage
 from .SearchScraper import SearchScraper
 from .ResultsObject import ResultsObject
 from .ProfileScraper import ProfileScraper
+from .HttpProfileScraper import HttpProfileScraper
+from .HttpSearchScraper import HttpSearchScraper
@@ -0,0 +1,363 @@
+/*
+ * Browser side port of `Profile.to_dict()`(app/main/Profile.py & app/utils/scrape_util.py)
+ * Executed with `driver.execute_script`, returns the same structure as a JSON string
+ * Keep both implementations in sync, `flask parser check-script` compares them
+ */
+var COMPANY_URL_PATTERN = /^\/company\/.*?\/\n?$/;
+
+var SECTION_SELECTORS = {
+    top_card: '.pv-top-card',
+    contact_info: '.pv-contact-info',
+    about: '.pv-about-section',
+    background: '.background-section',
+    accomplishments: '.pv-accomplishments-section',
+    interests: '.pv-interests-section'
+};
+var SKILL_SELECTOR = '.pv-skill-category-entity__skill-wrapper';
+var ACCOMPLISHMENT_KEYS = [
+    'publications', 'patents',
+    'courses', 'projects', 'honors',
+    'languages', 'organizations'
+];
+
+function orDefault(value) {
+    return value === undefined ? null : value;
+}
+
+function firstOrDefault(element, selector, fallback) {
+    try {
+        return element.querySelector(selector) || orDefault(fallback);
+    } catch (e) {
+        return orDefault(fallback);
+    }
+}
+
+function textOrDefault(element, selector, fallback) {
+    try {
+        return strip(element.querySelector(selector).textContent);
+    } catch (e) {
+        return orDefault(fallback);
+    }
+}
+
+function allOrDefault(element, selector) {
+    try {
+        return Array.prototype.slice.call(element.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+}
+
+function getInfo(element, mapping, fallback) {
+    var info = {};
+    Object.keys(mapping).forEach(function (key) {
+        info[key] = textOrDefault(element, mapping[key], fallback);
+    });
+    return info;
+}
+
+// beautifulsoup's `element[name]`, raises when the attribute is missing
+function attr(element, name) {
+    if (!element.hasAttribute(name)) {
+        throw new Error('Missing attribute ' + name);
+    }
+    return element.getAttribute(name);
+}
+
+// python's str.strip / str.split / str.replace / int
+function strip(value) {
+    return value.trim();
+}
+
+function splitWords(value) {
+    return value.split(/\s+/).filter(function (word) {
+        return word !== '';
+    });
+}
+
+function replaceAll(value, search, replacement) {
+    return value.split(search).join(replacement);
+}
+
+function toInt(value) {
+    value = strip(value);
+    if (!/^[+-]?\d+$/.test(value)) {
+        throw new Error('invalid literal for int(): ' + value);
+    }
+    return parseInt(value, 10);
+}
+
+function normalizeUrl(url) {
+    return '/in/' + url.split('/in/')[1].split('/?')[0].replace(/\//g, '');
+}
+
+function normalizeString(value) {
+    return splitWords(replaceAll(value, '\n', '')).join(' ');
+}
+
+function cleanDescription(description) {
+    return strip(replaceAll(replaceAll(description, 'See less\n', ''), '... See more', ''));
+}
+
+function getJobInfo(job) {
+    var positionElements = allOrDefault(job, '.pv-entity__role-details-container');
+    var companyHref;
+
+    if (positionElements.length) {
+        var company = textOrDefault(job,
+            '.pv-entity__company-summary-info > h3 > span:nth-of-type(2)');
+        companyHref = attr(firstOrDefault(job, 'a[data-control-name="background_details_company"]'), 'href');
+        var liCompanyUrl = COMPANY_URL_PATTERN.test(companyHref) ? 'https://www.linkedin.com/' + companyHref : '';
+
+        return positionElements.map(function (position) {
+            var pos = getInfo(position, {
+                title: '.pv-entity__summary-info-v2 > h3 > span:nth-of-type(2)',
+                date_range: '.pv-entity__date-range span:nth-of-type(2)',
+                location: '.pv-entity__location > span:nth-of-type(2)',
+                description: '.pv-entity__description'
+            });
+            pos.company = company;
+            pos.li_company_url = liCompanyUrl;
+            if (!pos.date_range) {
+                pos.date_range = 'Not Specified';
+            }
+            if (pos.description !== null) {
+                pos.description = cleanDescription(pos.description);
+            }
+            return pos;
+        });
+    }
+
+    var jobInfo = getInfo(job, {
+        title: '.pv-entity__summary-info h3:nth-of-type(1)',
+        company: '.pv-entity__secondary-title',
+        date_range: '.pv-entity__date-range span:nth-of-type(2)',
+        location: '.pv-entity__location span:nth-of-type(2)',
+        description: '.pv-entity__description'
+    });
+    if (!jobInfo.date_range) {
+        jobInfo.date_range = 'Not Specified';
+    }
+    if (jobInfo.description !== null) {
+        jobInfo.description = cleanDescription(jobInfo.description);
+    }
+    companyHref = attr(firstOrDefault(job, 'a[data-control-name="background_details_company"]'), 'href');
+    jobInfo.li_company_url = COMPANY_URL_PATTERN.test(companyHref) ? 'https://www.linkedin.com' + companyHref : '';
+
+    return [jobInfo];
+}
+
+function getSections(scopes) {
+    var sections = {};
+    Object.keys(SECTION_SELECTORS).forEach(function (name) {
+        sections[name] = null;
+        scopes.forEach(function (scope) {
+            if (sections[name] === null) {
+                sections[name] = scope.matches(SECTION_SELECTORS[name]) ?
+                    scope : firstOrDefault(scope, SECTION_SELECTORS[name]);
+            }
+        });
+    });
+    sections.skills = [];
+    scopes.forEach(function (scope) {
+        sections.skills = sections.skills.concat(allOrDefault(scope, SKILL_SELECTOR));
+    });
+    return sections;
+}
+
+function getPersonalInfo(sections) {
+    var topCard = sections.top_card;
+    var contactInfo = sections.contact_info;
+
+    var personalInfo = getInfo(topCard, {
+        name: '.pv-top-card--list > li',
+        headline: '.flex-1.mr5 h2',
+        company: 'li a[data-control-name="position_see_more"]',
+        school: 'li a[data-control-name="education_see_more"]',
+        location: '.pv-top-card--list-bullet > li'
+    });
+
+    personalInfo.summary = strip(replaceAll(
+        textOrDefault(sections.about, '.pv-about__summary-text', ''), '... see more', ''));
+
+    var imageElement = firstOrDefault(topCard, 'img.profile-photo-edit__preview');
+    if (!imageElement) {
+        imageElement = firstOrDefault(topCard, 'img.pv-top-card__photo');
+    }
+    personalInfo.image = imageElement && imageElement.hasAttribute('src') ? imageElement.getAttribute('src') : '';
+
+    var connectionsText = textOrDefault(
+        topCard, 'a[data-control-name="topcard_view_all_connections"] span', '');
+    if (connectionsText === '') {
+        connectionsText = textOrDefault(
+            topCard, '.pv-top-card--list-bullet:nth-child(3) > li:nth-child(2) > span:nth-child(1)', '0');
+    }
+    personalInfo.connections = toInt(replaceAll(replaceAll(connectionsText, 'connections', ''), '+', ''));
+
+    var contact = getInfo(contactInfo, {
+        email: '.ci-email .pv-contact-info__ci-container',
+        phone: '.ci-phone .pv-contact-info__ci-container > span:nth-child(1)',
+        connected: '.ci-connected .pv-contact-info__ci-container'
+    });
+    Object.keys(contact).forEach(function (key) {
+        personalInfo[key] = contact[key];
+    });
+
+    var vanityUrl = strip(textOrDefault(
+        contactInfo, '.ci-vanity-url .pv-contact-info__ci-container', ''));
+    personalInfo.url = vanityUrl !== '' ? normalizeUrl(vanityUrl) : null;
+
+    personalInfo.websites = [];
+    if (contactInfo) {
+        personalInfo.websites = allOrDefault(contactInfo, '.ci-websites li a').map(function (website) {
+            return attr(website, 'href');
+        });
+    }
+
+    return personalInfo;
+}
+
+function getExperiences(sections) {
+    var container = sections.background;
+    var experiences = {};
+
+    experiences.jobs = [];
+    allOrDefault(container, '#experience-section ul .pv-position-entity').forEach(function (job) {
+        experiences.jobs = experiences.jobs.concat(getJobInfo(job));
+    });
+
+    experiences.education = allOrDefault(
+        container, '#education-section ul .pv-education-entity').map(function (school) {
+        return getInfo(school, {
+            name: '.pv-entity__school-name',
+            degree: '.pv-entity__degree-name span:nth-of-type(2)',
+            grades: '.pv-entity__grade span:nth-of-type(2)',
+            field_of_study: '.pv-entity__fos span:nth-of-type(2)',
+            date_range: '.pv-entity__dates span:nth-of-type(2)',
+            activities: '.activities-societies'
+        });
+    });
+
+    experiences.volunteering = allOrDefault(
+        container, '.pv-profile-section.volunteering-section .pv-volunteering-entity').map(function (exp) {
+        return getInfo(exp, {
+            title: '.pv-entity__summary-info h3:nth-of-type(1)',
+            company: '.pv-entity__secondary-title',
+            date_range: '.pv-entity__date-range span:nth-of-type(2)',
+            location: '.pv-entity__location span:nth-of-type(2)',
+            cause: '.pv-entity__cause span:nth-of-type(2)',
+            description: '.pv-entity__description'
+        });
+    });
+
+    experiences.certifications = allOrDefault(
+        container, '#certifications-section .pv-certification-entity').map(function (certification) {
+        var item = getInfo(certification, {
+            title: '.pv-certifications__summary-info h3:nth-of-type(1)',
+            authority: '.pv-certifications__summary-info p:nth-of-type(1) span:nth-of-type(2)',
+            date_range: '.pv-certifications__summary-info p:nth-of-type(2) span:nth-of-type(2)'
+        });
+        var dateRange = item.date_range;
+        if (dateRange !== null && dateRange.indexOf('Credential ID') === -1) {
+            dateRange = splitWords(replaceAll(replaceAll(dateRange, 'Expire', ' - Expire'),
+                'No Expiration', ' - No Expiration')).join(' ');
+        } else {
+            dateRange = 'Not Specified';
+        }
+        return {
+            authority: item.authority || 'Unknown',
+            title: item.title,
+            date_range: dateRange
+        };
+    });
+
+    return experiences;
+}
+
+function getSkills(sections) {
+    var skills = sections.skills.map(function (skill) {
+        var x = getInfo(skill, {
+            name: '.pv-skill-category-entity__name',
+            endorsements: '.pv-skill-category-entity__endorsement-count'
+        }, '0');
+        return { name: normalizeString(x.name), endorsements: toInt(replaceAll(x.endorsements, '+', '')) };
+    });
+
+    // Array.prototype.sort is stable, like python's sorted
+    return skills.sort(function (a, b) {
+        return b.endorsements - a.endorsements;
+    });
+}
+
+function getAccomplishments(sections) {
+    var container = sections.accomplishments;
+    var accomplishments = {};
+    var testScoreElements = [];
+
+    ACCOMPLISHMENT_KEYS.forEach(function (key) {
+        accomplishments[key] = [];
+    });
+
+    var blocks = allOrDefault(container, ACCOMPLISHMENT_KEYS.concat(['test-scores']).map(function (key) {
+        return 'section.' + key;
+    }).join(', '));
+    blocks.forEach(function (block) {
+        var items = allOrDefault(block, 'ul > li');
+        if (block.classList.contains('test-scores')) {
+            testScoreElements = testScoreElements.concat(items);
+        }
+        ACCOMPLISHMENT_KEYS.forEach(function (key) {
+            if (block.classList.contains(key)) {
+                accomplishments[key] = accomplishments[key].concat(items.map(function (item) {
+                    return item.textContent;
+                }));
+            }
+        });
+    });
+
+    accomplishments.text_scores = testScoreElements.map(function (testScore) {
+        var x = getInfo(testScore, {
+            name: '.pv-accomplishment-entity__title',
+            score: '.pv-accomplishment-entity__score'
+        }, '100%');
+        return { name: strip(replaceAll(x.name, 'Test name\n', '')), score: x.score };
+    });
+
+    return accomplishments;
+}
+
+function getInterests(sections) {
+    return allOrDefault(sections.interests, 'ul > li').map(function (interest) {
+        return textOrDefault(interest, '.pv-entity__summary-title');
+    });
+}
+
+function getProfile(root) {
+    // the profile & the contact info overlay, like `ProfileScraper.get_profile_html`
+    var scopes = [root.querySelector('.core-rail'), root.querySelector('.pv-contact-info')].filter(function (scope) {
+        return scope !== null;
+    });
+    var sections = getSections(scopes);
+
+    var info = {
+        personal_info: getPersonalInfo(sections),
+        experiences: getExperiences(sections),
+        skills: getSkills(sections),
+        accomplishments: getAccomplishments(sections),
+        interests: getInterests(sections)
+    };
+
+    info.personal_info.current_company_link = '';
+    var jobs = info.experiences.jobs;
+    if (jobs.length && jobs[0].date_range && jobs[0].date_range.toLowerCase().indexOf('present') !== -1) {
+        info.personal_info.current_company_link = jobs[0].li_company_url;
+    }
+
+    return info;
+}
+
+try {
+    return JSON.stringify(getProfile(document));
+} catch (e) {
+    return JSON.stringify({ error: String(e) });
+}
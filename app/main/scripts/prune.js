@@ -0,0 +1,43 @@
+/*
+ * Prune the heavy markup of an element before transferring its outerHTML
+ * Executed with `driver.execute_script(PRUNE_SCRIPT, selector, prune_selector, keep_attributes)`,
+ * rules are in app/utils/prune_util.py
+ * Works on a copy, the page itself is left untouched
+ * Returns {html, original_bytes, pruned_bytes}, null if `selector` doesn't match
+ */
+var selector = arguments[0];
+var pruneSelector = arguments[1];
+var keepAttributes = arguments[2];
+
+var element = document.querySelector(selector);
+if (!element) {
+    return null;
+}
+
+function utf8Length(text) {
+    return new Blob([text]).size;
+}
+
+var copy = element.cloneNode(true);
+// emptied rather than removed, so :nth-child selectors still match the same elements
+copy.querySelectorAll(pruneSelector).forEach(function (node) {
+    node.innerHTML = '';
+});
+
+var elements = [copy].concat(Array.prototype.slice.call(copy.querySelectorAll('*')));
+elements.forEach(function (node) {
+    for (var i = node.attributes.length - 1; i >= 0; i--) {
+        var name = node.attributes[i].name;
+        if (keepAttributes.indexOf(name) === -1) {
+            node.removeAttribute(name);
+        }
+    }
+});
+
+var html = copy.outerHTML;
+
+return {
+    html: html,
+    original_bytes: utf8Length(element.outerHTML),
+    pruned_bytes: utf8Length(html)
+};
@@ -0,0 +1,90 @@
+/*
+ * One step of `Scraper.scroll_to_bottom`
+ * Executed with `driver.execute_async_script(SCROLL_SCRIPT, anchors, quiet_ms, max_wait_ms, expanders)`
+ *
+ * Clicks every element matching the `expanders` selectors, jumps to the next section anchor below the viewport(one viewport at most, so
+ * lazy loaded content always gets into view), then waits for the page to
+ * settle: no DOM mutation for `quiet_ms` and no request in flight,
+ * `max_wait_ms` at most
+ * Returns {position, height, at_bottom}
+ */
+var anchors = arguments[0];
+var quietMs = arguments[1];
+var maxWaitMs = arguments[2];
+var expanders = arguments[3] || [];
+var done = arguments[arguments.length - 1];
+
+// count in flight fetch / xhr requests, installed once per page
+if (window.__scraperPendingRequests === undefined) {
+    window.__scraperPendingRequests = 0;
+    var track = function (promise) {
+        window.__scraperPendingRequests++;
+        var settle = function () { window.__scraperPendingRequests--; };
+        promise.then(settle, settle);
+        return promise;
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            return track(fetch.apply(this, arguments));
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        var result = send.apply(this, arguments);
+        // loadend fires asynchronously, after this listener is added
+        track(new Promise(function (resolve) {
+            xhr.addEventListener('loadend', resolve);
+        }));
+        return result;
+    };
+}
+
+expanders.forEach(function (selector) {
+    document.querySelectorAll(selector).forEach(function (element) {
+        try {
+            element.click();
+        } catch (e) {
+            // detached while expanding another section
+        }
+    });
+});
+
+var viewportTop = window.scrollY;
+var target = viewportTop + window.innerHeight;
+anchors.forEach(function (selector) {
+    var element = document.querySelector(selector);
+    if (!element) {
+        return;
+    }
+    var top = element.getBoundingClientRect().top + viewportTop;
+    if (top > viewportTop + 1 && top < target) {
+        target = top;
+    }
+});
+
+var lastMutation = Date.now();
+var observer = new MutationObserver(function () {
+    lastMutation = Date.now();
+});
+observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+
+window.scrollTo(0, Math.min(target, document.body.scrollHeight));
+
+var start = Date.now();
+(function poll() {
+    var now = Date.now();
+    var settled = now - lastMutation >= quietMs && window.__scraperPendingRequests <= 0;
+    if (!settled && now - start < maxWaitMs) {
+        setTimeout(poll, 50);
+        return;
+    }
+    observer.disconnect();
+    var height = document.body.scrollHeight;
+    done({
+        position: window.scrollY,
+        height: height,
+        at_bottom: window.scrollY + window.innerHeight >= height - 2
+    });
+})();
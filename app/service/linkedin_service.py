@@ -1,5 +1,28 @@
-from app.main import ProfileScraper, SearchScraper
+from flask import current_app as flask_app
+
+from app.main import ProfileScraper, SearchScraper, HttpProfileScraper, HttpSearchScraper
 from app.utils.fs import log_to_file
+from app.utils.scrape_util import normalize_url
+
+# scraper backend(`*_SCRAPER` config) -> scraper class
+PROFILE_SCRAPERS = {
+    'browser': ProfileScraper,
+    'http': HttpProfileScraper,
+}
+SEARCH_SCRAPERS = {
+    'browser': SearchScraper,
+    'http': HttpSearchScraper,
+}
+
+
+def get_profile_scraper(config_key):
+    """Profile scraper class of the backend set in `config_key`(browser if unknown)"""
+    return PROFILE_SCRAPERS.get(flask_app.config[config_key], ProfileScraper)
+
+
+def get_search_scraper(config_key):
+    """Search scraper class of the backend set in `config_key`(browser if unknown)"""
+    return SEARCH_SCRAPERS.get(flask_app.config[config_key], SearchScraper)
 
 
 def scrape_user(url):
@@ -7,7 +30,7 @@ def scrape_user(url):
     Run scraper to scrape a user
     Returns None / User data
     """
-    with ProfileScraper() as scraper:
+    with get_profile_scraper('REGISTRATION_SCRAPER')() as scraper:
         profile = scraper.scrape(user=url)
         if not profile:
             return None
@@ -17,6 +40,9 @@ def scrape_user(url):
             personal_info = scraped["personal_info"]
             if not "url" in personal_info:
                 return None
+            # read from the contact info, unless skipped(`CONTACT_INFO`)
+            if not personal_info["url"] and '/in/' in url:
+                personal_info["url"] = normalize_url(url)
 
         # write to local storage
         log_to_file(scraped)
@@ -31,7 +57,7 @@ def scrape_search_results(keywords=[]):
     Run scraper to search with keywords & scrape search results
     Returns None / Search data
     """
-    with SearchScraper() as scraper:
+    with get_search_scraper('SEARCH_SCRAPER')() as scraper:
         scraped = scraper.search(keywords)
 
         return scraped
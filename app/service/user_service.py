@@ -7,17 +7,53 @@ User Service class: This class handles all the logic relating to the user model.
 """
 
 
-def save_user(user_info, new_user=False):
+def clear_user_profile(user, websites=True):
     """
-    Stores parsed user data
+    Deletes the scraped associations of `user`, before saving them again
+    Returns void
+    """
+    for items in [user.certifications, user.courses, user.honors, user.languages,
+                  user.organizations, user.patents, user.projects, user.publications,
+                  user.text_scores, user.volunteering]:
+        for item in items:
+            db.session.delete(item)
+    if websites:
+        for website in user.websites:
+            db.session.delete(website)
+    for items in [user.jobs, user.education_history, user.interests, user.skills]:
+        for item in items.all():
+            db.session.delete(item)
+    db.session.flush()
+    # reload the emptied collections
+    db.session.expire(user)
+
+
+def save_user(user_info, new_user=False, user=None):
+    """
+    Stores parsed user data, updates `user` with it if given(its associations
+    are saved again, contact info only if scraped)
     Returns `id`(public_id) of saved user
     """
     personal_info = user_info["personal_info"]
-    personal_info["signedup"] = new_user
-    """Create user"""
-    user = User()
-    user.from_dict(personal_info)
-    db.session.add(user)
+    if user:
+        """Update user"""
+        if not new_user:
+            # a signed up user stays signed up
+            personal_info.pop("signedup", None)
+        else:
+            personal_info["signedup"] = new_user
+        # skipped contact info(`CONTACT_INFO`) keeps the saved one
+        for field in ['email', 'phone']:
+            if not personal_info.get(field):
+                personal_info.pop(field, None)
+        clear_user_profile(user, websites=bool(personal_info["websites"]))
+        user.from_dict(personal_info)
+    else:
+        personal_info["signedup"] = new_user
+        """Create user"""
+        user = User()
+        user.from_dict(personal_info)
+        db.session.add(user)
     # Writes out all pending object actions to the database
     db.session.flush()
 
@@ -247,6 +283,28 @@ def save_user(user_info, new_user=False):
     return user.public_id
 
 
+def save_contact_info(user, personal_info):
+    """
+    Stores contact info scraped after the profile(`CONTACT_INFO=deferred`)
+    Returns void
+    """
+    for field in ['email', 'phone']:
+        if personal_info.get(field):
+            setattr(user, field, personal_info[field])
+
+    """Create missing website association"""
+    known_websites = [website.url for website in user.websites]
+    for _website in personal_info.get("websites") or []:
+        if _website in known_websites:
+            continue
+        website = Website()
+        data = {'url': _website, 'user_id': user.id}
+        website.from_dict(data)
+        db.session.add(website)
+        user.add_website(website)
+    db.session.commit()
+
+
 def get_current_user_by_id(user_public_id):
     """Search user by public_id & Return user"""
     user = User.query.filter_by(public_id=user_public_id).first()
@@ -1,22 +1,192 @@
+from collections import deque
+import uuid
+import time
+from celery import chord
+from celery.exceptions import SoftTimeLimitExceeded
 from celery.utils.log import get_task_logger
+from flask import current_app as flask_app
 from sqlalchemy.exc import SQLAlchemyError
 
-from .service.user_service import save_user, get_current_user_by_id, get_top_skills_keyword_text, save_search_result
-from .service.linkedin_service import scrape_user, scrape_search_results
+from .service.user_service import save_user, get_current_user_by_id, get_current_user_by_url, get_top_skills_keyword_text, save_search_result, save_contact_info
+from .service.linkedin_service import scrape_user, scrape_search_results, get_profile_scraper
 from app.models import UserRecommendation
+from app.utils.parse_util import ParsePool, ParsedResult
+from app.utils.cursor_util import BatchCursor
+from app.utils.flight_util import ScrapeFlights
+from app.utils.scrape_util import normalize_url
 from app.utils.fs import log_to_file
-from app.main import ProfileScraper
 from app.extensions import db
 from app import celery
+from config import Config
 
 celery_logger = get_task_logger(__name__)
 
+# result of `scrape_search_result_profile` for a profile scraped for another user
+IN_FLIGHT = 'in_flight'
 
-@celery.task(bind=True, max_retries=3)
+
+def recommend(user, search_result, recommended_user):
+    """Recommend `recommended_user` to `user`, the search result is scraped"""
+    # ToDo: skip if already recommended
+    recommendation = UserRecommendation()
+    data = {
+        'recommended_for_id': user.id,
+        'recommended_for': user,
+        'recommended_id': recommended_user.id,
+        'recommended': recommended_user,
+    }
+    recommendation.from_dict(data)
+    db.session.add(recommendation)
+    # Update `scraped` flag in `search_result_person`
+    search_result.set_scraped()
+
+
+def save_recommendation(user, search_result, scraped):
+    """
+    Save a scraped search result profile & recommend it to `user`
+    (the saved user if already saved meanwhile)
+    Returns public id of the saved profile, None if not saved
+    """
+    if not scraped or "personal_info" not in scraped:
+        return None
+
+    personal_info = scraped["personal_info"]
+    if not "url" in personal_info:
+        return None
+    # read from the contact info, unless skipped(`CONTACT_INFO`)
+    if not personal_info["url"]:
+        personal_info["url"] = normalize_url(search_result.url)
+
+    try:
+        log_to_file(scraped)
+        recommended_user = get_current_user_by_url(personal_info["url"])
+        if not recommended_user:
+            # save new user to DB
+            recommended_user = get_current_user_by_id(save_user(scraped))
+        recommend(user, search_result, recommended_user)
+        db.session.commit()
+        return recommended_user.public_id
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        celery_logger.error(e)
+    except Exception as e:
+        celery_logger.error(e)
+        # self.retry(countdown=20)
+
+    return None
+
+
+def recommend_saved(user, search_result):
+    """
+    Recommend the profile of `search_result` to `user` without scraping it,
+    if saved already(scraped for another user)
+    Returns True if recommended
+    """
+    if '/in/' not in search_result.url:
+        return False
+
+    try:
+        recommended_user = get_current_user_by_url(
+            normalize_url(search_result.url))
+        if not recommended_user:
+            return False
+        recommend(user, search_result, recommended_user)
+        db.session.commit()
+        return True
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        celery_logger.error(e)
+
+    return False
+
+
+def recommend_in_flight(user, search_results, flights, timeout=None):
+    """
+    Wait for the profiles of `search_results` being scraped for other users
+    (`timeout` seconds, `SCRAPE_FLIGHT_WAIT` by default) & recommend the
+    saved ones to `user`
+    Returns number of profiles recommended
+    """
+    landed = set(flights.wait(
+        [search_result.url for search_result in search_results], timeout))
+    recommended = sum(1 for search_result in search_results
+                      if search_result.url in landed and recommend_saved(user, search_result))
+    flights.count(hits=recommended)
+
+    return recommended
+
+
+def defer_contact_info(user_public_ids):
+    """Queue `scrape_contact_info` for saved profiles, if deferred(`CONTACT_INFO`)"""
+    if user_public_ids and flask_app.config["CONTACT_INFO"] == 'deferred':
+        scrape_contact_info.delay(
+            [str(public_id) for public_id in user_public_ids])
+
+
+def dispatch_profiles(user, user_public_id):
+    """
+    Claim the next unscraped search results of `user`(`PROFILE_FANOUT` at
+    most) & scrape each of them in its own task, `save_scraped_profiles`
+    saves them once they are all done & dispatches the next ones
+    Returns number of profiles dispatched(none without a working cursor store)
+    """
+    cursor = BatchCursor(user_public_id)
+    done = cursor.done()
+    flights = ScrapeFlights()
+
+    urls = []
+    for result in user.get_unscraped_results():
+        url = result.search_result.url
+        if result.search_result.scraped or url in done or url in urls:
+            continue
+        if recommend_saved(user, result.search_result):
+            flights.count(hits=1)
+            continue
+        urls.append(url)
+        if len(urls) >= flask_app.config["PROFILE_FANOUT"]:
+            break
+
+    # claimed by a concurrent dispatch in the meantime otherwise
+    urls = cursor.claim(urls)
+    if not urls:
+        # every result was handed out, the next run starts over the failed ones
+        cursor.clear()
+        return 0
+
+    celery_logger.info('dispatching {0} profiles'.format(len(urls)))
+    # owner of the scrape flights claimed by the profile tasks
+    token = uuid.uuid4().hex
+    chord([scrape_search_result_profile.s(url, token) for url in urls])(
+        save_scraped_profiles.s(user_public_id, urls, token))
+
+    return len(urls)
+
+
+@celery.task(bind=True, max_retries=3,
+             soft_time_limit=Config.PROFILE_TASK_SOFT_TIME_LIMIT or None,
+             time_limit=Config.PROFILE_TASK_TIME_LIMIT or None)
 def scrape_search_result_profiles(self, current_user_public_id):
     """
     Task #3
     Scrapes search result profiles(tied with a user)
+
+    Profiles are loaded in several browser tabs(`PROFILE_TABS`) and parsed in
+    a pool of parse workers(`PARSE_WORKERS`) while the browser loads the next
+    ones, parsed profiles are then saved here
+    (with `PROFILE_EXTRACTION=script` profiles come out of the browser parsed)
+    The contact info of the saved profiles is scraped afterwards when
+    deferred(`CONTACT_INFO`)
+
+    A batch reaching its soft time limit(`PROFILE_TASK_SOFT_TIME_LIMIT`)
+    stops and is retried, resuming after the profiles it handed to the
+    scraper(`BatchCursor`), the hard limit kills a hung one
+
+    Profiles already saved, or being scraped for another user(`ScrapeFlights`),
+    are recommended without loading them again
+
+    With `PROFILE_FANOUT`(and a cursor store) profiles are instead scraped in
+    their own tasks across the workers, this task only dispatches the first
+    ones(see `dispatch_profiles`)
     """
     if not current_user_public_id:
         return
@@ -29,73 +199,218 @@ def scrape_search_result_profiles(self, current_user_public_id):
     if not user:
         return
 
+    if flask_app.config["PROFILE_FANOUT"] > 0:
+        if BatchCursor(current_user_public_id).enabled:
+            dispatch_profiles(user, current_user_public_id)
+            return
+        # the dispatched urls are tracked in the cursor store
+        celery_logger.warning(
+            'PROFILE_FANOUT needs BATCH_CURSOR_REDIS_URL, scraping in this task')
+
     # ToDo(fix): filter out results(now returns all)
     filtered_results = user.get_unscraped_results()
+    # public ids of the saved profiles
+    saved = []
+    cursor = BatchCursor(current_user_public_id)
+    done = cursor.done()
+    flights = ScrapeFlights()
+    # urls claimed here until saved / search results scraped for other users
+    claimed = set()
+    in_flight = []
+    started = time.monotonic()
+    interrupted = False
 
     try:
-        with ProfileScraper() as scraper:
-            # Iterate and scrape each user
+        with get_profile_scraper('PROFILES_SCRAPER')() as scraper, ParsePool() as parse_pool:
             scrape_count = 0
-            for result in filtered_results:
-                search_result = result.search_result
-                """
-                Temporary workaround to skill scraping already scraped results
-                """
-                if search_result.scraped:
-                    continue
+            # (search_result, parse result) of profiles being parsed, in order
+            pending = deque()
 
-                if (scrape_count >= SCRAPE_USERS_IN_SINGLE_RUN_LIMIT):
-                    break
+            def save_parsed(block=False):
+                """Save the parsed profiles(wait for all of them if `block`)"""
+                nonlocal scrape_count
+                while pending and (block or pending[0][1].ready()):
+                    search_result, parsed = pending.popleft()
+                    try:
+                        scraped = parsed.get()
+                    except SoftTimeLimitExceeded:
+                        raise
+                    except Exception as e:
+                        celery_logger.error(e)
+                        continue
+                    public_id = save_recommendation(
+                        user, search_result, scraped)
+                    flights.release(search_result.url)
+                    claimed.discard(search_result.url)
+                    if public_id:
+                        scrape_count += 1
+                        saved.append(public_id)
 
-                celery_logger.info('scraping {0}'.format(search_result.url))
+            # vanity url -> search result of the profiles handed to the scraper
+            search_results = {}
 
-                try:
-                    # Visit user with vanity url
-                    profile = scraper.scrape(user=search_result.url)
-                    if not profile:
+            def next_profiles():
+                """Yields the urls of the results to scrape, until the limit is reached"""
+                nonlocal interrupted
+                for result in filtered_results:
+                    search_result = result.search_result
+                    """
+                    Temporary workaround to skill scraping already scraped results
+                    """
+                    if search_result.scraped or search_result.url in done:
                         continue
+                    # the time limit was caught by a page load, stop here
+                    if Config.PROFILE_TASK_SOFT_TIME_LIMIT and \
+                            time.monotonic() - started >= Config.PROFILE_TASK_SOFT_TIME_LIMIT:
+                        interrupted = True
+                        break
 
-                    scraped = profile.to_dict()
-                    if scraped and "personal_info" in scraped:
-                        personal_info = scraped["personal_info"]
-                        if not "url" in personal_info:
-                            continue
+                    save_parsed()
+                    # wait for in flight profiles that could reach the limit
+                    while pending and scrape_count + len(pending) + len(scraper.loading_tabs) >= SCRAPE_USERS_IN_SINGLE_RUN_LIMIT:
+                        pending[0][1].wait()
+                        save_parsed()
+                    if (scrape_count + len(scraper.loading_tabs) >= SCRAPE_USERS_IN_SINGLE_RUN_LIMIT):
+                        break
 
-                        try:
-                            log_to_file(scraped)
-                            # save new user to DB
-                            new_user_public_id = save_user(scraped)
-                            recommended_user = get_current_user_by_id(
-                                new_user_public_id)
-                            # ToDo: skip if already recommended
-                            recommendation = UserRecommendation()
-                            data = {
-                                'recommended_for_id': user.id,
-                                'recommended_for': user,
-                                'recommended_id': recommended_user.id,
-                                'recommended': recommended_user,
-                            }
-                            recommendation.from_dict(data)
-                            db.session.add(recommendation)
-                            # Update `scraped` flag in `search_result_person`
-                            search_result.set_scraped()
-                            db.session.commit()
-                            scrape_count += 1
-                        except SQLAlchemyError as e:
-                            db.session.rollback()
-                            celery_logger.error(e)
-                            continue
-                        except Exception as e:
-                            celery_logger.error(e)
+                    if recommend_saved(user, search_result):
+                        flights.count(hits=1)
+                        continue
+                    if not flights.claim(search_result.url):
+                        in_flight.append(search_result)
+                        continue
+                    claimed.add(search_result.url)
+                    flights.count(misses=1)
+
+                    celery_logger.info('scraping {0}'.format(search_result.url))
+                    search_results[search_result.url] = search_result
+                    cursor.add(search_result.url)
+                    yield search_result.url
+
+            # Visit users with vanity url, in several tabs(`PROFILE_TABS`)
+            for url in scraper.iter_loaded_profiles(next_profiles()):
+                search_result = search_results.pop(url)
+                try:
+                    if scraper.extraction in ('script', 'network'):
+                        # extracted in the browser, nothing left to parse
+                        profile = scraper.get_profile()
+                        if not profile:
                             continue
-                            # self.retry(countdown=20)
+
+                        pending.append(
+                            (search_result, ParsedResult(profile.to_dict)))
+                        continue
+
+                    html = scraper.get_profile_html()
+                    if not html:
+                        continue
+
+                    pending.append((search_result, parse_pool.submit(html)))
+                except SoftTimeLimitExceeded:
+                    raise
                 except:
                     celery_logger.error(
                         'Something went wrong while scraping user')
                     continue
+
+            save_parsed(block=True)
+
+        recommend_in_flight(user, in_flight, flights)
+        if not interrupted:
+            cursor.clear()
+    except SoftTimeLimitExceeded:
+        celery_logger.warning('Profile batch reached its time limit')
+        interrupted = True
     except:
         celery_logger.error('Something went wrong')
         return
+    finally:
+        # profiles that failed, waiting scrapers can go on
+        for url in claimed:
+            flights.release(url)
+        defer_contact_info(saved)
+
+    if interrupted:
+        # resume after the profiles handed out so far
+        raise self.retry(countdown=5)
+
+
+@celery.task(bind=True)
+def scrape_search_result_profile(self, url, token=None):
+    """
+    Task #5
+    Scrapes a search result profile, dispatched by `dispatch_profiles`
+    Returns the scraped profile, None if it couldn't be scraped, `IN_FLIGHT`
+    if it is being scraped for another user(never fails, the profiles are
+    saved once all the dispatched ones are done)
+    The scrape flight of the profile stays claimed(by `token`) until saved
+    """
+    flights = ScrapeFlights(token)
+    if not flights.claim(url):
+        return IN_FLIGHT
+    flights.count(misses=1)
+    celery_logger.info('scraping {0}'.format(url))
+
+    try:
+        with get_profile_scraper('PROFILES_SCRAPER')() as scraper:
+            profile = scraper.scrape(user=url)
+            if profile:
+                return profile.to_dict()
+    except:
+        celery_logger.error('Something went wrong while scraping user')
+
+    flights.release(url)
+    return None
+
+
+@celery.task(bind=True, max_retries=3)
+def save_scraped_profiles(self, scraped_profiles, user_public_id, urls, token=None):
+    """
+    Task #6
+    Saves & recommends the profiles scraped by `scrape_search_result_profile`
+    (in the order of `urls`) to the user, then dispatches the next ones until
+    every search result was handed out or a whole batch failed
+    The profiles being scraped for other users are recommended if saved
+    already, handed out again to the next batch otherwise(not waited for,
+    that would hold up a worker)
+    """
+    user = get_current_user_by_id(user_public_id)
+    if not user:
+        return
+
+    flights = ScrapeFlights(token)
+    cursor = BatchCursor(user_public_id)
+    search_results = {result.search_result.url: result.search_result
+                      for result in user.get_unscraped_results()}
+    # public ids of the saved profiles
+    saved = []
+    in_flight = []
+    recommended = 0
+    try:
+        for url, scraped in zip(urls, scraped_profiles):
+            search_result = search_results.get(url)
+            if search_result and scraped == IN_FLIGHT:
+                in_flight.append(search_result)
+            elif search_result:
+                public_id = save_recommendation(user, search_result, scraped)
+                if public_id:
+                    saved.append(public_id)
+            flights.release(url)
+
+        recommended = recommend_in_flight(user, in_flight, flights, timeout=0)
+        cursor.unclaim([search_result.url for search_result in in_flight
+                        if not search_result.scraped])
+    finally:
+        defer_contact_info(saved)
+
+    if saved or recommended:
+        dispatch_profiles(user, user_public_id)
+    else:
+        # none of them could be scraped, the next run starts over
+        celery_logger.warning('No profile saved, stopping the dispatch')
+        cursor.clear()
+
+    return len(saved)
 
 
 @celery.task(bind=True, max_retries=3)
@@ -167,6 +482,7 @@ def scrape_and_store_user(self, url):
     if scraped:
         try:
             user_public_id = save_user(scraped, True)
+            defer_contact_info([user_public_id])
             return user_public_id
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -174,3 +490,33 @@ def scrape_and_store_user(self, url):
         except Exception as e:
             celery_logger.error(e)
             self.retry(countdown=20)
+
+
+@celery.task(bind=True, max_retries=3)
+def scrape_contact_info(self, user_public_ids):
+    """
+    Task #4
+    Scrapes & saves the contact info(email, phone, websites) of saved users,
+    skipped while scraping their profile(`CONTACT_INFO=deferred`)
+    """
+    celery_logger.warning('Executing contact info task for {0} users'.format(
+        len(user_public_ids)))
+
+    try:
+        with get_profile_scraper('PROFILES_SCRAPER')() as scraper:
+            for user_public_id in user_public_ids:
+                user = get_current_user_by_id(user_public_id)
+                if not user or not user.url:
+                    continue
+
+                personal_info = scraper.scrape_contact_info(user.url)
+                if not personal_info:
+                    continue
+
+                try:
+                    save_contact_info(user, personal_info)
+                except SQLAlchemyError as e:
+                    db.session.rollback()
+                    celery_logger.error(e)
+    except:
+        celery_logger.error('Something went wrong')
@@ -0,0 +1,119 @@
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import os
+
+import zstandard
+
+from app.utils.scrape_util import normalize_url
+from config import Config
+
+"""
+Content addressed archive of the raw html fetched by the scrapers,
+so pages can be re-parsed after a parser fix without scraping them again
+
+Layout(under `HTML_ARCHIVE_PATH`):
+    - objects/<sha[:2]>/<sha>.html.zst : zstd compressed page, stored once per content
+    - index.jsonl : one line per fetch {url, kind, fetched_at, sha256, size}
+"""
+
+
+def canonical_url(url):
+    """
+    `/in/name` for profile urls(whatever the page of the profile, e.g. its
+    contact info overlay, & query string), the url without its fragment otherwise
+    """
+    if '/in/' in url:
+        return normalize_url(url)
+
+    return url.split('#')[0]
+
+
+class HtmlArchive(object):
+
+    def __init__(self, path=None, level=None):
+        self.path = Path(path or Config.HTML_ARCHIVE_PATH)
+        self.level = level or Config.HTML_ARCHIVE_LEVEL
+        self.index_path = self.path / 'index.jsonl'
+
+    def object_path(self, sha):
+        return self.path / 'objects' / sha[:2] / '{0}.html.zst'.format(sha)
+
+    def put(self, url, kind, html, fetched_at=None):
+        """
+        Store `html` fetched from `url`
+        Returns sha256 of the page
+        """
+        data = html.encode('utf-8')
+        sha = hashlib.sha256(data).hexdigest()
+
+        object_path = self.object_path(sha)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = zstandard.ZstdCompressor(
+                level=self.level).compress(data)
+            # write then rename, so readers never see a partial page
+            tmp_path = object_path.with_suffix('.tmp{0}'.format(os.getpid()))
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, object_path)
+
+        entry = {
+            'url': canonical_url(url),
+            'kind': kind,
+            'fetched_at': (fetched_at or datetime.utcnow()).isoformat(),
+            'sha256': sha,
+            'size': len(data),
+        }
+        # single line appends, safe with concurrent workers
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, sort_keys=True) + '\n')
+
+        return sha
+
+    def get(self, sha):
+        """Returns archived html for `sha`"""
+        compressed = self.object_path(sha).read_bytes()
+        return zstandard.ZstdDecompressor().decompress(compressed).decode('utf-8')
+
+    def entries(self, kind=None):
+        """Yields index entries, oldest first"""
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if kind is None or entry['kind'] == kind:
+                    yield entry
+
+    def latest(self, kind=None):
+        """Returns dict of url -> latest index entry"""
+        latest = {}
+        for entry in self.entries(kind):
+            # indexed before urls were fully canonical
+            url = canonical_url(entry['url'])
+            current = latest.get(url)
+            if not current or entry['fetched_at'] >= current['fetched_at']:
+                latest[url] = dict(entry, url=url)
+
+        return latest
+
+
+def archive_page(kind, url, html):
+    """
+    Store a fetched page in the archive, if enabled(`HTML_ARCHIVE_PATH`)
+    Never raises, archiving must not break scraping
+    """
+    if not Config.HTML_ARCHIVE_PATH or not html:
+        return None
+
+    try:
+        return HtmlArchive().put(url, kind, html)
+    except Exception as err:
+        print(err)
+        print("Error: Archiving {0} page failed".format(kind))
+
+    return None
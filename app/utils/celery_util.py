@@ -1,5 +1,38 @@
+from kombu import Queue
+
+"""
+Queues of the tasks, a worker consumes all of them unless given some(`-Q`),
+so each can get its own pool of workers:
+    - registration : profile of a new user
+    - search : search results of a user
+    - profile_scrape : profiles of the search results(batches or fanned out) & contact info
+    - persistence : saving fanned out profiles
+Tasks not routed here go to the default queue
+"""
+TASK_ROUTES = {
+    'app.tasks.scrape_and_store_user': {'queue': 'registration'},
+    'app.tasks.search_and_store_results': {'queue': 'search'},
+    'app.tasks.scrape_search_result_profiles': {'queue': 'profile_scrape'},
+    'app.tasks.scrape_search_result_profile': {'queue': 'profile_scrape'},
+    'app.tasks.scrape_contact_info': {'queue': 'profile_scrape'},
+    'app.tasks.save_scraped_profiles': {'queue': 'persistence'},
+}
+TASK_QUEUES = ['registration', 'search', 'profile_scrape', 'persistence']
+
+
 def init_celery(flask_app, celery):
     celery.conf.update(flask_app.config)
+    celery.conf.update(
+        task_queues=[Queue(name) for name in
+                     [celery.conf.task_default_queue] + TASK_QUEUES],
+        task_routes=TASK_ROUTES,
+        # tasks queued by a task(rest of a chain, fan out, retry...) keep its
+        # priority(`SIGNUP_TASK_PRIORITY` / `BACKGROUND_TASK_PRIORITY`)
+        task_inherit_parent_priority=True,
+        # workers only reserve the task they run, so a higher priority one
+        # queued meanwhile goes next
+        worker_prefetch_multiplier=1,
+    )
     TaskBase = celery.Task
 
     class ContextTask(TaskBase):
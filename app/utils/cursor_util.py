@@ -0,0 +1,103 @@
+import redis
+
+from config import Config
+
+"""
+Progress of the profile batches(`scrape_search_result_profiles`), the urls
+handed to the scraper are saved as the batch goes, so a batch interrupted by
+its time limit, a crash or a worker restart resumes after them instead of
+starting over, a profile crashing the browser is not loaded again either
+The profiles dispatched to their own tasks(`PROFILE_FANOUT`) are claimed
+here as well, so the next dispatch skips the ones in flight
+
+Stored per user in redis(with a TTL, `BATCH_CURSOR_REDIS_URL`), every method
+here never raises, a broken store only means loading those profiles again
+"""
+
+
+def cursor_key(name):
+    return 'scrape:cursor:{0}'.format(name)
+
+
+class BatchCursor(object):
+
+    def __init__(self, name, url=None, ttl=None):
+        self.key = cursor_key(name)
+        self.ttl = ttl or Config.BATCH_CURSOR_TTL
+        url = url or Config.BATCH_CURSOR_REDIS_URL
+        self.redis = redis.Redis.from_url(url) if url else None
+
+    @property
+    def enabled(self):
+        return self.redis is not None
+
+    def done(self):
+        """Returns set of the urls handed out by previous runs"""
+        if not self.redis:
+            return set()
+
+        try:
+            return {url.decode('utf-8') for url in self.redis.smembers(self.key)}
+        except Exception as e:
+            print(e)
+            print('Error: Loading batch cursor failed')
+
+        return set()
+
+    def add(self, url):
+        if not self.redis:
+            return
+
+        try:
+            pipeline = self.redis.pipeline()
+            pipeline.sadd(self.key, url)
+            pipeline.expire(self.key, self.ttl)
+            pipeline.execute()
+        except Exception as e:
+            print(e)
+            print('Error: Saving batch cursor failed')
+
+    def claim(self, urls):
+        """
+        Hand out `urls` not handed out yet, atomically so concurrent
+        dispatchers never share one
+        Returns list of the urls claimed, none without a working store(the
+        urls couldn't be marked handed out, dispatching them again & again)
+        """
+        if not self.redis or not urls:
+            return []
+
+        try:
+            pipeline = self.redis.pipeline()
+            for url in urls:
+                pipeline.sadd(self.key, url)
+            pipeline.expire(self.key, self.ttl)
+            added = pipeline.execute()[:-1]
+            return [url for url, new in zip(urls, added) if new]
+        except Exception as e:
+            print(e)
+            print('Error: Claiming batch cursor urls failed')
+
+        return []
+
+    def unclaim(self, urls):
+        """Hand `urls` out again"""
+        if not self.redis or not urls:
+            return
+
+        try:
+            self.redis.srem(self.key, *urls)
+        except Exception as e:
+            print(e)
+            print('Error: Unclaiming batch cursor urls failed')
+
+    def clear(self):
+        """The batch is over, the next one starts from the first url"""
+        if not self.redis:
+            return
+
+        try:
+            self.redis.delete(self.key)
+        except Exception as e:
+            print(e)
+            print('Error: Clearing batch cursor failed')
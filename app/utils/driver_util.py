@@ -0,0 +1,180 @@
+from collections import deque
+import threading
+import os
+
+from billiard.process import current_process
+from celery.signals import worker_process_init, worker_process_shutdown
+from selenium.common.exceptions import WebDriverException
+
+from config import Config
+
+"""
+Pool of WebDriver sessions kept open between the tasks of a celery worker
+process, so tasks reuse a warm, logged in browser instead of starting Chrome
+and logging in again(`DRIVER_POOL_SIZE`, see `Scraper.__init__`)
+
+The pool is created empty when a worker process starts, drivers are created
+(and logged in by the scraper) on first checkout, health checked on each
+checkout / checkin and quit when the worker process shuts down
+
+Scrapers replace their driver once it is dead, has loaded `DRIVER_MAX_PAGES`
+pages or its browser uses `DRIVER_MAX_MEMORY_MB`(see `Scraper.recycle_driver`)
+"""
+
+driver_pool = None
+
+
+def is_alive(driver):
+    """Health check, the session answers and its window is still open"""
+    try:
+        driver.execute_script('return 1')
+        return True
+    except WebDriverException:
+        return False
+
+
+def session_alive(driver):
+    """Health check of the session alone, its current window may be closed"""
+    try:
+        driver.window_handles
+        return True
+    except WebDriverException:
+        return False
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        print(e)
+
+
+def pages_loaded(driver):
+    """Pages loaded by `driver` since it started, across pooled uses"""
+    return getattr(driver, 'pages_loaded', 0)
+
+
+def count_page_load(driver):
+    # kept on the driver itself, pooled drivers outlive their scrapers
+    driver.pages_loaded = pages_loaded(driver) + 1
+
+
+def browser_memory_mb(driver):
+    """
+    Resident memory of the browser processes started by a local driver(MB),
+    read from /proc, so summed shared pages count more than once
+    Returns None if unknown(remote drivers, other platforms)
+    """
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is None or not os.path.isdir('/proc'):
+        return None
+
+    # parent pid -> child pids
+    children = {}
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            with open('/proc/{0}/stat'.format(pid)) as f:
+                # the process name may contain spaces, fields follow its ')'
+                parent = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(pid)
+
+    resident_pages = 0
+    stack = list(children.get(process.pid, []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(int(pid), []))
+        try:
+            with open('/proc/{0}/statm'.format(pid)) as f:
+                resident_pages += int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+
+
+class DriverPool(object):
+
+    def __init__(self, size=None):
+        # idle drivers kept for reuse
+        self.size = Config.DRIVER_POOL_SIZE if size is None else size
+        self.idle = deque()
+        self.lock = threading.Lock()
+        self.closed = False
+        self.created = 0
+        self.reused = 0
+
+    def checkout(self, create_driver):
+        """Returns a healthy idle driver, a new one from `create_driver()` if none"""
+        while True:
+            with self.lock:
+                driver = self.idle.popleft() if self.idle else None
+
+            if driver is None:
+                self.created += 1
+                return create_driver()
+
+            if is_alive(driver):
+                self.reused += 1
+                return driver
+
+            print('Dropping dead pooled driver')
+            quit_driver(driver)
+
+    def checkin(self, driver):
+        """Keep `driver` for the next checkout, quit it if dead or the pool is full"""
+        if is_alive(driver):
+            with self.lock:
+                if not self.closed and len(self.idle) < self.size:
+                    self.idle.append(driver)
+                    return
+
+        quit_driver(driver)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            drivers = list(self.idle)
+            self.idle.clear()
+
+        for driver in drivers:
+            quit_driver(driver)
+        print('Driver pool closed: {0} created, {1} reused'.format(
+            self.created, self.reused))
+
+
+def browser_cache_dir():
+    """
+    Persistent disk cache directory of the browsers started by this process
+    (`BROWSER_CACHE_PATH`), one per celery worker process index so the
+    cache survives worker restarts without being shared between processes
+    Returns None if disabled
+    """
+    if not Config.BROWSER_CACHE_PATH:
+        return None
+
+    index = getattr(current_process(), 'index', None) or 0
+    return os.path.join(Config.BROWSER_CACHE_PATH, str(index))
+
+
+def get_driver_pool():
+    """Pool of the current worker process, None outside celery workers / if disabled"""
+    return driver_pool
+
+
+@worker_process_init.connect
+def init_driver_pool(**kwargs):
+    global driver_pool
+    if Config.DRIVER_POOL_SIZE > 0:
+        driver_pool = DriverPool()
+
+
+@worker_process_shutdown.connect
+def close_driver_pool(**kwargs):
+    global driver_pool
+    if driver_pool:
+        driver_pool.close()
+        driver_pool = None
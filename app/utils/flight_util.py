@@ -0,0 +1,137 @@
+import uuid
+import time
+
+import redis
+
+from app.utils.archive_util import canonical_url
+from config import Config
+
+"""
+Single flight registry of the profile scrapes, shared by every worker, so a
+profile found by several users' searches is loaded & saved once: a scraper
+claims its url(by canonical url, with a TTL in case it dies) until the profile
+is saved, the others skip it & wait for the claim to go, then recommend the
+saved user instead of loading the page again
+
+Hits(page loads saved) & misses(pages loaded) are counted in redis
+(`SCRAPE_FLIGHT_REDIS_URL`), every method here never raises, a broken store
+only means scraping without deduplication
+"""
+
+STATS_KEY = 'scrape:flight:stats'
+
+
+def flight_key(url):
+    return 'scrape:flight:{0}'.format(canonical_url(url))
+
+
+class ScrapeFlights(object):
+
+    def __init__(self, token=None, url=None, ttl=None):
+        self.ttl = ttl or Config.SCRAPE_FLIGHT_TTL
+        url = url if url is not None else Config.SCRAPE_FLIGHT_REDIS_URL
+        self.redis = redis.Redis.from_url(url) if url else None
+        # a claim is only released by its owner(shared by the tasks of a
+        # fan out, the profiles are claimed & saved in different tasks)
+        self.token = token or uuid.uuid4().hex
+
+    def claim(self, url):
+        """
+        Returns True if the profile at `url` is to be scraped here,
+        False if it is being scraped elsewhere
+        """
+        if not self.redis:
+            return True
+
+        try:
+            return bool(self.redis.set(flight_key(url), self.token,
+                                       nx=True, ex=self.ttl))
+        except Exception as e:
+            print(e)
+            print('Error: Claiming scrape flight failed')
+
+        return True
+
+    def release(self, url):
+        """The profile is saved(or failed), waiting scrapers can go on"""
+        if not self.redis:
+            return
+
+        key = flight_key(url)
+        try:
+            # not someone else's claim, after ours expired
+            if self.redis.get(key) == self.token.encode('utf-8'):
+                self.redis.delete(key)
+        except Exception as e:
+            print(e)
+            print('Error: Releasing scrape flight failed')
+
+    def wait(self, urls, timeout=None, interval=1.0):
+        """
+        Wait for the scrapes of `urls` in flight elsewhere, `timeout` seconds
+        at most(`SCRAPE_FLIGHT_WAIT`)
+        Returns list of the urls whose scrape is over
+        """
+        if not self.redis or not urls:
+            return list(urls)
+
+        timeout = Config.SCRAPE_FLIGHT_WAIT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waiting = list(urls)
+        landed = []
+        try:
+            while waiting:
+                pipeline = self.redis.pipeline()
+                for url in waiting:
+                    pipeline.exists(flight_key(url))
+                in_flight = pipeline.execute()
+                landed.extend(url for url, flying in zip(
+                    waiting, in_flight) if not flying)
+                waiting = [url for url, flying in zip(
+                    waiting, in_flight) if flying]
+                if not waiting or time.monotonic() >= deadline:
+                    break
+                time.sleep(interval)
+        except Exception as e:
+            print(e)
+            print('Error: Waiting for scrape flights failed')
+
+        return landed
+
+    def count(self, hits=0, misses=0):
+        if not self.redis or not (hits or misses):
+            return
+
+        try:
+            pipeline = self.redis.pipeline()
+            pipeline.hincrby(STATS_KEY, 'hits', hits)
+            pipeline.hincrby(STATS_KEY, 'misses', misses)
+            pipeline.execute()
+        except Exception as e:
+            print(e)
+            print('Error: Counting scrape flights failed')
+
+    def stats(self):
+        """Returns dict of hits(page loads saved) & misses(pages loaded)"""
+        stats = {'hits': 0, 'misses': 0}
+        if not self.redis:
+            return stats
+
+        try:
+            for key, value in self.redis.hgetall(STATS_KEY).items():
+                stats[key.decode('utf-8')] = int(value)
+        except Exception as e:
+            print(e)
+            print('Error: Loading scrape flight stats failed')
+
+        return stats
+
+    def reset_stats(self):
+        if not self.redis:
+            return
+
+        try:
+            self.redis.delete(STATS_KEY)
+        except Exception as e:
+            print(e)
+            print('Error: Resetting scrape flight stats failed')
@@ -0,0 +1,75 @@
+import billiard
+
+from app.main import Profile
+from config import Config
+
+
+def parse_profile(html):
+    """
+    Parse raw profile html(see `ProfileScraper.scrape_html`)
+    Runs inside the parse workers
+    Returns `Profile.to_dict()` / None
+    """
+    if not html:
+        return None
+
+    return Profile(html).to_dict()
+
+
+class ParsedResult(object):
+    """Already computed result with the same api as a pool's AsyncResult"""
+
+    def __init__(self, fn, *args):
+        self.value = None
+        self.error = None
+        try:
+            self.value = fn(*args)
+        except Exception as e:
+            self.error = e
+
+    def ready(self):
+        return True
+
+    def wait(self, timeout=None):
+        pass
+
+    def get(self, timeout=None):
+        if self.error:
+            raise self.error
+        return self.value
+
+
+class ParsePool(object):
+    """
+    Pool of parse worker processes, so the scraper can load the next page
+    while the previous ones are parsed
+
+    billiard(shipped with celery) is used as celery's prefork workers are
+    daemonic processes, which `multiprocessing` doesn't allow to have children
+    With `workers=0` pages are parsed inline
+    """
+
+    def __init__(self, workers=None):
+        self.workers = Config.PARSE_WORKERS if workers is None else workers
+        self.pool = None
+        if self.workers > 0:
+            self.pool = billiard.Pool(processes=self.workers)
+
+    def submit(self, html):
+        """Queue raw profile html for parsing, returns AsyncResult-like object"""
+        if self.pool is None:
+            return ParsedResult(parse_profile, html)
+
+        return self.pool.apply_async(parse_profile, (html,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def close(self):
+        if self.pool:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
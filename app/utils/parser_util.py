@@ -0,0 +1,173 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import Config
+
+"""
+HTML parser backends shared by the `ResultsObject` family (Profile, Search, Pages).
+
+Every backend turns a raw html string into a tree exposing the small subset of
+the BeautifulSoup api the scrape utils rely on:
+`select_one`, `select`, `get_text`, `get` and `element['attr']`
+
+Backends take an optional list of css classes(`parse_only`), when given only
+the elements having one of these classes(and their subtree) are built
+"""
+
+DEFAULT_PARSER = 'html.parser'
+
+PARSER_BACKENDS = {}
+
+
+def register_parser(name):
+    """Register `fn(body, parse_only=None) -> tree` as an html parser backend under `name`"""
+    def decorator(fn):
+        PARSER_BACKENDS[name] = fn
+        return fn
+
+    return decorator
+
+
+def class_strainer(class_names):
+    """SoupStrainer matching elements that have one of `class_names`"""
+    if not class_names:
+        return None
+    class_names = set(class_names)
+
+    def has_class(value):
+        # depending on the bs4 version this gets each class or the whole attribute
+        return value is not None and any(name in class_names for name in value.split())
+
+    return SoupStrainer(class_=has_class)
+
+
+@register_parser('html.parser')
+def parse_with_html_parser(body, parse_only=None):
+    # pure python, always available
+    return BeautifulSoup(body, 'html.parser', parse_only=class_strainer(parse_only))
+
+
+@register_parser('lxml')
+def parse_with_lxml(body, parse_only=None):
+    # same BeautifulSoup tree, built by the libxml2 tree builder
+    return BeautifulSoup(body, 'lxml', parse_only=class_strainer(parse_only))
+
+
+@register_parser('lexbor')
+def parse_with_lexbor(body, parse_only=None):
+    # builds the whole tree in C, `parse_only` is ignored
+    from selectolax.lexbor import LexborHTMLParser
+
+    return LexborElement(LexborHTMLParser(body).root)
+
+
+class LexborElement(object):
+    """
+    Wraps a selectolax(lexbor) node so it can be used
+    in place of a beautifulsoup element
+    """
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select_one(self, selector):
+        node = self.node.css_first(selector)
+        if node is None:
+            return None
+        return LexborElement(node)
+
+    def select(self, selector):
+        return [LexborElement(node) for node in self.node.css(selector)]
+
+    def get_text(self):
+        return self.node.text(deep=True, separator='', strip=False)
+
+    def get(self, key, default=None):
+        attributes = self.node.attributes
+        if key not in attributes:
+            return default
+        # valueless attributes are `None` in selectolax and '' in beautifulsoup
+        value = attributes[key] or ''
+        # beautifulsoup splits `class` into a list
+        if key == 'class':
+            return value.split()
+        return value
+
+    def __getitem__(self, key):
+        if key not in self.node.attributes:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __repr__(self):
+        return '<LexborElement {}>'.format(self.node.tag)
+
+
+def get_parser_name(name=None):
+    """
+    Resolve the backend to use
+    Falls back to `html.parser` if the requested backend is unknown
+    """
+    name = name or Config.HTML_PARSER or DEFAULT_PARSER
+    if name not in PARSER_BACKENDS:
+        print('Unknown html parser "{0}", falling back to {1}'.format(
+            name, DEFAULT_PARSER))
+        return DEFAULT_PARSER
+
+    return name
+
+
+def parse_html(body, parser=None, parse_only=None):
+    """
+    Parse `body` with the configured(`HTML_PARSER`) or requested backend
+    Falls back to `html.parser` if the backend's library is not installed
+    """
+    name = get_parser_name(parser)
+    try:
+        return PARSER_BACKENDS[name](body, parse_only)
+    except ImportError as e:
+        print('{0} parser is unavailable({1}), falling back to {2}'.format(
+            name, e, DEFAULT_PARSER))
+
+    return PARSER_BACKENDS[DEFAULT_PARSER](body, parse_only)
+
+
+def available_parsers():
+    """Returns names of the backends whose libraries are installed"""
+    available = []
+    for name, parse in PARSER_BACKENDS.items():
+        try:
+            parse('<div></div>')
+            available.append(name)
+        except Exception:
+            continue
+
+    return available
+
+
+def compare_parsers(results_class, body, parsers=None, reference=DEFAULT_PARSER):
+    """
+    Parse `body` into `results_class`(Profile/Search/Pages) with each backend,
+    fully and restricted(if the class supports it), and compare `to_dict()`
+    against a full parse with the reference backend
+    Returns dict of parser name -> list of top level keys that differ
+    """
+    parsers = parsers or available_parsers()
+    expected = results_class(
+        body, parser=reference, restricted=False).to_dict()
+
+    modes = [False]
+    if results_class.parse_only_classes:
+        modes.append(True)
+
+    mismatches = {}
+    for name in parsers:
+        for restricted in modes:
+            if name == reference and not restricted:
+                continue
+            actual = results_class(
+                body, parser=name, restricted=restricted).to_dict()
+            label = name + ' restricted' if restricted else name
+            mismatches[label] = [key for key in expected
+                                 if expected[key] != actual.get(key)]
+
+    return mismatches
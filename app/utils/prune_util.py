@@ -0,0 +1,41 @@
+from bs4 import BeautifulSoup
+
+"""
+Heavy markup stripped from scraped pages before their outerHTML is
+transferred from the browser(`PRUNE_HTML`, see `Scraper.get_outer_html`)
+
+`app/main/scripts/prune.js` does it in the page, `prune_html` does the same
+here so the rules can be checked against the recorded pages
+"""
+
+# emptied rather than removed, so `:nth-child` selectors still match the same elements
+PRUNE_SELECTOR = ', '.join([
+    'svg', 'script', 'code', 'style', 'noscript', 'template', 'iframe',
+    '.artdeco-hoverable-content', '.artdeco-toasts', '[hidden]',
+])
+
+# every other attribute(tracking, aria, style, ember ids...) is dropped
+KEEP_ATTRIBUTES = [
+    'class', 'id', 'href', 'src', 'alt', 'title',
+    # read by the selectors of the scrape utils
+    'data-control-name',
+]
+
+
+def prune_html(body):
+    """Returns `body` pruned with the same rules as prune.js"""
+    soup = BeautifulSoup(body, 'html.parser')
+    for element in soup.select(PRUNE_SELECTOR):
+        element.clear()
+    for element in soup.find_all(True):
+        element.attrs = {key: value for key, value in element.attrs.items()
+                         if key in KEEP_ATTRIBUTES}
+
+    return str(soup)
+
+
+def format_savings(original_bytes, pruned_bytes):
+    """`original KB -> pruned KB (-n%)`"""
+    saved = 1 - pruned_bytes / original_bytes if original_bytes else 0
+    return '{0:.1f} KB -> {1:.1f} KB (-{2:.0%})'.format(
+        original_bytes / 1024, pruned_bytes / 1024, saved)
@@ -1,9 +1,15 @@
 import re
+import soupsieve
+from bs4.element import Tag
 
 
 def normalize_url(url):
-    return ''.join(
-        ['/in/', url.split('/in/')[1].split('/?')[0].replace('/', '')])
+    """
+    `/in/name` of a profile url, whatever the page of the profile(e.g. its
+    contact info overlay), query string & fragment
+    """
+    path = url.split('/in/', 1)[1].split('#')[0].split('?')[0]
+    return '/in/' + path.split('/')[0]
 
 
 def normalize_string(str):
@@ -42,20 +48,66 @@ class AnyEC(object):
         return False
 
 
+class Selector(object):
+    """
+    Css selector compiled once with soupsieve
+    BeautifulSoup elements are matched with the compiled selector, other parser
+    backends(see `parser_util`) are handed the selector text
+    """
+    __slots__ = ('pattern', 'compiled')
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.compiled = soupsieve.compile(pattern)
+
+    def select_one(self, element):
+        if isinstance(element, Tag):
+            return self.compiled.select_one(element)
+        return element.select_one(self.pattern)
+
+    def select(self, element):
+        if isinstance(element, Tag):
+            return self.compiled.select(element)
+        return element.select(self.pattern)
+
+    def __repr__(self):
+        return '<Selector {}>'.format(self.pattern)
+
+
+# Registry of compiled selectors, keyed by selector text
+SELECTORS = {}
+
+
+def compile_selector(pattern):
+    """Return the compiled `Selector` for `pattern`, compiling it on first use"""
+    if isinstance(pattern, Selector):
+        return pattern
+
+    compiled = SELECTORS.get(pattern)
+    if compiled is None:
+        compiled = SELECTORS[pattern] = Selector(pattern)
+    return compiled
+
+
+def compile_mapping(mapping):
+    """Compile every selector of a key->css selector dict(see `get_info`)"""
+    return {key: compile_selector(mapping[key]) for key in mapping}
+
+
 def first_or_default(element, selector, default=None):
     """Return the first found element with a given css selector
     Params:
         - element {beautifulsoup element}: element to be searched
-        - selector {str}: css selector to search for
+        - selector {str or Selector}: css selector to search for
         - default {any}: default return value
     Returns:
         beautifulsoup element if match is found, otherwise return the default
     """
     try:
-        el = element.select_one(selector)
+        el = compile_selector(selector).select_one(element)
         if not el:
             return default
-        return element.select_one(selector)
+        return el
     except Exception as e:
         return default
 
@@ -64,7 +116,7 @@ def text_or_default(element, selector, default=None):
     """Same as first_or_default, except it returns stripped text contents of the found element
     """
     try:
-        return element.select_one(selector).get_text().strip()
+        return compile_selector(selector).select_one(element).get_text().strip()
     except Exception as e:
         return default
 
@@ -73,17 +125,17 @@ def all_or_default(element, selector, default=[]):
     """Get all matching elements for a css selector within an element
     Params:
         - element: beautifulsoup element to search
-        - selector: str css selector to search for
+        - selector: str(or Selector) css selector to search for
         - default: default value if there is an error or no elements found
     Returns:
         {list}: list of all matching elements if any are found, otherwise return
         the default value
     """
     try:
-        elements = element.select(selector)
+        elements = compile_selector(selector).select(element)
         if len(elements) == 0:
             return default
-        return element.select(selector)
+        return elements
     except Exception as e:
         return default
 
@@ -92,7 +144,7 @@ def get_info(element, mapping, default=None):
     """Turn beautifulsoup element and key->selector dict into a key->value dict
     Args:
         - element: A beautifulsoup element
-        - mapping: a dictionary mapping key(str)->css selector(str)
+        - mapping: a dictionary mapping key(str)->css selector(str or Selector)
         - default: The defauly value to be given for any key that has a css
         selector that matches no elements
     Returns:
@@ -103,33 +155,89 @@ def get_info(element, mapping, default=None):
     return {key: text_or_default(element, mapping[key], default=default) for key in mapping}
 
 
+"""
+Precompiled selectors & patterns used by the extractors below
+"""
+COMPANY_URL_PATTERN = re.compile('^/company/.*?/$')
+
+POSITION_ELEMENTS_SELECTOR = compile_selector(
+    '.pv-entity__role-details-container')
+COMPANY_LINK_SELECTOR = compile_selector(
+    'a[data-control-name="background_details_company"]')
+MULTIPLE_ROLES_COMPANY_SELECTOR = compile_selector(
+    '.pv-entity__company-summary-info > h3 > span:nth-of-type(2)')
+USER_URL_SELECTOR = compile_selector(
+    'a[data-control-name="search_srp_result"]')
+
+POSITION_INFO_SELECTORS = compile_mapping({
+    'title': '.pv-entity__summary-info-v2 > h3 > span:nth-of-type(2)',
+    'date_range': '.pv-entity__date-range span:nth-of-type(2)',
+    'location': '.pv-entity__location > span:nth-of-type(2)',
+    'description': '.pv-entity__description'
+})
+
+JOB_INFO_SELECTORS = compile_mapping({
+    'title': '.pv-entity__summary-info h3:nth-of-type(1)',
+    'company': '.pv-entity__secondary-title',
+    'date_range': '.pv-entity__date-range span:nth-of-type(2)',
+    'location': '.pv-entity__location span:nth-of-type(2)',
+    'description': '.pv-entity__description',
+})
+
+SCHOOL_INFO_SELECTORS = compile_mapping({
+    'name': '.pv-entity__school-name',
+    'degree': '.pv-entity__degree-name span:nth-of-type(2)',
+    'grades': '.pv-entity__grade span:nth-of-type(2)',
+    'field_of_study': '.pv-entity__fos span:nth-of-type(2)',
+    'date_range': '.pv-entity__dates span:nth-of-type(2)',
+    'activities': '.activities-societies'
+})
+
+VOLUNTEER_INFO_SELECTORS = compile_mapping({
+    'title': '.pv-entity__summary-info h3:nth-of-type(1)',
+    'company': '.pv-entity__secondary-title',
+    'date_range': '.pv-entity__date-range span:nth-of-type(2)',
+    'location': '.pv-entity__location span:nth-of-type(2)',
+    'cause': '.pv-entity__cause span:nth-of-type(2)',
+    'description': '.pv-entity__description'
+})
+
+CERTIFICATION_INFO_SELECTORS = compile_mapping({
+    'title': '.pv-certifications__summary-info h3:nth-of-type(1)',
+    'authority': '.pv-certifications__summary-info p:nth-of-type(1) span:nth-of-type(2)',
+    'date_range': '.pv-certifications__summary-info p:nth-of-type(2) span:nth-of-type(2)'
+})
+
+SKILL_INFO_SELECTORS = compile_mapping({
+    'name': '.pv-skill-category-entity__name',
+    'endorsements': '.pv-skill-category-entity__endorsement-count'
+})
+
+TEST_SCORE_INFO_SELECTORS = compile_mapping({
+    'name': '.pv-accomplishment-entity__title',
+    'score': '.pv-accomplishment-entity__score'
+})
+
+
 def get_job_info(job):
     """
     Returns:
         dict of job's title, company, date_range, location, description
     """
-    position_elements = all_or_default(
-        job, '.pv-entity__role-details-container')
+    position_elements = all_or_default(job, POSITION_ELEMENTS_SELECTOR)
 
     # Handle UI case where user has muttiple consec roles at same company
     if (position_elements):
-        company = text_or_default(job,
-                                  '.pv-entity__company-summary-info > h3 > span:nth-of-type(2)')
+        company = text_or_default(job, MULTIPLE_ROLES_COMPANY_SELECTOR)
 
-        company_href = first_or_default(
-            job, 'a[data-control-name="background_details_company"]')['href']
-        pattern = re.compile('^/company/.*?/$')
+        company_href = first_or_default(job, COMPANY_LINK_SELECTOR)['href']
 
-        if pattern.match(company_href):
+        if COMPANY_URL_PATTERN.match(company_href):
             li_company_url = 'https://www.linkedin.com/' + company_href
         else:
             li_company_url = ''
-        positions = list(map(lambda pos: get_info(pos, {
-            'title': '.pv-entity__summary-info-v2 > h3 > span:nth-of-type(2)',
-            'date_range': '.pv-entity__date-range span:nth-of-type(2)',
-            'location': '.pv-entity__location > span:nth-of-type(2)',
-            'description': '.pv-entity__description'
-        }), position_elements))
+        positions = list(map(lambda pos: get_info(
+            pos, POSITION_INFO_SELECTORS), position_elements))
 
         for pos in positions:
             pos['company'] = company
@@ -143,13 +251,7 @@ def get_job_info(job):
         return positions
 
     else:
-        job_info = get_info(job, {
-            'title': '.pv-entity__summary-info h3:nth-of-type(1)',
-            'company': '.pv-entity__secondary-title',
-            'date_range': '.pv-entity__date-range span:nth-of-type(2)',
-            'location': '.pv-entity__location span:nth-of-type(2)',
-            'description': '.pv-entity__description',
-        })
+        job_info = get_info(job, JOB_INFO_SELECTORS)
 
         if not job_info['date_range']:
             job_info['date_range'] = 'Not Specified'
@@ -158,11 +260,9 @@ def get_job_info(job):
             job_info['description'] = job_info['description'].replace(
                 'See less\n', '').replace('... See more', '').strip()
 
-        company_href = first_or_default(
-            job, 'a[data-control-name="background_details_company"]')['href']
-        pattern = re.compile('^/company/.*?/$')
+        company_href = first_or_default(job, COMPANY_LINK_SELECTOR)['href']
 
-        if pattern.match(company_href):
+        if COMPANY_URL_PATTERN.match(company_href):
             job_info['li_company_url'] = 'https://www.linkedin.com' + company_href
         else:
             job_info['li_company_url'] = ''
@@ -176,14 +276,7 @@ def get_school_info(school):
         dict of school name, degree, grades, field_of_study, date_range, &
         extra-curricular activities
     """
-    return get_info(school, {
-        'name': '.pv-entity__school-name',
-        'degree': '.pv-entity__degree-name span:nth-of-type(2)',
-        'grades': '.pv-entity__grade span:nth-of-type(2)',
-        'field_of_study': '.pv-entity__fos span:nth-of-type(2)',
-        'date_range': '.pv-entity__dates span:nth-of-type(2)',
-        'activities': '.activities-societies'
-    })
+    return get_info(school, SCHOOL_INFO_SELECTORS)
 
 
 def get_volunteer_info(exp):
@@ -191,14 +284,7 @@ def get_volunteer_info(exp):
     Returns:
         dict of title, company, date_range, location, cause, & description
     """
-    return get_info(exp, {
-        'title': '.pv-entity__summary-info h3:nth-of-type(1)',
-        'company': '.pv-entity__secondary-title',
-        'date_range': '.pv-entity__date-range span:nth-of-type(2)',
-        'location': '.pv-entity__location span:nth-of-type(2)',
-        'cause': '.pv-entity__cause span:nth-of-type(2)',
-        'description': '.pv-entity__description'
-    })
+    return get_info(exp, VOLUNTEER_INFO_SELECTORS)
 
 
 def get_certifications_info(element):
@@ -206,11 +292,7 @@ def get_certifications_info(element):
     Returns:
         dict of title, company, date_range, location, cause, & description
     """
-    return get_info(element, {
-        'title': '.pv-certifications__summary-info h3:nth-of-type(1)',
-        'authority': '.pv-certifications__summary-info p:nth-of-type(1) span:nth-of-type(2)',
-        'date_range': '.pv-certifications__summary-info p:nth-of-type(2) span:nth-of-type(2)'
-    })
+    return get_info(element, CERTIFICATION_INFO_SELECTORS)
 
 
 def get_skill_info(skill):
@@ -218,10 +300,8 @@ def get_skill_info(skill):
     Returns:
         dict of skill name and # of endorsements
     """
-    return get_info(skill, {
-        'name': '.pv-skill-category-entity__name',
-        'endorsements': '.pv-skill-category-entity__endorsement-count'
-    }, '0')  # default string will be applied to optional field endorsements
+    # default string will be applied to optional field endorsements
+    return get_info(skill, SKILL_INFO_SELECTORS, '0')
 
 
 def get_test_score_info(test_score):
@@ -229,21 +309,17 @@ def get_test_score_info(test_score):
     Returns:
         dict of test_score name and # of endorsements
     """
-    return get_info(test_score, {
-        'name': '.pv-accomplishment-entity__title',
-        'score': '.pv-accomplishment-entity__score'
-    }, '100%')
+    return get_info(test_score, TEST_SCORE_INFO_SELECTORS, '100%')
 
 
 def url_or_default(element, selector, default=None):
     try:
-        return element.select_one(selector)
+        return compile_selector(selector).select_one(element)
     except Exception as e:
         return default
 
 
 def get_user_urls(users):
-    url = url_or_default(
-        users, 'a[data-control-name="search_srp_result"]')['href']
+    url = url_or_default(users, USER_URL_SELECTOR)['href']
 
     return url
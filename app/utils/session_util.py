@@ -0,0 +1,147 @@
+from pathlib import Path
+import hashlib
+import json
+import time
+import os
+
+import redis
+
+from config import Config
+
+"""
+Authenticated linkedin cookies saved after a successful login, so new
+drivers can skip the login form(`SESSION_STORE`, see `Scraper.start_session`)
+
+Stored per account in redis(with a TTL) or as json files on disk, every
+function here never raises, a broken store only means logging in again
+"""
+
+# a session can't be restored without these
+REQUIRED_COOKIES = ['li_at', 'JSESSIONID']
+# keys of a selenium cookie accepted by `driver.add_cookie`
+COOKIE_KEYS = ['name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry']
+
+
+def session_key(email):
+    return 'linkedin:session:{0}'.format(
+        hashlib.sha256((email or '').encode('utf-8')).hexdigest()[:16])
+
+
+class RedisSessionStore(object):
+
+    def __init__(self, url=None):
+        self.redis = redis.Redis.from_url(url or Config.SESSION_REDIS_URL)
+
+    def load(self, key):
+        data = self.redis.get(key)
+        return json.loads(data) if data else None
+
+    def save(self, key, cookies, ttl):
+        self.redis.setex(key, ttl, json.dumps(cookies))
+
+    def clear(self, key):
+        self.redis.delete(key)
+
+
+class FileSessionStore(object):
+
+    def __init__(self, path=None):
+        self.path = Path(path or Config.SESSION_PATH)
+
+    def file_path(self, key):
+        return self.path / '{0}.json'.format(key.replace(':', '_'))
+
+    def load(self, key):
+        file_path = self.file_path(key)
+        if not file_path.exists():
+            return None
+        data = json.loads(file_path.read_text(encoding='utf-8'))
+        if data['expires_at'] < time.time():
+            return None
+        return data['cookies']
+
+    def save(self, key, cookies, ttl):
+        self.path.mkdir(parents=True, exist_ok=True)
+        file_path = self.file_path(key)
+        data = {'expires_at': time.time() + ttl, 'cookies': cookies}
+        # credentials, readable by the owner only
+        tmp_path = file_path.with_suffix('.tmp{0}'.format(os.getpid()))
+        tmp_path.write_text(json.dumps(data), encoding='utf-8')
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, file_path)
+
+    def clear(self, key):
+        file_path = self.file_path(key)
+        if file_path.exists():
+            file_path.unlink()
+
+
+SESSION_STORES = {
+    'redis': RedisSessionStore,
+    'file': FileSessionStore,
+}
+
+
+def get_session_store():
+    """Configured store, None if disabled or unknown"""
+    store_class = SESSION_STORES.get(Config.SESSION_STORE)
+    if store_class is None:
+        return None
+
+    return store_class()
+
+
+def load_session(email):
+    """Returns the saved, unexpired cookies of `email`'s session, None if there are none"""
+    store = get_session_store()
+    if not store:
+        return None
+
+    try:
+        cookies = store.load(session_key(email))
+    except Exception as e:
+        print(e)
+        print('Error: Loading the linkedin session failed')
+        return None
+
+    now = time.time()
+    cookies = [cookie for cookie in cookies or []
+               if cookie.get('expiry') is None or cookie['expiry'] > now]
+    names = [cookie['name'] for cookie in cookies]
+    if not all(name in names for name in REQUIRED_COOKIES):
+        return None
+
+    return cookies
+
+
+def save_session(email, cookies):
+    """Save the session cookies of `email`, returns True if saved"""
+    store = get_session_store()
+    if not store:
+        return False
+
+    cookies = [{key: cookie[key] for key in COOKIE_KEYS if key in cookie}
+               for cookie in cookies]
+    names = [cookie['name'] for cookie in cookies]
+    if not all(name in names for name in REQUIRED_COOKIES):
+        return False
+
+    try:
+        store.save(session_key(email), cookies, Config.SESSION_TTL)
+        return True
+    except Exception as e:
+        print(e)
+        print('Error: Saving the linkedin session failed')
+
+    return False
+
+
+def clear_session(email):
+    store = get_session_store()
+    if not store:
+        return
+
+    try:
+        store.clear(session_key(email))
+    except Exception as e:
+        print(e)
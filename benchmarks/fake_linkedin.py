@@ -0,0 +1,580 @@
+"""
+Local stand-in for linkedin serving the recorded pages in `fixtures/`,
+so the http & browser scrapers can be run & benchmarked offline
+
+    python -m benchmarks.fake_linkedin --port 8001 --latency 0.2
+    python -m benchmarks.fake_linkedin --lazy --fail-rate 0.05 --hang-rate 0.02
+    LINKEDIN_URL=http://localhost:8001 HTTP_WORKERS=8 ...
+
+Routes:
+    /login                              login form, posting it sets `SESSION_COOKIES`
+    /robots.txt                         plain text
+    /feed/                              landing page after login
+    /voyager/api/me                     session check(see `Scraper.check_session`)
+    /voyager/api/identity/profiles/<name>/<endpoint>
+                                        profile api(`ProfileScraper.PROFILE_API_ENDPOINTS`),
+                                        the recorded profile as voyager entities
+    /voyager/api/search/blended?...     search api, the recorded search pages(by `start`)
+    /in/<name>/                         recorded profile, without its contact info
+    /in/<name>/detail/contact-info/     contact info overlay of that profile
+    /search/results/people/?...         recorded search pages(cycled through by `page`)
+Every other page redirects to /login without the `li_at` cookie of `SESSION_COOKIES`,
+the api answers 403 without its `csrf-token` header
+
+Profile pages open the contact info overlay in place when its link is
+clicked, like the real single page app, search pages go to the next page
+when `Next` is clicked. Optionally(see `FakeLinkedin`):
+    - lazy: profile sections are only rendered once scrolled into view
+    - failures: profiles answered with the unavailable page, a server error
+      or after hanging for a while(profile pages & `profileView`)
+    - paywall: search pages past a number show the search limit page, the
+      search api returns no results
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from contextlib import redirect_stdout
+from collections import Counter
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+from http.cookies import SimpleCookie
+from pathlib import Path
+import threading
+import argparse
+import calendar
+import secrets
+import random
+import json
+import zlib
+import io
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from app.commands import FIXTURES_PATH
+from app.main import Profile, SearchPage, ProfileScraper
+from app.main.JsonProfile import MONTHS
+from app.utils.scrape_util import normalize_url
+
+# cookies accepted by the server
+SESSION_COOKIES = [
+    {'name': 'li_at', 'value': 'fake-session', 'path': '/'},
+    {'name': 'JSESSIONID', 'value': '"ajax:0000000000000000000"', 'path': '/'},
+]
+
+LOGIN_PAGE = """<html><body>
+<form method="post" action="/checkpoint/lg/login-submit">
+<input name="session_key"><input name="session_password" type="password">
+<button type="submit">Sign in</button>
+</form></body></html>"""
+FEED_PAGE = '<html><body><div class="core-rail">Feed</div></body></html>'
+PROFILE_UNAVAILABLE_PAGE = '<html><body><div class="profile-unavailable">This profile is not available</div></body></html>'
+SEARCH_LIMIT_PAGE = '<html><body><div class="core-rail"><div class="search-paywall">You’ve reached the monthly limit for profile searches</div></div></body></html>'
+CONTACT_INFO_SELECTOR = '.pv-contact-info'
+VANITY_URL_SELECTOR = '.ci-vanity-url .pv-contact-info__ci-container'
+# rendered once scrolled into view with `lazy`
+LAZY_SECTION_SELECTORS = ['.background-section', '.pv-skill-categories-section',
+                          '.pv-accomplishments-section', '.pv-interests-section']
+
+CONTACT_INFO_LINK = '<a data-control-name="contact_see_more" href="/in/{0}/detail/contact-info/">Contact info</a>'
+LAZY_SECTION = '<div data-fake-lazy style="min-height: 800px"><template>{0}</template></div>'
+PROFILE_SCRIPT = """<script>
+// contact info overlay opened in place
+document.addEventListener('click', function (event) {
+    var link = event.target.closest('a[data-control-name="contact_see_more"]');
+    if (!link) return;
+    event.preventDefault();
+    fetch(link.getAttribute('href'), {credentials: 'include'}).then(function (response) {
+        return response.text();
+    }).then(function (html) {
+        var overlay = document.createElement('div');
+        overlay.innerHTML = html;
+        document.body.appendChild(overlay);
+    });
+});
+// lazy sections, fetched(for the latency) once near the viewport
+var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+        if (!entry.isIntersecting) return;
+        var placeholder = entry.target;
+        observer.unobserve(placeholder);
+        fetch('/fake/lazy', {credentials: 'include'}).then(function () {
+            placeholder.replaceWith(placeholder.querySelector('template').content);
+        });
+    });
+}, {rootMargin: '200px'});
+document.querySelectorAll('[data-fake-lazy]').forEach(function (placeholder) {
+    observer.observe(placeholder);
+});
+</script>"""
+SEARCH_SCRIPT = """<script>
+document.addEventListener('click', function (event) {
+    if (!event.target.closest('button[aria-label="Next"]')) return;
+    var url = new URL(location.href);
+    url.searchParams.set('page', parseInt(url.searchParams.get('page') || '1') + 1);
+    location.href = url.toString();
+});
+</script>"""
+
+
+VOYAGER_TYPE = 'com.linkedin.voyager.{0}'
+# profile api endpoint path -> name, see `ProfileScraper.PROFILE_API_ENDPOINTS`
+PROFILE_API_ENDPOINTS = {endpoint.strip('/'): name
+                         for name, endpoint in ProfileScraper.PROFILE_API_ENDPOINTS.items()}
+
+
+def voyager_entity(type_name, urn, **fields):
+    return dict(fields, **{'$type': VOYAGER_TYPE.format(type_name), 'entityUrn': urn})
+
+
+def voyager_date(text):
+    """'Jan 2019' / '2013' -> voyager date, None for 'Present' & unknown"""
+    parts = (text or '').split()
+    try:
+        if len(parts) == 2:
+            return {'month': MONTHS.index(parts[0]) + 1, 'year': int(parts[1])}
+        return {'year': int(parts[0])}
+    except (ValueError, IndexError):
+        return None
+
+
+def voyager_period(start, end=None):
+    period = {'startDate': voyager_date(start), 'endDate': voyager_date(end)}
+    return {key: date for key, date in period.items() if date} or None
+
+
+def voyager_date_range(date_range):
+    """'Jan 2019 – Present' -> voyager `timePeriod`"""
+    start, _, end = (date_range or '').partition(' – ')
+    return voyager_period(start, end)
+
+
+def voyager_profile(profile, public_identifier):
+    """
+    `Profile.to_dict()` of a recorded page as the normalized payloads of the
+    profile api, see `JsonProfile`
+    Returns dict of endpoint name -> payload
+    """
+    personal_info = profile['personal_info']
+    experiences = profile['experiences']
+    accomplishments = profile['accomplishments']
+    urn = 'urn:li:fs_profile:{0}'.format(public_identifier)
+    first_name, _, last_name = (personal_info['name'] or '').partition(' ')
+
+    def urn_of(kind, i):
+        return 'urn:li:fs_{0}:({1},{2})'.format(kind, public_identifier, i)
+
+    mini_profile = voyager_entity(
+        'identity.shared.MiniProfile', 'urn:li:fs_miniProfile:{0}'.format(public_identifier),
+        publicIdentifier=public_identifier, picture={'com.linkedin.common.VectorImage': {
+            'rootUrl': personal_info['image'],
+            'artifacts': [{'width': 400, 'fileIdentifyingUrlPathSegment': ''}]}})
+    view = [mini_profile, voyager_entity(
+        'identity.profile.Profile', urn, firstName=first_name, lastName=last_name,
+        headline=personal_info['headline'], summary=personal_info['summary'],
+        geoLocationName=personal_info['location'], **{'*miniProfile': mini_profile['entityUrn']})]
+
+    for i, job in enumerate(experiences['jobs']):
+        company_id = job['li_company_url'].rstrip('/').rsplit('/', 1)[-1]
+        view.append(voyager_entity(
+            'identity.profile.Position', urn_of('position', i), title=job['title'],
+            companyName=(job['company'] or '').split('\n')[0].strip(),
+            companyUrn='urn:li:fs_miniCompany:{0}'.format(company_id) if company_id else None,
+            timePeriod=voyager_date_range(job['date_range']),
+            locationName=job['location'], description=job['description']))
+    for i, school in enumerate(experiences['education']):
+        view.append(voyager_entity(
+            'identity.profile.Education', urn_of('education', i), schoolName=school['name'],
+            degreeName=school['degree'], grade=school['grades'],
+            fieldOfStudy=school['field_of_study'], activities=school['activities'],
+            timePeriod=voyager_date_range(school['date_range'])))
+    for i, volunteer in enumerate(experiences['volunteering']):
+        view.append(voyager_entity(
+            'identity.profile.VolunteerExperience', urn_of('volunteerExperience', i),
+            role=volunteer['title'], companyName=volunteer['company'],
+            timePeriod=voyager_date_range(volunteer['date_range']),
+            locationName=volunteer['location'], description=volunteer['description'],
+            cause=(volunteer['cause'] or '').upper().replace(' ', '_') or None))
+    for i, certification in enumerate(experiences['certifications']):
+        # 'Issued Jun 2019 - Expires Jun 2022'
+        issued, _, expires = (certification['date_range'] or '').partition(' - ')
+        view.append(voyager_entity(
+            'identity.profile.Certification', urn_of('certification', i),
+            name=certification['title'], authority=certification['authority'],
+            timePeriod=voyager_period(issued.replace('Issued ', ''),
+                                      expires.replace('Expires ', ''))))
+
+    # accomplishment -> (entity type, field displayed), as read by `JsonProfile`
+    types = {
+        'publications': ('Publication', 'name'),
+        'patents': ('Patent', 'title'),
+        'courses': ('Course', 'name'),
+        'projects': ('Project', 'title'),
+        'honors': ('Honor', 'title'),
+        'languages': ('Language', 'name'),
+        'organizations': ('Organization', 'name'),
+    }
+    for key, (type_name, field) in types.items():
+        for i, value in enumerate(accomplishments[key]):
+            view.append(voyager_entity('identity.profile.' + type_name,
+                                       urn_of(type_name.lower(), i), **{field: value}))
+    for i, score in enumerate(accomplishments['text_scores']):
+        view.append(voyager_entity('identity.profile.TestScore', urn_of('testScore', i),
+                                   name=score['name'], score=score['score']))
+
+    skills = []
+    for i, skill in enumerate(profile['skills']):
+        skills.append(voyager_entity('identity.profile.Skill', urn_of('skill', i),
+                                     name=skill['name']))
+        skills.append(voyager_entity(
+            'identity.profile.EndorsedSkill', urn_of('endorsedSkill', i),
+            endorsementCount=skill['endorsements'], **{'*skill': urn_of('skill', i)}))
+
+    contact_info = voyager_entity(
+        'identity.profile.ContactInfo', urn_of('contactinfo', 0),
+        emailAddress=personal_info['email'],
+        phoneNumbers=[{'number': personal_info['phone']}] if personal_info['phone'] else [],
+        websites=[{'url': url} for url in personal_info['websites']])
+    if personal_info['connected']:
+        connected = datetime.strptime(personal_info['connected'], '%B %d, %Y')
+        contact_info['connectedAt'] = calendar.timegm(connected.timetuple()) * 1000
+
+    return {
+        'profile_view': {'data': {'*profile': urn}, 'included': view},
+        'network_info': {'data': {}, 'included': [voyager_entity(
+            'identity.profile.NetworkInfo', urn_of('networkinfo', 0),
+            connectionsCount=personal_info['connections'])]},
+        'skills': {'data': {}, 'included': skills},
+        'contact_info': {'data': {}, 'included': [contact_info]},
+    }
+
+
+def voyager_search(search_page, start, count):
+    """Recorded search page(`SearchPage`) as the normalized search api payload"""
+    included = [voyager_entity('identity.shared.MiniProfile',
+                               'urn:li:fs_miniProfile:{0}'.format(name),
+                               publicIdentifier=name)
+                for name in (url.strip('/').rsplit('/', 1)[-1] for url in search_page.vanity_urls)]
+    return {
+        'data': {
+            'paging': {'start': start, 'count': count,
+                       'total': search_page.pages['total_results']},
+            '*elements': [entity['entityUrn'] for entity in included],
+        },
+        'included': included,
+    }
+
+
+class FakeLinkedinHandler(BaseHTTPRequestHandler):
+    # keep-alive connections
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+
+        if url.path.startswith('/login'):
+            return self.send_html(LOGIN_PAGE)
+        if url.path == '/robots.txt':
+            return self.send_body('User-agent: *\n', 'text/plain')
+
+        cookies = SimpleCookie(self.headers.get('Cookie', ''))
+        if 'li_at' not in cookies or cookies['li_at'].value != SESSION_COOKIES[0]['value']:
+            return self.redirect('/login')
+
+        if url.path.startswith('/voyager/'):
+            if self.headers.get('csrf-token') != SESSION_COOKIES[1]['value'].strip('"'):
+                return self.send_json({}, 403)
+            return self.voyager(url)
+        if url.path.startswith('/fake/lazy'):
+            return self.send_body('', 'text/plain')
+        if url.path.startswith('/feed'):
+            return self.send_html(FEED_PAGE)
+
+        if url.path.startswith('/in/'):
+            name = url.path.split('/')[2]
+            if url.path.rstrip('/').endswith('/detail/contact-info'):
+                return self.send_html(self.server.contact_info(name))
+
+            failure = self.server.pick_failure()
+            self.server.count('profiles', failure)
+            if failure == 'unavailable':
+                return self.send_html(PROFILE_UNAVAILABLE_PAGE)
+            if failure == 'error':
+                return self.send_body('Server error', 'text/plain', 500)
+            if failure == 'hang':
+                time.sleep(self.server.hang)
+            return self.send_html(self.server.profile_page(name))
+
+        if url.path.startswith('/search/results/people'):
+            page = int(parse_qs(url.query).get('page', ['1'])[0])
+            self.server.count('search pages')
+            if self.server.paywall_after and page > self.server.paywall_after:
+                return self.send_html(SEARCH_LIMIT_PAGE)
+            return self.send_html(self.server.search_page(page) + SEARCH_SCRIPT)
+
+        self.send_response(404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def voyager(self, url):
+        if url.path.startswith('/voyager/api/me'):
+            return self.send_json({})
+
+        if url.path.startswith('/voyager/api/identity/profiles/'):
+            name, endpoint = url.path.split('/')[5:7]
+            if endpoint not in PROFILE_API_ENDPOINTS:
+                return self.send_json({}, 404)
+            endpoint = PROFILE_API_ENDPOINTS[endpoint]
+            if endpoint == 'profile_view':
+                failure = self.server.pick_failure()
+                self.server.count('profiles', failure)
+                if failure == 'unavailable':
+                    return self.send_json({'status': 404}, 404)
+                if failure == 'error':
+                    return self.send_json({'status': 500}, 500)
+                if failure == 'hang':
+                    time.sleep(self.server.hang)
+            return self.send_json(self.server.voyager_profile(name)[endpoint])
+
+        if url.path.startswith('/voyager/api/search/blended'):
+            query = parse_qs(url.query)
+            start = int(query.get('start', ['0'])[0])
+            count = int(query.get('count', ['10'])[0])
+            page = start // count + 1
+            self.server.count('search pages')
+            search_page = SearchPage(self.server.search_page(page))
+            payload = voyager_search(search_page, start, count)
+            if self.server.paywall_after and page > self.server.paywall_after:
+                payload['data']['*elements'] = payload['included'] = []
+            return self.send_json(payload)
+
+        self.send_json({}, 404)
+
+    def do_POST(self):
+        """Login form, any credentials are accepted"""
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if not urlsplit(self.path).path.startswith('/checkpoint/lg/login-submit'):
+            return self.redirect('/login')
+
+        self.send_response(302)
+        for cookie in SESSION_COOKIES:
+            self.send_header('Set-Cookie', '{name}={value}; Path={path}'.format(**cookie))
+        self.send_header('Location', '/feed/')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def send_html(self, html):
+        self.send_body(html, 'text/html; charset=utf-8')
+
+    def send_json(self, data, status=200):
+        self.send_body(json.dumps(data), 'application/json', status)
+
+    def send_body(self, text, content_type, status=200):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def redirect(self, location):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeLinkedin(ThreadingHTTPServer):
+    """
+    Params:
+        - latency: seconds added to every response
+        - lazy: render the profile sections once scrolled into view
+        - fail_rate / error_rate / hang_rate: share of profile pages answered
+          with the unavailable page / a 500 / after `hang` seconds
+        - paywall_after: search pages past this one show the search limit(0: never)
+        - unique_profiles: search results link to profiles not seen before
+          (per page & server), each /in/<name> has its own vanity url in its
+          contact info(& public identifier in the api) instead of the recorded one
+    """
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0, fixtures=FIXTURES_PATH, host='127.0.0.1',
+                 lazy=False, fail_rate=0.0, error_rate=0.0, hang_rate=0.0, hang=60.0,
+                 paywall_after=0, unique_profiles=False, seed=0):
+        super().__init__((host, port), FakeLinkedinHandler)
+        self.latency = latency
+        self.lazy = lazy
+        self.failure_rates = [('unavailable', fail_rate), ('error', error_rate),
+                              ('hang', hang_rate)]
+        self.hang = hang
+        self.paywall_after = paywall_after
+        self.unique_profiles = unique_profiles
+        # suffix of the search results with `unique_profiles`
+        self.token = secrets.token_hex(3)
+        self.random = random.Random(seed)
+        # requests served, see `count`
+        self.stats = Counter()
+        self.lock = threading.Lock()
+        fixtures = Path(fixtures)
+
+        # name -> (profile page without contact info, contact info overlay)
+        self.profiles = {}
+        self.profile_bodies = {}
+        # name -> `Profile.to_dict()` of the page, served by the profile api
+        self.profile_dicts = {}
+        # name -> vanity url in the recorded contact info
+        self.vanity_urls = {}
+        for page in sorted(fixtures.glob('profiles/*.html')):
+            body = page.read_text(encoding='utf-8')
+            soup = BeautifulSoup(body, 'html.parser')
+            contact_info = soup.select_one(CONTACT_INFO_SELECTOR)
+            contact_info_html = contact_info.extract().decode() if contact_info else ''
+            vanity_url = contact_info and contact_info.select_one(VANITY_URL_SELECTOR)
+            if vanity_url and '/in/' in vanity_url.get_text():
+                self.vanity_urls[page.stem] = normalize_url(vanity_url.get_text().strip())
+            if lazy:
+                self.make_lazy(soup)
+            self.profiles[page.stem] = (str(soup), contact_info_html)
+            self.profile_bodies[page.stem] = body
+            # Profile.to_dict prints when it can't find a current company
+            with redirect_stdout(io.StringIO()):
+                self.profile_dicts[page.stem] = Profile(body).to_dict()
+
+        self.search_pages = [page.read_text(encoding='utf-8')
+                             for page in sorted(fixtures.glob('search/*.html'))]
+
+    @staticmethod
+    def make_lazy(soup):
+        """Move the lazy loaded sections to templates rendered once scrolled into view"""
+        sections = list(filter(None, map(soup.select_one, LAZY_SECTION_SELECTORS)))
+        for section in sections:
+            # nested sections are lazy with the outer one
+            if any(parent in sections for parent in section.parents):
+                continue
+            placeholder = BeautifulSoup(LAZY_SECTION.format(section.decode()), 'html.parser')
+            section.replace_with(placeholder)
+
+    def profile_name(self, name):
+        """Recorded profile served for /in/`name`, the same one for a name"""
+        if name in self.profiles:
+            return name
+        names = sorted(self.profiles)
+        return names[zlib.crc32(name.encode('utf-8')) % len(names)]
+
+    def profile_page(self, name):
+        profile = self.profiles[self.profile_name(name)][0]
+        # recorded pages are fragments of the page body
+        return profile + CONTACT_INFO_LINK.format(name) + PROFILE_SCRIPT
+
+    def contact_info(self, name):
+        recorded = self.profile_name(name)
+        contact_info = self.profiles[recorded][1]
+        if self.unique_profiles and recorded in self.vanity_urls:
+            contact_info = re.sub(re.escape(self.vanity_urls[recorded]) + r'(?![\w-])',
+                                  '/in/' + name, contact_info)
+        return contact_info
+
+    def voyager_profile(self, name):
+        """Profile api payloads of /in/`name`, see `voyager_profile`"""
+        recorded = self.profile_name(name)
+        public_identifier = name
+        if not self.unique_profiles and recorded in self.vanity_urls:
+            public_identifier = self.vanity_urls[recorded][len('/in/'):]
+        return voyager_profile(self.profile_dicts[recorded], public_identifier)
+
+    def search_page(self, page):
+        """Recorded search page served for `page`(1 based)"""
+        html = self.search_pages[(page - 1) % len(self.search_pages)]
+        if self.unique_profiles:
+            html = re.sub(r'/in/([\w-]+)', r'/in/\1-{0}-{1}'.format(page, self.token), html)
+        return html
+
+    def pick_failure(self):
+        """Failure injected in the next profile page, None for a normal page"""
+        with self.lock:
+            roll = self.random.random()
+        for failure, rate in self.failure_rates:
+            if roll < rate:
+                return failure
+            roll -= rate
+        return None
+
+    def count(self, kind, failure=None):
+        with self.lock:
+            self.stats[kind] += 1
+            if failure:
+                self.stats[failure] += 1
+
+    @property
+    def url(self):
+        return 'http://{0}:{1}'.format(*self.server_address)
+
+    def start(self):
+        """Serve in a background thread"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def add_server_arguments(arg_parser):
+    """Fake server options, shared by the benchmarks"""
+    arg_parser.add_argument('--latency', type=float, default=0.2,
+                            help='Seconds added to every response')
+    arg_parser.add_argument('--lazy', action='store_true',
+                            help='Render profile sections once scrolled into view')
+    arg_parser.add_argument('--fail-rate', type=float, default=0.0,
+                            help='Share of profiles answered with the unavailable page')
+    arg_parser.add_argument('--error-rate', type=float, default=0.0,
+                            help='Share of profiles answered with a server error')
+    arg_parser.add_argument('--hang-rate', type=float, default=0.0,
+                            help='Share of profiles answered after --hang seconds')
+    arg_parser.add_argument('--hang', type=float, default=60.0,
+                            help='Seconds a hanging profile takes')
+    arg_parser.add_argument('--paywall-after', type=int, default=0,
+                            help='Search pages past this one show the search limit(0: never)')
+    arg_parser.add_argument('--seed', type=int, default=0,
+                            help='Seed of the injected failures')
+
+
+def server_options(args):
+    return {
+        'latency': args.latency,
+        'lazy': args.lazy,
+        'fail_rate': args.fail_rate,
+        'error_rate': args.error_rate,
+        'hang_rate': args.hang_rate,
+        'hang': args.hang,
+        'paywall_after': args.paywall_after,
+        'seed': args.seed,
+    }
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Fake linkedin server')
+    arg_parser.add_argument('--port', type=int, default=8001)
+    arg_parser.add_argument('--host', default='127.0.0.1',
+                            help='0.0.0.0 to be reachable from a selenium container')
+    arg_parser.add_argument('--unique-profiles', action='store_true',
+                            help='Give each /in/<name> its own vanity url')
+    add_server_arguments(arg_parser)
+    args = arg_parser.parse_args(argv)
+
+    server = FakeLinkedin(args.port, host=args.host,
+                          unique_profiles=args.unique_profiles, **server_options(args))
+    print('Serving recorded pages on {0}, cookies: {1}'.format(
+        server.url, '; '.join('{name}={value}'.format(**cookie) for cookie in SESSION_COOKIES)))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Offline benchmark of the browserless http scrapers against the fake
+linkedin server(`benchmarks.fake_linkedin`)
+
+Checks the scraped dicts match `Profile.to_dict()` / `SearchPage` of the
+recorded pages(the fields the api carries as displayed, see `comparable`) and
+reports profiles/sec for each number of fetching threads
+
+    python -m benchmarks.http_scrape
+    python -m benchmarks.http_scrape --latency 0.3 --profiles 60 --workers 1 4 8
+"""
+from contextlib import redirect_stdout
+import argparse
+import time
+import sys
+import io
+
+from flask import Flask
+
+from app.main import Profile, SearchPage, HttpProfileScraper, HttpSearchScraper
+from benchmarks.fake_linkedin import FakeLinkedin, SESSION_COOKIES
+from config import Config
+
+
+def comparable(profile):
+    """
+    Fields of a profile dict read alike from the page & the api: not the
+    interests(not in the api) nor the raw job company & description text
+    """
+    experiences = dict(profile['experiences'], jobs=[
+        {key: job[key] for key in ['title', 'date_range', 'location']}
+        for job in profile['experiences']['jobs']])
+    return dict(profile, experiences=experiences, interests=None)
+
+
+def benchmark_search(server):
+    start = time.perf_counter()
+    with HttpSearchScraper(cookies=SESSION_COOKIES) as scraper:
+        scraped = scraper.search(['python', 'developer'])
+    seconds = time.perf_counter() - start
+
+    expected = set()
+    for page in server.search_pages:
+        expected.update(SearchPage(page).vanity_urls)
+    ok = set(scraped['urls']['vanity_urls']) == expected and \
+        scraped['stats'] == SearchPage(server.search_pages[0]).pages
+
+    return scraped, seconds, ok
+
+
+def benchmark_profiles(server, users, workers):
+    mismatches = []
+    start = time.perf_counter()
+    with HttpProfileScraper(cookies=SESSION_COOKIES) as scraper:
+        scraper.workers = workers
+        for user in scraper.iter_loaded_profiles(users):
+            scraped = scraper.get_profile().to_dict()
+            name = server.profile_name(user.split('/')[2])
+            expected = Profile(server.profile_bodies[name]).to_dict()
+            if comparable(scraped) != comparable(expected):
+                mismatches.append(user)
+    seconds = time.perf_counter() - start
+
+    return len(users) / seconds, mismatches
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Http scrapers benchmark')
+    arg_parser.add_argument('--latency', type=float, default=0.2,
+                            help='Seconds added to every response')
+    arg_parser.add_argument('--profiles', type=int, default=40,
+                            help='Profiles scraped per run')
+    arg_parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8],
+                            help='Fetching threads(HTTP_WORKERS) to compare')
+    args = arg_parser.parse_args(argv)
+
+    server = FakeLinkedin(latency=args.latency).start()
+    flask_app = Flask(__name__)
+    flask_app.config.from_object(Config)
+    flask_app.config.update(LINKEDIN_URL=server.url,
+                            HTTP_WORKERS=max(args.workers))
+    # nothing to keep from the fake server
+    Config.HTML_ARCHIVE_PATH = ''
+
+    failed = False
+    with flask_app.app_context():
+        scraped, seconds, ok = benchmark_search(server)
+        failed = failed or not ok
+        print('search: {0} urls from {1} pages in {2:.2f}s {3}'.format(
+            scraped['urls']['total'], scraped['stats'].get('max_accessible_pages'),
+            seconds, 'OK' if ok else 'MISMATCH'))
+
+        users = ['/in/user-{0}/'.format(i) for i in range(args.profiles)]
+        for workers in args.workers:
+            # Profile.to_dict prints when it can't find a current company
+            with redirect_stdout(io.StringIO()):
+                rate, mismatches = benchmark_profiles(server, users, workers)
+            failed = failed or bool(mismatches)
+            print('profiles: {0} workers {1:.1f} profiles/sec {2}'.format(
+                workers, rate, 'MISMATCH {0}'.format(mismatches) if mismatches else 'OK'))
+
+    server.stop()
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Build the larger/smaller recorded pages in `fixtures/` from the hand
+anonymized ones, so the corpus covers a range of page sizes
+
+    python -m benchmarks.make_fixtures
+"""
+import copy
+from bs4 import BeautifulSoup
+
+from app.commands import FIXTURES_PATH
+
+BASE_PROFILE = 'profiles/jane-doe.html'
+BASE_SEARCH = 'search/python-developer-page-1.html'
+
+# item selector -> number of items wanted in the large profile
+LARGE_PROFILE_ITEMS = {
+    '#experience-section li.pv-entity__position-group-pager': 30,
+    '.pv-education-entity': 6,
+    '.pv-volunteering-entity': 8,
+    '.pv-certification-entity': 12,
+    '.pv-skill-categories-section__top-skills > li': 20,
+    '.pv-skill-category-list__skills_list > li': 30,
+    '.pv-accomplishments-block__summary-list-item': 6,
+    '.pv-interest-entity': 20,
+    '.pv-browsemap-section__member-container': 40,
+}
+
+# sections dropped from the minimal profile(top card & contact info only)
+MINIMAL_PROFILE_REMOVE = [
+    '.pv-about-section', '.background-section', '.pv-skill-categories-section',
+    '.pv-accomplishments-section', '.pv-interests-section', '.pv-browsemap-section',
+]
+
+
+def read(path):
+    return (FIXTURES_PATH / path).read_text(encoding='utf-8')
+
+
+def write(path, soup):
+    (FIXTURES_PATH / path).write_text(str(soup), encoding='utf-8')
+    print('Wrote {0}'.format(path))
+
+
+def grow(soup, selector, count):
+    """Repeat the items matching `selector` until each list holds `count` items"""
+    # (list, tag name of its items), lists may use different item tags
+    parents = []
+    for item in soup.select(selector):
+        if (item.parent, item.name) not in parents:
+            parents.append((item.parent, item.name))
+
+    for parent, name in parents:
+        items = parent.find_all(name, recursive=False)
+        for i in range(count - len(items)):
+            parent.append(copy.copy(items[i % len(items)]))
+            parent.append('\n')
+
+
+def make_large_profile():
+    soup = BeautifulSoup(read(BASE_PROFILE), 'html.parser')
+    for selector, count in LARGE_PROFILE_ITEMS.items():
+        grow(soup, selector, count)
+    write('profiles/jane-doe-large.html', soup)
+
+
+def make_minimal_profile():
+    soup = BeautifulSoup(read(BASE_PROFILE), 'html.parser')
+    for selector in MINIMAL_PROFILE_REMOVE:
+        for element in soup.select(selector):
+            element.decompose()
+    write('profiles/jane-doe-minimal.html', soup)
+
+
+def make_last_search_page():
+    soup = BeautifulSoup(read(BASE_SEARCH), 'html.parser')
+    for item in soup.select('.search-results__list > li')[3:]:
+        item.decompose()
+    soup.select_one('h3.search-results__total').string = '\n      23 results\n    '
+    soup.select_one('button[aria-label="Next"]')['disabled'] = ''
+    write('search/python-developer-page-3.html', soup)
+
+
+def make_large_search_page():
+    soup = BeautifulSoup(read(BASE_SEARCH), 'html.parser')
+    grow(soup, '.search-results__list > li', 50)
+    write('search/python-developer-page-1-large.html', soup)
+
+
+if __name__ == '__main__':
+    make_large_profile()
+    make_minimal_profile()
+    make_last_search_page()
+    make_large_search_page()
@@ -0,0 +1,166 @@
+"""
+Offline parser benchmark over the recorded pages in `fixtures/`
+
+Drives `Profile`, `Search` and `Pages` end to end(parse + every property +
+`to_dict`) with each parser backend and reports pages/sec, per-property time
+and peak python heap usage
+
+    python -m benchmarks.parse
+    python -m benchmarks.parse --parsers lxml lexbor --repeat 50
+    python -m benchmarks.parse --restricted
+    python -m benchmarks.parse --output results.json
+    python -m benchmarks.parse --baseline results.json
+
+Note: tracemalloc only sees python allocations, trees built in C by
+lexbor are not part of its peak memory
+"""
+from contextlib import redirect_stdout
+from pathlib import Path
+import argparse
+import tracemalloc
+import json
+import time
+import io
+import sys
+
+from app.commands import FIXTURES_PATH, FIXTURE_RESULTS_CLASSES
+from app.utils.parser_util import available_parsers
+from config import Config
+
+
+def property_names(results_class):
+    """Properties timed for a results class, shared extractors first"""
+    names = list(results_class.attributes)
+    if hasattr(results_class, 'sections'):
+        names.insert(0, 'sections')
+    return names
+
+
+def run_once(results_class, body, parser):
+    """Time one page end to end: parse + `to_dict`"""
+    start = time.perf_counter()
+    results_class(body, parser=parser).to_dict()
+    return time.perf_counter() - start
+
+
+def time_properties(results_class, body, parser, timings):
+    """Time the parse and each property of a fresh results object"""
+    start = time.perf_counter()
+    results = results_class(body, parser=parser)
+    timings['parse'] += time.perf_counter() - start
+
+    for name in property_names(results_class):
+        start = time.perf_counter()
+        getattr(results, name)
+        timings[name] += time.perf_counter() - start
+
+
+def peak_memory(results_class, body, parser):
+    tracemalloc.start()
+    results_class(body, parser=parser).to_dict()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def benchmark(results_class, body, parser, repeat):
+    timings = dict.fromkeys(['parse'] + property_names(results_class), 0.0)
+    # Profile.to_dict prints when it can't find a current company
+    with redirect_stdout(io.StringIO()):
+        # warm up(selector compilation, lazy imports)
+        run_once(results_class, body, parser)
+        total = sum(run_once(results_class, body, parser)
+                    for _ in range(repeat))
+        for _ in range(repeat):
+            time_properties(results_class, body, parser, timings)
+        peak = peak_memory(results_class, body, parser)
+
+    return {
+        'pages_per_sec': repeat / total if total else 0,
+        'ms_per_page': total * 1000 / repeat,
+        'properties_ms': {name: timings[name] * 1000 / repeat for name in timings},
+        'peak_memory_kb': peak / 1024,
+    }
+
+
+def run(fixtures, parsers, repeat):
+    mode = ' restricted' if Config.RESTRICTED_PARSE else ''
+    results = {}
+    for folder, results_classes in FIXTURE_RESULTS_CLASSES.items():
+        for page in sorted(Path(fixtures).glob('{0}/*.html'.format(folder))):
+            body = page.read_text(encoding='utf-8')
+            for results_class in results_classes:
+                for parser in parsers:
+                    key = '{0}/{1} {2} [{3}{4}]'.format(
+                        folder, page.name, results_class.__name__, parser, mode)
+                    results[key] = benchmark(
+                        results_class, body, parser, repeat)
+                    results[key]['size_kb'] = len(body.encode('utf-8')) / 1024
+                    report(key, results[key])
+
+    return results
+
+
+def report(key, result):
+    print('{0}\n  {1:.1f} KB  {2:.1f} pages/sec  {3:.2f} ms/page  peak {4:.0f} KB'.format(
+        key, result['size_kb'], result['pages_per_sec'], result['ms_per_page'],
+        result['peak_memory_kb']))
+    print('  ' + '  '.join('{0} {1:.2f}ms'.format(name, ms)
+                           for name, ms in result['properties_ms'].items()))
+
+
+def compare(results, baseline_path, tolerance):
+    """Returns list of benchmarks whose pages/sec dropped more than `tolerance`"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        expected = baseline[key]['pages_per_sec']
+        if result['pages_per_sec'] < expected * (1 - tolerance):
+            regressions.append('{0}: {1:.1f} pages/sec (baseline {2:.1f})'.format(
+                key, result['pages_per_sec'], expected))
+
+    return regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Offline parser benchmark')
+    arg_parser.add_argument('--fixtures', default=str(FIXTURES_PATH),
+                            help='Directory of recorded pages')
+    arg_parser.add_argument('--parsers', nargs='+', default=None,
+                            help='Parser backends(default: all installed)')
+    arg_parser.add_argument('--repeat', type=int, default=20,
+                            help='Iterations per page')
+    arg_parser.add_argument('--restricted', action='store_true',
+                            help='Build only the elements read(RESTRICTED_PARSE)')
+    arg_parser.add_argument('--output', help='Write results to a json file')
+    arg_parser.add_argument('--baseline',
+                            help='Fail on pages/sec regressions against a saved json file')
+    arg_parser.add_argument('--tolerance', type=float, default=0.2,
+                            help='Allowed pages/sec drop against the baseline(0.2 = 20%%)')
+    args = arg_parser.parse_args(argv)
+
+    parsers = args.parsers or available_parsers()
+    Config.RESTRICTED_PARSE = args.restricted
+    results = run(args.fixtures, parsers, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION ' + regression)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
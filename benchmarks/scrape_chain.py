@@ -0,0 +1,237 @@
+"""
+End to end benchmark of the scraping chain against the fake linkedin server
+(`benchmarks.fake_linkedin`): `search_and_store_results`, then
+`scrape_search_result_profiles` until every search result is scraped, run in
+process(eager celery) with the configured scrapers, tabs, pools...
+
+Reports profiles/min and the time spent in each stage(its own time, the
+stages it calls excluded)
+
+    python -m benchmarks.scrape_chain
+    python -m benchmarks.scrape_chain --scraper http --latency 0.3
+    python -m benchmarks.scrape_chain --lazy --fail-rate 0.05 --hang-rate 0.02 --hang 90
+    PROFILE_TABS=4 BLOCK_RESOURCES=True python -m benchmarks.scrape_chain --output chain.json
+
+Needs the database of `DATABASE_URL`(a user & the scraped profiles are saved,
+use a scratch one) and for the browser scrapers a local Chrome, or a remote
+one(`SELENIUM_MODE=remote`) reaching the server(`--host 0.0.0.0 --public-url`)
+Parsing is only timed when inline(`PARSE_WORKERS=0`)
+"""
+from contextlib import contextmanager, redirect_stdout
+from collections import Counter
+import functools
+import tempfile
+import argparse
+import json
+import time
+import sys
+import io
+
+from benchmarks.fake_linkedin import FakeLinkedin, SESSION_COOKIES, add_server_arguments, server_options
+from config import Config, DevConfig, ProdConfig
+
+BENCHMARK_EMAIL = 'benchmark@example.com'
+# profile of the user the chain runs for(its skills are searched)
+BENCHMARK_PROFILE = 'jane-doe'
+
+
+class StageTimer(object):
+    """Own time & calls of the wrapped functions, per stage"""
+
+    def __init__(self):
+        self.seconds = Counter()
+        self.calls = Counter()
+        # time spent in nested stages, per running stage
+        self.stack = []
+
+    @contextmanager
+    def stage(self, name):
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self.stack.pop()
+            self.seconds[name] += elapsed - nested
+            self.calls[name] += 1
+            if self.stack:
+                self.stack[-1] += elapsed
+
+    def wrap(self, owner, attr, name, static=False):
+        fn = getattr(owner, attr)
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            with self.stage(name):
+                return fn(*args, **kwargs)
+
+        setattr(owner, attr, staticmethod(timed) if static else timed)
+
+    def wrap_generator(self, owner, attr, name):
+        """Time spent producing each item of a generator"""
+        fn = getattr(owner, attr)
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            items = fn(*args, **kwargs)
+            try:
+                while True:
+                    with self.stage(name):
+                        item = next(items, StopIteration)
+                    if item is StopIteration:
+                        return
+                    yield item
+            finally:
+                items.close()
+
+        setattr(owner, attr, timed)
+
+
+def instrument(timer, profile_scraper):
+    """Time the stages of the chain, in the modules the tasks call them from"""
+    import app.tasks
+    import app.utils.parse_util
+    from app.main import Scraper
+
+    timer.wrap(Scraper, 'create_driver', 'start browser', static=True)
+    timer.wrap(Scraper, 'start_session', 'log in')
+    timer.wrap(app.tasks, 'scrape_search_results', 'search pages')
+    timer.wrap(app.tasks, 'save_search_result', 'store search results')
+    timer.wrap_generator(profile_scraper, 'iter_loaded_profiles', 'load profiles')
+    # the http scraper has no html, its profiles come from the api
+    if hasattr(profile_scraper, 'get_profile_html'):
+        timer.wrap(profile_scraper, 'get_profile_html', 'extract profiles')
+    timer.wrap(profile_scraper, 'get_profile', 'extract profiles')
+    timer.wrap(app.utils.parse_util, 'parse_profile', 'parse profiles')
+    timer.wrap(app.tasks, 'save_recommendation', 'store profiles')
+    timer.wrap(profile_scraper, 'scrape_contact_info', 'contact info')
+
+
+def run_chain(server, max_runs):
+    from app.main import Profile
+    from app.models import UserRecommendation
+    from app.service.user_service import save_user, get_current_user_by_id
+    from app.tasks import search_and_store_results, scrape_search_result_profiles
+    from app.extensions import db
+
+    def unscraped():
+        db.session.expire_all()
+        return len(get_current_user_by_id(user_public_id).get_unscraped_results())
+
+    # Profile.to_dict prints when it can't find a current company
+    with redirect_stdout(io.StringIO()):
+        scraped = Profile(server.profile_bodies[BENCHMARK_PROFILE]).to_dict()
+    user_public_id = save_user(scraped, True)
+    user = get_current_user_by_id(user_public_id)
+
+    start = time.perf_counter()
+    search_and_store_results.apply(args=(user_public_id,))
+    search_seconds = time.perf_counter() - start
+    results = unscraped()
+
+    runs = 0
+    start = time.perf_counter()
+    while runs < max_runs:
+        before = unscraped()
+        if not before:
+            break
+        scrape_search_result_profiles.apply(args=(user_public_id,))
+        runs += 1
+        # nothing left that the scraper can load
+        if unscraped() == before:
+            break
+    profiles_seconds = time.perf_counter() - start
+
+    saved = UserRecommendation.query.filter_by(recommended_for_id=user.id).count()
+
+    return {
+        'search_seconds': search_seconds,
+        'search_results': results,
+        'profiles_seconds': profiles_seconds,
+        'profile_runs': runs,
+        'profiles_saved': saved,
+        'profiles_per_min': saved * 60 / profiles_seconds if profiles_seconds else 0,
+    }
+
+
+def report(result, timer, server_stats):
+    print('search: {0} results in {1:.1f}s'.format(
+        result['search_results'], result['search_seconds']))
+    print('profiles: {0} saved in {1:.1f}s over {2} runs, {3:.1f} profiles/min'.format(
+        result['profiles_saved'], result['profiles_seconds'],
+        result['profile_runs'], result['profiles_per_min']))
+
+    total = result['search_seconds'] + result['profiles_seconds']
+    for name, seconds in timer.seconds.most_common():
+        print('  {0:<22} {1:7.2f}s {2:5.1f}%  {3} calls'.format(
+            name, seconds, seconds * 100 / total if total else 0, timer.calls[name]))
+    print('  {0:<22} {1:7.2f}s'.format(
+        'other', total - sum(timer.seconds.values())))
+    print('fake server: ' + ', '.join('{0} {1}'.format(count, kind)
+                                      for kind, count in sorted(server_stats.items())))
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Scraping chain benchmark')
+    arg_parser.add_argument('--scraper', choices=['browser', 'http'], default='browser',
+                            help='Scraper backend of the search & profile tasks')
+    arg_parser.add_argument('--host', default='127.0.0.1',
+                            help='Address the fake server listens on')
+    arg_parser.add_argument('--public-url',
+                            help='Url of the fake server for the scrapers(default: its address)')
+    arg_parser.add_argument('--login', action='store_true',
+                            help='Log in through the login form instead of a saved session')
+    arg_parser.add_argument('--max-runs', type=int, default=5,
+                            help='Profile task runs at most(30 profiles each)')
+    arg_parser.add_argument('--show-browser', action='store_true',
+                            help='Run the browser with a window(dev config)')
+    arg_parser.add_argument('--output', help='Write results to a json file')
+    add_server_arguments(arg_parser)
+    # bounds the search(`MAX_PROFILES_COUNT` would take 100 pages)
+    arg_parser.set_defaults(paywall_after=10)
+    args = arg_parser.parse_args(argv)
+
+    server = FakeLinkedin(host=args.host, unique_profiles=True,
+                          **server_options(args)).start()
+
+    # before the app & utils read them
+    Config.LINKEDIN_URL = args.public_url or server.url
+    Config.LINKEDIN_EMAIL = BENCHMARK_EMAIL
+    Config.LINKEDIN_PASSWORD = 'fake-password'
+    Config.REGISTRATION_SCRAPER = Config.SEARCH_SCRAPER = Config.PROFILES_SCRAPER = args.scraper
+    Config.SESSION_STORE = 'file'
+    Config.SESSION_PATH = tempfile.mkdtemp()
+    # nothing to keep from the fake server
+    Config.HTML_ARCHIVE_PATH = ''
+
+    from app.factory import create_app
+    from app.utils.session_util import save_session
+    from app.service.linkedin_service import get_profile_scraper
+    from app import celery
+
+    flask_app = create_app(DevConfig if args.show_browser else ProdConfig)
+    celery.conf.task_always_eager = True
+    if not args.login or args.scraper == 'http':
+        save_session(BENCHMARK_EMAIL, SESSION_COOKIES)
+
+    timer = StageTimer()
+    with flask_app.app_context():
+        instrument(timer, get_profile_scraper('PROFILES_SCRAPER'))
+        result = run_chain(server, args.max_runs)
+    server.stop()
+
+    result['stages'] = {name: {'seconds': seconds, 'calls': timer.calls[name]}
+                        for name, seconds in timer.seconds.items()}
+    result['fake_server'] = dict(server.stats)
+    report(result, timer, server.stats)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=4, sort_keys=True)
+
+    return 0 if result['profiles_saved'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
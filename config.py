@@ -16,9 +16,93 @@ class Config(object):
     """Celery"""
     CELERY_BACKEND_URL = os.environ.get('CELERY_BACKEND_URL')
     CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL')
+    # message priority(0-9) of the tasks of new signups / of the later searches
+    # & scrapes, kept by the tasks they queue(the lowest goes first with redis)
+    SIGNUP_TASK_PRIORITY = int(os.environ.get('SIGNUP_TASK_PRIORITY', 0))
+    BACKGROUND_TASK_PRIORITY = int(os.environ.get('BACKGROUND_TASK_PRIORITY', 6))
+    # seconds before a profile batch stops & resumes in a retry / is killed(0: no limit)
+    PROFILE_TASK_SOFT_TIME_LIMIT = int(
+        os.environ.get('PROFILE_TASK_SOFT_TIME_LIMIT', 0))
+    PROFILE_TASK_TIME_LIMIT = int(os.environ.get('PROFILE_TASK_TIME_LIMIT', 0))
+    # progress of the profile batches(empty to disable resuming)
+    BATCH_CURSOR_REDIS_URL = os.environ.get(
+        'BATCH_CURSOR_REDIS_URL', os.environ.get('CELERY_BACKEND_URL'))
+    BATCH_CURSOR_TTL = int(os.environ.get('BATCH_CURSOR_TTL', 24 * 3600))
+    # profiles scraped at once in their own tasks across the workers, the
+    # profile task only dispatches them(0: scraped in the profile task itself)
+    PROFILE_FANOUT = int(os.environ.get('PROFILE_FANOUT', 0))
+    # profile scrapes in flight, shared by the workers so a profile found by
+    # several users is scraped once(empty to disable deduplication)
+    SCRAPE_FLIGHT_REDIS_URL = os.environ.get(
+        'SCRAPE_FLIGHT_REDIS_URL', os.environ.get('CELERY_BACKEND_URL'))
+    # seconds a profile scrape is claimed at most / waited for by the others
+    SCRAPE_FLIGHT_TTL = int(os.environ.get('SCRAPE_FLIGHT_TTL', 900))
+    SCRAPE_FLIGHT_WAIT = int(os.environ.get('SCRAPE_FLIGHT_WAIT', 60))
     """Selenium"""
     SELENIUM_MODE = os.environ.get('SELENIUM_MODE')
     SELENIUM_REMOTE_URL = os.environ.get('SELENIUM_REMOTE_URL')
+    # logged in drivers kept per celery worker process(0 starts one per task)
+    DRIVER_POOL_SIZE = int(os.environ.get('DRIVER_POOL_SIZE', 0))
+    # scraping browser profile: no images, media, fonts, extensions...
+    BLOCK_RESOURCES = os.environ.get(
+        'BLOCK_RESOURCES', 'False').lower() == 'true'
+    # browser disk cache kept across sessions(empty to disable)
+    BROWSER_CACHE_PATH = os.environ.get('BROWSER_CACHE_PATH', '')
+    # profiles loaded at once in browser tabs of a scraper
+    PROFILE_TABS = int(os.environ.get('PROFILE_TABS', 1))
+    # search result pages loaded at once(`&page=N`), 1 clicks through them
+    SEARCH_TABS = int(os.environ.get('SEARCH_TABS', 1))
+    # scroll_to_bottom bounds & settle signals(ms)
+    SCROLL_MAX_STEPS = int(os.environ.get('SCROLL_MAX_STEPS', 85))
+    SCROLL_TIMEOUT = float(os.environ.get('SCROLL_TIMEOUT', 30))
+    SCROLL_QUIET_MS = int(os.environ.get('SCROLL_QUIET_MS', 300))
+    SCROLL_STEP_WAIT_MS = int(os.environ.get('SCROLL_STEP_WAIT_MS', 3000))
+    # seconds before a hung page load raises
+    PAGE_LOAD_TIMEOUT = int(os.environ.get('PAGE_LOAD_TIMEOUT', 300))
+    # start a new browser after this many pages / once it uses this much
+    # memory(MB, local drivers only), 0 keeps it
+    DRIVER_MAX_PAGES = int(os.environ.get('DRIVER_MAX_PAGES', 0))
+    DRIVER_MAX_MEMORY_MB = int(os.environ.get('DRIVER_MAX_MEMORY_MB', 0))
+    # saved linkedin session cookies, redis / file(empty to always log in)
+    SESSION_STORE = os.environ.get('SESSION_STORE', '')
+    SESSION_REDIS_URL = os.environ.get(
+        'SESSION_REDIS_URL', os.environ.get('CELERY_BACKEND_URL'))
+    SESSION_PATH = os.environ.get(
+        'SESSION_PATH', os.path.join(APP_ROOT, 'session'))
+    SESSION_TTL = int(os.environ.get('SESSION_TTL', 7 * 24 * 3600))
+    """Scraper backends"""
+    # per task type, browser(selenium) / http(voyager api with the saved
+    # session cookies, no browser)
+    REGISTRATION_SCRAPER = os.environ.get('REGISTRATION_SCRAPER', 'browser')
+    SEARCH_SCRAPER = os.environ.get('SEARCH_SCRAPER', 'browser')
+    PROFILES_SCRAPER = os.environ.get('PROFILES_SCRAPER', 'browser')
+    # base url of the scrapers(a fake server when testing offline)
+    LINKEDIN_URL = os.environ.get('LINKEDIN_URL', 'https://www.linkedin.com')
+    # profiles / result pages fetched at once by the http scrapers
+    HTTP_WORKERS = int(os.environ.get('HTTP_WORKERS', 4))
+    """Parsing"""
+    # html.parser / lxml / lexbor(selectolax)
+    HTML_PARSER = os.environ.get('HTML_PARSER', 'html.parser')
+    # build only the profile sections that are read(beautifulsoup backends)
+    RESTRICTED_PARSE = os.environ.get(
+        'RESTRICTED_PARSE', 'False').lower() == 'true'
+    # parse worker processes per celery worker(0 parses inline)
+    PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', 0))
+    # raw html archive of scraped pages(empty to disable)
+    HTML_ARCHIVE_PATH = os.environ.get(
+        'HTML_ARCHIVE_PATH', os.path.join(APP_ROOT, 'archive'))
+    HTML_ARCHIVE_LEVEL = int(os.environ.get('HTML_ARCHIVE_LEVEL', 10))
+    # strip svg, scripts, json blobs & unused attributes in the browser
+    # before transferring the html(app/utils/prune_util.py)
+    PRUNE_HTML = os.environ.get('PRUNE_HTML', 'False').lower() == 'true'
+    # html: transfer the profile html and parse it here
+    # script: extract the profile in the browser(app/main/scripts/profile.js)
+    # network: build it from the page's own api responses(app/main/JsonProfile.py)
+    PROFILE_EXTRACTION = os.environ.get('PROFILE_EXTRACTION', 'html')
+    # always: read the contact info overlay with the profile
+    # never: skip it(no email, phone or websites)
+    # deferred: skip it, a follow-up task(`scrape_contact_info`) fills it in
+    CONTACT_INFO = os.environ.get('CONTACT_INFO', 'always')
     """Import other env variables here"""
     LINKEDIN_EMAIL = os.environ.get('LINKEDIN_EMAIL')
     LINKEDIN_PASSWORD = os.environ.get('LINKEDIN_PASSWORD')
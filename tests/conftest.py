@@ -0,0 +1,31 @@
+import pytest
+
+from config import Config, DevConfig
+
+
+class TestConfig(DevConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+@pytest.fixture(scope='session')
+def session_app():
+    # tasks run in the app context of the first app created, so only one is
+    from app.factory import create_app
+
+    return create_app(TestConfig)
+
+
+@pytest.fixture
+def flask_app(session_app, monkeypatch):
+    # no redis stores, tasks run in process
+    monkeypatch.setattr(Config, 'BATCH_CURSOR_REDIS_URL', '')
+    monkeypatch.setattr(Config, 'SCRAPE_FLIGHT_REDIS_URL', '')
+
+    from app import celery
+
+    monkeypatch.setitem(celery.conf, 'task_always_eager', True)
+    config = dict(session_app.config)
+    with session_app.app_context():
+        yield session_app
+    session_app.config.clear()
+    session_app.config.update(config)
@@ -0,0 +1,22 @@
+import pytest
+
+from app.utils.archive_util import canonical_url
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.linkedin.com/in/jane-doe/',
+    'https://www.linkedin.com/in/jane-doe',
+    '/in/jane-doe/',
+    # archived once the contact info overlay is open
+    'https://www.linkedin.com/in/jane-doe/detail/contact-info/',
+    '/in/jane-doe?miniProfileUrn=x',
+    '/in/jane-doe/?miniProfileUrn=x#experience',
+    '/in/jane-doe#experience',
+])
+def test_canonical_profile_url(url):
+    assert canonical_url(url) == '/in/jane-doe'
+
+
+def test_canonical_search_url():
+    url = 'https://www.linkedin.com/search/results/people/?keywords=python&page=2'
+    assert canonical_url(url + '#results') == url
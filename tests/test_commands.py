@@ -0,0 +1,58 @@
+from bs4 import BeautifulSoup
+
+import app.commands as commands
+from app.utils.archive_util import HtmlArchive
+from config import Config
+
+FIXTURE = commands.FIXTURES_PATH / 'profiles/jane-doe.html'
+
+
+def without_contact_info(html):
+    """Profile page archived without the contact info overlay(`CONTACT_INFO`)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup.select('.pv-contact-info'):
+        element.decompose()
+    return str(soup)
+
+
+def reparse(flask_app, monkeypatch, tmp_path, html, existing, *args):
+    monkeypatch.setattr(Config, 'HTML_ARCHIVE_PATH', str(tmp_path))
+    HtmlArchive().put('https://www.linkedin.com/in/jane-doe/', 'profile', html)
+
+    saved = []
+    monkeypatch.setattr(commands, 'get_current_user_by_url',
+                        lambda url: existing.get(url))
+    monkeypatch.setattr(commands, 'save_user',
+                        lambda scraped, user=None: saved.append((scraped, user)))
+
+    result = flask_app.test_cli_runner().invoke(
+        args=['archive', 'reparse', '--workers', '0'] + list(args))
+    assert result.exit_code == 0, result.output
+    return result.output, saved
+
+
+def test_reparse_updates_saved_users(flask_app, monkeypatch, tmp_path):
+    user = object()
+    output, saved = reparse(flask_app, monkeypatch, tmp_path,
+                            FIXTURE.read_text(encoding='utf-8'), {'/in/jane-doe-42': user})
+
+    assert [saved_user for _, saved_user in saved] == [user]
+    assert '1 updated' in output
+
+
+def test_reparse_new_only_skips_saved_users(flask_app, monkeypatch, tmp_path):
+    output, saved = reparse(flask_app, monkeypatch, tmp_path,
+                            FIXTURE.read_text(encoding='utf-8'),
+                            {'/in/jane-doe-42': object()}, '--new-only')
+
+    assert saved == []
+    assert '1 existing' in output
+
+
+def test_reparse_without_contact_info_uses_archived_url(flask_app, monkeypatch, tmp_path):
+    html = without_contact_info(FIXTURE.read_text(encoding='utf-8'))
+    output, saved = reparse(flask_app, monkeypatch, tmp_path, html, {})
+
+    assert [scraped["personal_info"]["url"]
+            for scraped, _ in saved] == ['/in/jane-doe']
+    assert '1 saved' in output and '0 invalid' in output
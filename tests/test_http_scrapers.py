@@ -0,0 +1,85 @@
+import pytest
+
+from app.main import Profile, SearchPage, HttpProfileScraper, HttpSearchScraper
+from benchmarks.fake_linkedin import FakeLinkedin, SESSION_COOKIES
+from benchmarks.http_scrape import comparable
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = FakeLinkedin(paywall_after=2).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def fake_linkedin(flask_app, server):
+    flask_app.config['LINKEDIN_URL'] = server.url
+    flask_app.config['CONTACT_INFO'] = 'always'
+    return server
+
+
+@pytest.fixture
+def profile_scraper(fake_linkedin, monkeypatch):
+    scraper = HttpProfileScraper(cookies=SESSION_COOKIES)
+    scraper.fetched = []
+    fetch = scraper.fetch
+
+    def recorded_fetch(path, params=None):
+        scraper.fetched.append(path)
+        return fetch(path, params)
+
+    monkeypatch.setattr(scraper, 'fetch', recorded_fetch)
+    yield scraper
+    scraper.quit()
+
+
+@pytest.mark.parametrize('user', [
+    'https://www.linkedin.com/in/jane-doe/',
+    '/in/jane-doe/?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3Ax',
+    'jane-doe',
+])
+def test_load_profile_page_url_forms(profile_scraper, user):
+    profile_scraper.load_profile_page(user=user)
+
+    assert profile_scraper.fetched[0] == \
+        '/voyager/api/identity/profiles/jane-doe/profileView'
+    assert profile_scraper.get_profile() is not None
+
+
+def test_profile_from_api(profile_scraper, fake_linkedin):
+    scraped = profile_scraper.scrape(user='/in/jane-doe/').to_dict()
+    expected = Profile(fake_linkedin.profile_bodies['jane-doe']).to_dict()
+
+    assert comparable(scraped) == comparable(expected)
+    assert scraped['personal_info']['email'] == 'jane.doe@example.com'
+
+
+def test_contact_info_skipped(profile_scraper, flask_app):
+    flask_app.config['CONTACT_INFO'] = 'deferred'
+    scraped = profile_scraper.scrape(user='/in/jane-doe/').to_dict()
+
+    assert not any(path.endswith('/profileContactInfo') for path in profile_scraper.fetched)
+    assert scraped['personal_info']['email'] is None
+    # the url still comes from the profile
+    assert scraped['personal_info']['url'] == '/in/jane-doe-42'
+
+    personal_info = profile_scraper.scrape_contact_info('/in/jane-doe/')
+    assert personal_info['email'] == 'jane.doe@example.com'
+
+
+def test_rejected_session(fake_linkedin):
+    with HttpProfileScraper(cookies=[]) as scraper:
+        assert scraper.scrape(user='jane-doe') is None
+
+
+def test_search_from_api(fake_linkedin):
+    with HttpSearchScraper(cookies=SESSION_COOKIES) as scraper:
+        scraped = scraper.search(['python', 'developer'])
+
+    # the pages before the search limit(`paywall_after`)
+    expected = []
+    for page in fake_linkedin.search_pages[:2]:
+        expected.extend(SearchPage(page).vanity_urls)
+    assert sorted(scraped['urls']['vanity_urls']) == sorted(set(expected))
+    assert scraped['stats'] == SearchPage(fake_linkedin.search_pages[0]).pages
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from app.main import Profile, JsonProfile
+
+FIXTURES_PATH = Path(__file__).parent.parent / 'fixtures'
+
+
+def voyager_skills(skills):
+    """`featuredSkills` payload of `skills`, in the given order"""
+    included = []
+    for i, skill in enumerate(skills):
+        urn = 'urn:li:fs_skill:(ACoAAB,{0})'.format(i)
+        included.append({
+            '$type': 'com.linkedin.voyager.identity.profile.Skill',
+            'entityUrn': urn,
+            # names as displayed, not trimmed
+            'name': '\n  {0} '.format(skill['name']),
+        })
+        included.append({
+            '$type': 'com.linkedin.voyager.identity.profile.EndorsedSkill',
+            'entityUrn': 'urn:li:fs_endorsedSkill:(ACoAAB,{0})'.format(i),
+            '*skill': urn,
+            'endorsementCount': skill['endorsements'],
+        })
+
+    return {'data': {}, 'included': included}
+
+
+def test_same_top_skills_as_html_profile():
+    html = (FIXTURES_PATH / 'profiles' / 'jane-doe.html').read_text(encoding='utf-8')
+    html_skills = Profile(html).skills
+    assert len(html_skills) >= 4
+
+    # voyager lists them in its own order
+    payloads = {'skills': voyager_skills(sorted(html_skills, key=lambda x: x['name']))}
+    json_skills = JsonProfile(payloads).skills
+
+    assert json_skills == html_skills
+    assert [skill['name'] for skill in json_skills[:4]] == \
+        [skill['name'] for skill in html_skills[:4]]
+
+
+def test_same_certifications_order_as_html_profile():
+    html = (FIXTURES_PATH / 'profiles' / 'jane-doe.html').read_text(encoding='utf-8')
+    html_certifications = Profile(html).experiences['certifications']
+    # one expires, the other doesn't
+    assert len(html_certifications) == 2
+
+    included = [{
+        '$type': 'com.linkedin.voyager.identity.profile.Certification',
+        'entityUrn': 'urn:li:fs_certification:(ACoAAB,1)',
+        'name': 'Machine Learning',
+        'authority': 'Coursera',
+        'timePeriod': {'startDate': {'month': 2, 'year': 2016}},
+    }, {
+        '$type': 'com.linkedin.voyager.identity.profile.Certification',
+        'entityUrn': 'urn:li:fs_certification:(ACoAAB,0)',
+        'name': 'AWS Certified Solutions Architect',
+        'authority': 'Amazon Web Services (AWS)',
+        'timePeriod': {'startDate': {'month': 6, 'year': 2019},
+                       'endDate': {'month': 6, 'year': 2022}},
+    }]
+    profile = JsonProfile({'profile_view': {'data': {}, 'included': included}})
+
+    assert profile.experiences['certifications'] == html_certifications
@@ -0,0 +1,15 @@
+import pytest
+
+from app.utils.scrape_util import normalize_url
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.linkedin.com/in/jane-doe/',
+    '/in/jane-doe',
+    # search results link the profile with a query string
+    '/in/jane-doe?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3Ax',
+    'https://www.linkedin.com/in/jane-doe/detail/contact-info/',
+    '/in/jane-doe/#experience',
+])
+def test_normalize_url(url):
+    assert normalize_url(url) == '/in/jane-doe'
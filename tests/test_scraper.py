@@ -0,0 +1,70 @@
+import sys
+
+import pytest
+
+from app.main import Scraper
+
+scraper_module = sys.modules['app.main.Scraper']
+
+
+class SessionDriver(object):
+    """Driver holding a session cookie, linkedin answering `status` to the api"""
+
+    def __init__(self, status):
+        self.status = status
+        self.current_url = 'http://localhost:8000/feed/'
+        self.cookies = {'li_at': {'value': 'x'}, 'JSESSIONID': {'value': '"ajax:1"'}}
+        self.quit_calls = 0
+
+    def get_cookie(self, name):
+        return self.cookies.get(name)
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_async_script(self, script, *args):
+        return self.status
+
+    def delete_all_cookies(self):
+        self.cookies = {}
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+@pytest.fixture
+def base_url(flask_app):
+    flask_app.config['LINKEDIN_URL'] = 'http://localhost:8000'
+
+
+def logged_in(status):
+    scraper = Scraper.__new__(Scraper)
+    scraper.driver = SessionDriver(status)
+    return scraper.is_logged_in(), scraper.driver
+
+
+def test_accepted_session_is_logged_in(base_url):
+    assert logged_in(200)[0]
+
+
+def test_expired_session_is_not_logged_in(base_url):
+    is_logged_in, driver = logged_in(401)
+
+    assert not is_logged_in
+    # logged in again from scratch
+    assert driver.cookies == {}
+
+
+def test_failed_login_quits_the_driver(base_url, monkeypatch):
+    driver = SessionDriver(401)
+    monkeypatch.setattr(scraper_module, 'get_driver_pool', lambda: None)
+    monkeypatch.setattr(Scraper, 'create_driver', staticmethod(lambda: driver))
+
+    def start_session(self, email, password):
+        raise RuntimeError('login form not found')
+
+    monkeypatch.setattr(Scraper, 'start_session', start_session)
+
+    with pytest.raises(RuntimeError):
+        Scraper()
+    assert driver.quit_calls == 1
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import NoSuchWindowException
+
+from app.main import SearchScraper
+
+PAYWALL_PAGE = 4
+
+
+class FakeDriver(object):
+    """Tabs of search result pages, the paywall shown from `PAYWALL_PAGE` on"""
+
+    def __init__(self, slow_pages=(), closing_pages=()):
+        self.tabs = {'main': None}
+        # result pages closing their own tab
+        self.closing_pages = closing_pages
+        # result pages taking a few polls to load, the paywall shows at once
+        self.polls_left = {page: 5 for page in slow_pages}
+        self.current_window_handle = 'main'
+        self.opened = []
+        self.switch_to = SimpleNamespace(window=self.switch)
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    def switch(self, handle):
+        if handle not in self.tabs:
+            raise NoSuchWindowException('no such window')
+        self.current_window_handle = handle
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def page(self):
+        return int(self.tabs[self.current_window_handle].rsplit('=', 1)[1])
+
+    def execute_script(self, script, *args):
+        if script.startswith('window.open'):
+            handle = 'tab-{0}'.format(len(self.opened))
+            self.tabs[handle] = args[0]
+            self.opened.append(args[0])
+        elif script == SearchScraper.TAB_STATE_SCRIPT:
+            page = self.page()
+            if page in self.closing_pages:
+                self.close()
+                raise NoSuchWindowException('target window already closed')
+            if page >= PAYWALL_PAGE:
+                return 'stop'
+            if self.polls_left.get(page):
+                self.polls_left[page] -= 1
+                return None
+            return 'loaded'
+
+
+@pytest.fixture
+def search_scraper(flask_app, monkeypatch):
+    scraper = SearchScraper.__new__(SearchScraper)
+    scraper.driver = FakeDriver()
+    scraper.timeout = 30
+    scraper.loading_tabs = {}
+    scraper.search_url = '/search/results/people/?keywords=python'
+    monkeypatch.setattr(scraper, 'driver_expired', lambda: False)
+    monkeypatch.setattr(scraper, 'scroll_to_bottom', lambda: None)
+    monkeypatch.setattr(scraper, 'record_page_load', lambda start: None)
+    monkeypatch.setattr(scraper, 'get_snapshot', lambda: SimpleNamespace(
+        vanity_urls=['/in/page-{0}'.format(scraper.driver.page())]))
+
+    return scraper
+
+
+def test_tabs_stop_at_search_limit(search_scraper):
+    urls = search_scraper.get_urls_from_tabs(20, ['/in/page-1'], tabs=2)
+
+    assert sorted(urls) == ['/in/page-1', '/in/page-2', '/in/page-3']
+    assert search_scraper.stopped_at.endswith('page={0}'.format(PAYWALL_PAGE))
+    # no more pages than the tabs open when the limit showed up
+    assert len(search_scraper.driver.opened) <= PAYWALL_PAGE
+    # every tab closed
+    assert search_scraper.driver.window_handles == ['main']
+
+
+def test_tabs_load_earlier_pages_after_search_limit(search_scraper, monkeypatch):
+    # the paywall tab is done before the tab of the page before it
+    search_scraper.driver = FakeDriver(slow_pages=[PAYWALL_PAGE - 1])
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+    urls = search_scraper.get_urls_from_tabs(20, ['/in/page-1'], tabs=3)
+
+    assert sorted(urls) == ['/in/page-1', '/in/page-2', '/in/page-3']
+    assert search_scraper.stopped_at.endswith('page={0}'.format(PAYWALL_PAGE))
+    assert search_scraper.driver.window_handles == ['main']
+
+
+def test_tabs_skip_a_closed_tab(search_scraper):
+    search_scraper.driver = FakeDriver(closing_pages=[2])
+
+    urls = search_scraper.get_urls_from_tabs(20, ['/in/page-1'], tabs=2)
+
+    assert sorted(urls) == ['/in/page-1', '/in/page-3']
+    assert search_scraper.stopped_at.endswith('page={0}'.format(PAYWALL_PAGE))
+    assert search_scraper.driver.window_handles == ['main']
@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import pytest
+
+import app.tasks as tasks
+
+URLS = ['/in/unscrapable-{0}'.format(i) for i in range(5)]
+
+
+class FakeUser(object):
+    id = 1
+
+    def __init__(self, urls):
+        self.results = [SimpleNamespace(search_result=SimpleNamespace(url=url, scraped=False))
+                        for url in urls]
+
+    def get_unscraped_results(self):
+        return [result for result in self.results if not result.search_result.scraped]
+
+
+class UnscrapableScraper(object):
+    """Every profile fails to load"""
+    loads = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def scrape(self, user=None):
+        self.loads.append(user)
+        return None
+
+
+class MemoryCursor(object):
+    """`BatchCursor` with a working store"""
+    handed_out = set()
+    enabled = True
+
+    def __init__(self, name):
+        pass
+
+    def done(self):
+        return set(self.handed_out)
+
+    def claim(self, urls):
+        claimed = [url for url in urls if url not in self.handed_out]
+        self.handed_out.update(claimed)
+        return claimed
+
+    def unclaim(self, urls):
+        self.handed_out.difference_update(urls)
+
+    def clear(self):
+        self.handed_out.clear()
+
+
+class OneInFlight(object):
+    """`ScrapeFlights` with the first profile being scraped for another user"""
+    claims = []
+    waits = []
+
+    def __init__(self, token=None):
+        pass
+
+    def claim(self, url):
+        self.claims.append(url)
+        return url != URLS[0]
+
+    def release(self, url):
+        pass
+
+    def wait(self, urls, timeout=None):
+        self.waits.append(timeout)
+        return []
+
+    def count(self, hits=0, misses=0):
+        pass
+
+
+@pytest.fixture
+def fanout(flask_app, monkeypatch):
+    flask_app.config['PROFILE_FANOUT'] = 2
+    user = FakeUser(URLS)
+    UnscrapableScraper.loads = []
+    monkeypatch.setattr(tasks, 'get_current_user_by_id', lambda public_id: user)
+    monkeypatch.setattr(tasks, 'get_profile_scraper', lambda key: UnscrapableScraper)
+    monkeypatch.setattr(tasks, 'recommend_saved', lambda user, search_result: False)
+    monkeypatch.setattr(tasks, 'defer_contact_info', lambda public_ids: None)
+
+    return user
+
+
+def test_dispatch_needs_cursor_store(fanout):
+    assert tasks.dispatch_profiles(fanout, 'user') == 0
+    assert UnscrapableScraper.loads == []
+
+
+def test_dispatch_stops_when_a_batch_saves_nothing(fanout, monkeypatch):
+    MemoryCursor.handed_out = set()
+    monkeypatch.setattr(tasks, 'BatchCursor', MemoryCursor)
+
+    assert tasks.dispatch_profiles(fanout, 'user') == 2
+    # a single batch, not re-dispatched
+    assert UnscrapableScraper.loads == URLS[:2]
+    # and handed out again by the next run
+    assert MemoryCursor.handed_out == set()
+
+
+def test_in_flight_profiles_are_handed_out_again(fanout, monkeypatch):
+    MemoryCursor.handed_out = set()
+    OneInFlight.claims, OneInFlight.waits = [], []
+    monkeypatch.setattr(tasks, 'BatchCursor', MemoryCursor)
+    monkeypatch.setattr(tasks, 'ScrapeFlights', OneInFlight)
+
+    class ProfileScraper(UnscrapableScraper):
+        def scrape(self, user=None):
+            self.loads.append(user)
+            return SimpleNamespace(to_dict=lambda: {'personal_info': {'url': user}})
+
+    def save_recommendation(user, search_result, scraped):
+        if not scraped:
+            return None
+        search_result.scraped = True
+        return search_result.url
+
+    monkeypatch.setattr(tasks, 'get_profile_scraper', lambda key: ProfileScraper)
+    monkeypatch.setattr(tasks, 'save_recommendation', save_recommendation)
+
+    tasks.dispatch_profiles(fanout, 'user')
+
+    # never waited for, tried again in each batch until one saves nothing
+    assert OneInFlight.waits and set(OneInFlight.waits) == {0}
+    assert UnscrapableScraper.loads == URLS[1:]
+    assert OneInFlight.claims.count(URLS[0]) == len(URLS)
+    assert [result.search_result.url for result in fanout.get_unscraped_results()] == URLS[:1]